@@ -1,37 +1,44 @@
 import os
-import json
+import atexit
+import hashlib
+import queue
+import shutil
 import streamlit as st
 from streamlit_option_menu import option_menu
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import pandas as pd
 
 from services.llm_client import init_client, init_gemini
-from pages.doc_analyzer import page_document_processing
-from pages.intelligence_dashboard import page_intelligence_dashboard
-from pages.table_guide import page_table_guide_builder
-from pages.quality_checker import page_quality_checker
-from pages.length_estimator import page_length_estimator
-from pages.translation_helper import page_translation_helper
-from pages.skip_logic_visualizer import page_skip_logic_visualizer
-from pages.path_simulator import page_path_simulator
-from pages.checklist_generator import page_checklist_generator
-from pages.piping_intelligence import page_piping_intelligence
-from pages.user_guide import page_user_reference
-from models.survey import SurveyDocument
+from models.survey import MSGPACK_AVAILABLE, SurveyDocument
 from ui.download import render_download_buttons
+from ui.nav import NAV_SESSION_KEYS, PAGES, nav_icons, page_handler
 
 # --- 로깅 설정 ---
 LOG_FILE = "access.log"
-if not os.path.exists('output'):
-    os.makedirs('output')
-log_file_path = os.path.join('output', LOG_FILE)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file_path, mode='a', encoding='utf-8'),
-    ]
-)
+OUTPUT_DIR = 'output'
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+log_file_path = os.path.join(OUTPUT_DIR, LOG_FILE)
+
+
+@st.cache_resource(show_spinner=False)
+def _start_log_listener(path: str) -> queue.Queue:
+    """파일 기록 전용 QueueListener를 프로세스당 1회 시작하고 로그 큐를 반환.
+
+    logging.info() 호출은 큐에 넣기만 하고, 실제 디스크 I/O는 백그라운드 스레드가 처리.
+    """
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler(path, mode='a', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return log_queue
+
+
+_queue_handler = QueueHandler(_start_log_listener(log_file_path))
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # 최종 포맷은 FileHandler 담당
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 # --- 페이지 설정 ---
 st.set_page_config(
@@ -50,7 +57,40 @@ init_gemini()  # Vertex AI SDK 초기화 (Gemini 모델 사용)
 # --- User Guide 다이얼로그 ---
 @st.dialog("User Guide", width="large")
 def _show_user_guide():
-    page_user_reference()
+    page_handler("User Guide")()
+
+
+# --- 세션 복원 캐시 ---
+# 이 문항 수를 넘는 세션은 (ormsgpack 설치 시) MessagePack으로 저장
+_MSGPACK_MIN_QUESTIONS = 100
+
+
+def _upload_digest(upload) -> str:
+    """업로드 파일 내용의 SHA-256. 같은 업로드(file_id)에 대해서는 1회만 계산.
+
+    파일명/크기가 아닌 내용 기준이므로, 이름만 같은 다른 파일은 새 파일로,
+    이름만 바뀐 같은 파일은 기존 세션으로 인식된다.
+    """
+    cached = st.session_state.get('_upload_digest')
+    if cached and cached[0] == upload.file_id:
+        return cached[1]
+    with upload.getbuffer() as buf:
+        digest = hashlib.sha256(buf).hexdigest()
+    st.session_state['_upload_digest'] = (upload.file_id, digest)
+    return digest
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _restore_session(content_hash: str, ext: str, _raw) -> tuple[SurveyDocument, pd.DataFrame]:
+    """세션 파일(.json/.msgpack) → (SurveyDocument, DataFrame). 파일 내용 해시 기준으로 캐시.
+
+    `_raw`(업로드 버퍼)는 캐시 키에서 제외되고, 짧은 `content_hash`만 해싱된다.
+    """
+    if ext == '.msgpack':
+        doc = SurveyDocument.from_msgpack_bytes(_raw)
+    else:
+        doc = SurveyDocument.from_json_bytes(_raw)
+    return doc, doc.to_dataframe()
 
 
 @st.dialog("⚠️ Overwrite Session?", width="small")
@@ -69,43 +109,6 @@ def _confirm_overwrite(filename: str, question_count: int):
             st.rerun()
 
 
-# --- 네비게이션 상수 ---
-# 그룹 1: 문항 추출
-# 그룹 2: Table Guide (단독)
-# 그룹 3: 내용 검토 (Quality + Grammar 통합 → Length)
-# 그룹 4: 구조 분석 & 검수 (Skip Logic → Path Simulator → Checklist)
-_PAGES = [
-    "Questionnaire Analyzer",   # 0
-    "Intelligence Dashboard",   # 1  (needs survey_doc)
-    "---",                      # 2
-    "Table Guide Builder",      # 3  (needs edited_df)
-    "---",                      # 4
-    "Quality Checker",          # 5  (needs survey_doc; Grammar 포함)
-    "Length Estimator",         # 6  (needs survey_doc)
-    "Translation Helper",      # 7  (needs survey_doc)
-    "---",                      # 8
-    "Skip Logic",               # 9  (needs survey_doc)
-    "Path Simulator",           # 10 (needs survey_doc)
-    "Checklist",                # 11 (needs survey_doc)
-    "Piping Intelligence",      # 12 (needs survey_doc)
-]
-
-_ICONS_UNLOCKED = [
-    'bi bi-magic',              # 0  Questionnaire Analyzer
-    'bi bi-speedometer2',       # 1  Intelligence Dashboard
-    None,                       # 2  ---
-    'bi bi-table',              # 3  Table Guide Builder
-    None,                       # 4  ---
-    'bi bi-shield-check',       # 5  Quality Checker
-    'bi bi-stopwatch',          # 6  Length Estimator
-    'bi bi-translate',          # 7  Translation Helper
-    None,                       # 8  ---
-    'bi bi-diagram-3',          # 9  Skip Logic
-    'bi bi-signpost-split',     # 10 Path Simulator
-    'bi bi-list-check',         # 11 Checklist
-    'bi bi-arrow-left-right',   # 12 Piping Intelligence
-]
-
 # ============================================================
 # 사이드바
 # ============================================================
@@ -120,13 +123,13 @@ with st.sidebar:
 
     # ── 파일 업로드 (단일: 설문지 + 세션 통합) ──
     raw_upload = st.file_uploader(
-        "Upload file (.pdf / .docx / .json)",
-        type=["pdf", "docx", "json"],
+        "Upload file (.pdf / .docx / .json / .msgpack)",
+        type=["pdf", "docx", "json", "msgpack"],
     )
 
     if raw_upload is not None:
         # ── 세션 덮어쓰기 확인 ──
-        _new_upload_key = f"{raw_upload.name}_{raw_upload.size}"
+        _new_upload_key = _upload_digest(raw_upload)
         _has_existing = 'survey_document' in st.session_state
         _is_same_file = (st.session_state.get('_loaded_session_key') == _new_upload_key)
 
@@ -137,14 +140,15 @@ with st.sidebar:
 
         ext = os.path.splitext(raw_upload.name)[1].lower()
 
-        if ext == '.json':
-            # ── JSON → 세션 복원 (최초 1회만) ──
+        if ext in ('.json', '.msgpack'):
+            # ── JSON/MessagePack → 세션 복원 (최초 1회만) ──
             if st.session_state.get('_loaded_session_key') != _new_upload_key:
                 try:
-                    data = json.loads(raw_upload.getvalue().decode("utf-8"))
-                    doc = SurveyDocument.from_json_dict(data)
+                    # getbuffer(): 업로드 버퍼를 복사하지 않고 파서에 전달
+                    with raw_upload.getbuffer() as buf:
+                        doc, df = _restore_session(_new_upload_key, ext, buf)
                     st.session_state['survey_document'] = doc
-                    st.session_state['edited_df'] = doc.to_dataframe()
+                    st.session_state['edited_df'] = df
                     st.session_state['uploaded_file_name'] = os.path.splitext(doc.filename)[0]
                     st.session_state['_loaded_session_key'] = _new_upload_key
                 except Exception as e:
@@ -154,49 +158,41 @@ with st.sidebar:
             uploaded_file = raw_upload
             st.session_state['uploaded_file_name'] = os.path.splitext(raw_upload.name)[0]
             st.session_state['_loaded_session_key'] = _new_upload_key
-            output_folder = 'output'
-            if not os.path.exists(output_folder):
-                os.makedirs(output_folder)
-            output_path = os.path.join(output_folder, raw_upload.name)
+            output_path = os.path.join(OUTPUT_DIR, raw_upload.name)
+            # 1 MiB 단위로 스트리밍 저장 — 대용량 파일도 메모리 사용량 일정
+            raw_upload.seek(0)
             with open(output_path, 'wb') as f:
-                f.write(raw_upload.getbuffer())
+                shutil.copyfileobj(raw_upload, f, length=1024 * 1024)
+            raw_upload.seek(0)  # 이후 파서(read())가 처음부터 읽도록 위치 복원
 
     # ── 문서 상태 뱃지 + Save Session ──
     if 'survey_document' in st.session_state:
         doc = st.session_state['survey_document']
         st.success(f"**{doc.filename}** — {len(doc.questions)} questions")
+        session_stem = f"{os.path.splitext(doc.filename)[0]}_session"
+        if MSGPACK_AVAILABLE and len(doc.questions) > _MSGPACK_MIN_QUESTIONS:
+            session_data = doc.to_msgpack_bytes()
+            session_name, session_mime = f"{session_stem}.msgpack", 'application/x-msgpack'
+        else:
+            session_data = doc.to_json_bytes()
+            session_name, session_mime = f"{session_stem}.json", 'application/json'
         st.download_button(
             label="Save Session",
-            data=doc.to_json_bytes(),
-            file_name=f"{os.path.splitext(doc.filename)[0]}_session.json",
-            mime='application/json',
+            data=session_data,
+            file_name=session_name,
+            mime=session_mime,
             use_container_width=True,
         )
 
     st.divider()
 
     # ── 네비게이션 메뉴 ──
-    has_edited_df = 'edited_df' in st.session_state
-    has_survey_doc = 'survey_document' in st.session_state
-
-    icons = list(_ICONS_UNLOCKED)
-    if not has_edited_df:
-        icons[3] = 'bi bi-lock'       # Table Guide Builder
-    if not has_survey_doc and not has_edited_df:
-        icons[5] = 'bi bi-lock'       # Quality Checker (어느 한쪽이라도 있으면 탭 일부 사용 가능)
-    if not has_survey_doc:
-        icons[1] = 'bi bi-lock'       # Intelligence Dashboard
-        icons[6] = 'bi bi-lock'       # Length Estimator
-        icons[7] = 'bi bi-lock'       # Translation Helper
-        icons[9] = 'bi bi-lock'       # Skip Logic
-        icons[10] = 'bi bi-lock'      # Path Simulator
-        icons[11] = 'bi bi-lock'      # Checklist
-        icons[12] = 'bi bi-lock'      # Piping Intelligence
+    icons = nav_icons(frozenset(k for k in NAV_SESSION_KEYS if k in st.session_state))
 
     page = option_menu(
         None,
-        _PAGES,
-        icons=icons,
+        PAGES,
+        icons=list(icons),
         default_index=0,
         styles={
             "container": {"padding": "4!important", "background-color": "#fafafa"},
@@ -227,32 +223,7 @@ with st.sidebar:
 # 페이지 라우팅
 # ============================================================
 if page == 'Questionnaire Analyzer':
-    page_document_processing(uploaded_file, client)
+    page_handler(page)(uploaded_file, client)
     render_download_buttons("Questionnaire Analyzer", include_excel=True)
-
-elif page == 'Intelligence Dashboard':
-    page_intelligence_dashboard()
-
-elif page == 'Table Guide Builder':
-    page_table_guide_builder()
-
-elif page == 'Quality Checker':
-    page_quality_checker()
-
-elif page == 'Length Estimator':
-    page_length_estimator()
-
-elif page == 'Translation Helper':
-    page_translation_helper()
-
-elif page == 'Skip Logic':
-    page_skip_logic_visualizer()
-
-elif page == 'Path Simulator':
-    page_path_simulator()
-
-elif page == 'Checklist':
-    page_checklist_generator()
-
-elif page == 'Piping Intelligence':
-    page_piping_intelligence()
+else:
+    page_handler(page)()
@@ -1,8 +1,41 @@
 from dataclasses import dataclass, field
-from typing import ClassVar, List, Optional
+from operator import attrgetter, methodcaller
+from typing import ClassVar, List, Optional, Sequence
 import json
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 stdlib json으로 대체
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # 바이너리 세션(.msgpack)은 ormsgpack 설치 시에만 지원
+    ormsgpack = None
+
+MSGPACK_AVAILABLE = ormsgpack is not None
+
+
+def _dumps_json(obj) -> bytes:
+    """dict → 공백 없는 UTF-8 JSON 바이트 (orjson 우선, 없으면 stdlib json)
+
+    세션 파일은 사람이 편집하지 않으므로 들여쓰기 없이 저장한다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(data):
+    """UTF-8 JSON 바이트(bytes/memoryview) → Python 객체
+
+    orjson은 bytes-like 버퍼를 복사 없이 직접 파싱한다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode("utf-8"))
+
 
 @dataclass
 class AnswerOption:
@@ -107,6 +140,56 @@ class TableGuideDocument:
     language: str = "ko"
 
 
+def _parse_answer_options(raw) -> List[AnswerOption]:
+    """JSON 응답 보기 리스트 → AnswerOption 리스트 ("label" 없는 항목은 무시)"""
+    return [
+        AnswerOption(code=str(o.get("code", "")), label=str(o["label"]))
+        for o in raw
+        if isinstance(o, dict) and "label" in o
+    ]
+
+
+def _parse_skip_logic(raw) -> List[SkipLogic]:
+    """JSON 스킵 로직 리스트 → SkipLogic 리스트 ("condition" 없는 항목은 무시)"""
+    return [
+        SkipLogic(condition=str(s["condition"]), target=str(s.get("target", "")))
+        for s in raw
+        if isinstance(s, dict) and "condition" in s
+    ]
+
+
+def _or_empty(attr: str):
+    """None일 수 있는 필드를 ""로 치환해 반환하는 추출기"""
+    get = attrgetter(attr)
+    return lambda q: get(q) or ""
+
+
+# DataFrame 컬럼명 → SurveyQuestion 값 추출기 (to_dict / to_dataframe 공용)
+_DATAFRAME_COLUMNS = (
+    ("QuestionNumber", attrgetter("question_number")),
+    ("TableNumber", attrgetter("table_number")),
+    ("QuestionText", attrgetter("question_text")),
+    ("QuestionType", _or_empty("question_type")),
+    ("AnswerOptions", methodcaller("answer_options_compact")),
+    ("SkipLogic", methodcaller("skip_logic_display")),
+    ("Filter", _or_empty("filter_condition")),
+    ("Instructions", _or_empty("instructions")),
+    ("SummaryType", attrgetter("summary_type")),
+    ("TableTitle", attrgetter("table_title")),
+    ("GrammarChecker", attrgetter("grammar_checked")),
+    ("NetRecode", attrgetter("net_recode")),
+    ("Sort", attrgetter("sort_order")),
+    ("SubBanner", attrgetter("sub_banner")),
+    ("BannerIDs", attrgetter("banner_ids")),
+    ("SpecialInstructions", attrgetter("special_instructions")),
+    ("Role", attrgetter("role")),
+    ("VariableType", attrgetter("variable_type")),
+)
+
+_EMPTY_DATAFRAME = pd.DataFrame(columns=[col for col, _ in _DATAFRAME_COLUMNS])
+_DATAFRAME_GETTERS = dict(_DATAFRAME_COLUMNS)
+
+
 @dataclass
 class SurveyQuestion:
     """설문 문항 전체 정보"""
@@ -166,26 +249,7 @@ class SurveyQuestion:
 
     def to_dict(self) -> dict:
         """DataFrame 변환용 딕셔너리"""
-        return {
-            "QuestionNumber": self.question_number,
-            "TableNumber": self.table_number,
-            "QuestionText": self.question_text,
-            "QuestionType": self.question_type or "",
-            "AnswerOptions": self.answer_options_compact(),
-            "SkipLogic": self.skip_logic_display(),
-            "Filter": self.filter_condition or "",
-            "Instructions": self.instructions or "",
-            "SummaryType": self.summary_type,
-            "TableTitle": self.table_title,
-            "GrammarChecker": self.grammar_checked,
-            "NetRecode": self.net_recode,
-            "Sort": self.sort_order,
-            "SubBanner": self.sub_banner,
-            "BannerIDs": self.banner_ids,
-            "SpecialInstructions": self.special_instructions,
-            "Role": self.role,
-            "VariableType": self.variable_type,
-        }
+        return {col: get(self) for col, get in _DATAFRAME_COLUMNS}
 
     def to_json_dict(self) -> dict:
         """세션 저장용 JSON 딕셔너리 (모든 필드 포함, 무손실)"""
@@ -219,56 +283,42 @@ class SurveyQuestion:
     @classmethod
     def from_json_dict(cls, d: dict) -> 'SurveyQuestion':
         """세션 JSON에서 SurveyQuestion 복원 (후처리 필드 포함)"""
+        get = d.get
         return cls(
-            question_number=d.get("question_number", ""),
-            question_text=d.get("question_text", ""),
-            question_type=d.get("question_type"),
-            answer_options=[
-                AnswerOption(code=str(o.get("code", "")), label=str(o.get("label", "")))
-                for o in d.get("answer_options", [])
-                if isinstance(o, dict) and "label" in o
-            ],
-            skip_logic=[
-                SkipLogic(condition=str(s.get("condition", "")), target=str(s.get("target", "")))
-                for s in d.get("skip_logic", [])
-                if isinstance(s, dict) and "condition" in s
-            ],
-            filter_condition=d.get("filter_condition"),
-            instructions=d.get("instructions"),
-            summary_type=d.get("summary_type", ""),
-            table_number=d.get("table_number", ""),
-            table_title=d.get("table_title", ""),
-            grammar_checked=d.get("grammar_checked", ""),
-            net_recode=d.get("net_recode", ""),
-            sort_order=d.get("sort_order", ""),
-            sub_banner=d.get("sub_banner", ""),
-            banner_ids=d.get("banner_ids", ""),
-            special_instructions=d.get("special_instructions", ""),
-            role=d.get("role", ""),
-            variable_type=d.get("variable_type", ""),
-            analytical_value=d.get("analytical_value", ""),
-            section=d.get("section", ""),
+            question_number=get("question_number", ""),
+            question_text=get("question_text", ""),
+            question_type=get("question_type"),
+            answer_options=_parse_answer_options(get("answer_options", ())),
+            skip_logic=_parse_skip_logic(get("skip_logic", ())),
+            filter_condition=get("filter_condition"),
+            instructions=get("instructions"),
+            summary_type=get("summary_type", ""),
+            table_number=get("table_number", ""),
+            table_title=get("table_title", ""),
+            grammar_checked=get("grammar_checked", ""),
+            net_recode=get("net_recode", ""),
+            sort_order=get("sort_order", ""),
+            sub_banner=get("sub_banner", ""),
+            banner_ids=get("banner_ids", ""),
+            special_instructions=get("special_instructions", ""),
+            role=get("role", ""),
+            variable_type=get("variable_type", ""),
+            analytical_value=get("analytical_value", ""),
+            section=get("section", ""),
         )
 
     @classmethod
     def from_llm_dict(cls, d: dict) -> 'SurveyQuestion':
         """LLM 추출 JSON에서 SurveyQuestion 생성"""
+        get = d.get
         return cls(
-            question_number=d.get("question_number", ""),
-            question_text=d.get("question_text", ""),
-            question_type=d.get("question_type"),
-            answer_options=[
-                AnswerOption(code=str(o.get("code", "")), label=str(o.get("label", "")))
-                for o in d.get("answer_options", [])
-                if isinstance(o, dict) and "label" in o
-            ],
-            skip_logic=[
-                SkipLogic(condition=str(s.get("condition", "")), target=str(s.get("target", "")))
-                for s in d.get("skip_logic", [])
-                if isinstance(s, dict) and "condition" in s
-            ],
-            filter_condition=d.get("filter"),
-            instructions=d.get("instructions"),
+            question_number=get("question_number", ""),
+            question_text=get("question_text", ""),
+            question_type=get("question_type"),
+            answer_options=_parse_answer_options(get("answer_options", ())),
+            skip_logic=_parse_skip_logic(get("skip_logic", ())),
+            filter_condition=get("filter"),
+            instructions=get("instructions"),
         )
 
 
@@ -293,17 +343,26 @@ class SurveyDocument:
             return self._FIELD_DEFAULTS[name]
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """기존 edited_df와 호환되는 DataFrame 생성"""
+    def to_dataframe(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """기존 edited_df와 호환되는 DataFrame 생성
+
+        Args:
+            columns: 생성할 컬럼 (지정 순서 유지, 알 수 없는 이름은 무시).
+                None이면 전체 컬럼. 일부만 표시하는 화면은 필요한 컬럼만 계산.
+        """
+        if columns is None:
+            getters = _DATAFRAME_COLUMNS
+        else:
+            getters = [(col, _DATAFRAME_GETTERS[col]) for col in columns
+                       if col in _DATAFRAME_GETTERS]
         if not self.questions:
-            return pd.DataFrame(columns=[
-                "QuestionNumber", "TableNumber", "QuestionText", "QuestionType",
-                "AnswerOptions", "SkipLogic", "Filter",
-                "Instructions", "SummaryType", "TableTitle", "GrammarChecker",
-                "NetRecode", "Sort", "SubBanner", "BannerIDs",
-                "SpecialInstructions", "Role", "VariableType",
-            ])
-        return pd.DataFrame([q.to_dict() for q in self.questions])
+            if columns is not None:
+                return pd.DataFrame(columns=[col for col, _ in getters])
+            # 빈 프레임은 모듈 수준 템플릿의 얕은 복사본 반환 (호출측 수정이 템플릿에 영향 없음)
+            return _EMPTY_DATAFRAME.copy(deep=False)
+        # 행(dict) 단위가 아닌 컬럼(list) 단위로 구성 — pandas 컬럼 생성 fast path
+        qs = self.questions
+        return pd.DataFrame({col: list(map(get, qs)) for col, get in getters})
 
     def to_json_dict(self) -> dict:
         """세션 저장용 JSON 딕셔너리"""
@@ -322,7 +381,25 @@ class SurveyDocument:
 
     def to_json_bytes(self) -> bytes:
         """세션 저장용 JSON 바이트"""
-        return json.dumps(self.to_json_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+        return _dumps_json(self.to_json_dict())
+
+    def to_msgpack_bytes(self) -> bytes:
+        """세션 저장용 MessagePack 바이트 (대용량 세션용 바이너리 포맷)"""
+        if ormsgpack is None:
+            raise RuntimeError("MessagePack session format requires the 'ormsgpack' package")
+        return ormsgpack.packb(self.to_json_dict(), option=ormsgpack.OPT_NON_STR_KEYS)
+
+    @classmethod
+    def from_msgpack_bytes(cls, data) -> 'SurveyDocument':
+        """세션 MessagePack 바이트(bytes/memoryview)에서 SurveyDocument 복원"""
+        if ormsgpack is None:
+            raise RuntimeError("MessagePack session format requires the 'ormsgpack' package")
+        return cls.from_json_dict(ormsgpack.unpackb(data))
+
+    @classmethod
+    def from_json_bytes(cls, data) -> 'SurveyDocument':
+        """세션 JSON 바이트(bytes/memoryview)에서 SurveyDocument 복원"""
+        return cls.from_json_dict(_loads_json(data))
 
     @classmethod
     def from_json_dict(cls, d: dict) -> 'SurveyDocument':
@@ -4,11 +4,11 @@
 알고리즘 검사(즉시) + LLM 검사(배치 처리).
 """
 
-import io
 import pandas as pd
 import streamlit as st
 
 from services.llm_client import MODEL_CHECKLIST_GENERATOR
+from ui.download import render_excel_export
 from services.checklist_generator import (
     generate_checklist,
     ChecklistResult,
@@ -125,11 +125,8 @@ def page_checklist_generator():
 
     st.divider()
 
-    # Filters
-    filtered_items = _render_filters(result, lang)
-
-    # Detail table
-    _render_detail_table(filtered_items, lang)
+    # Filters + Detail table (fragment: 필터 변경 시 이 영역만 rerun)
+    _render_filtered_table(result, lang)
 
     # Excel download
     _render_download(result)
@@ -187,6 +184,13 @@ def _render_category_chart(result: ChecklistResult, lang: str):
         st.caption("No items to display.")
 
 
+@st.fragment
+def _render_filtered_table(result: ChecklistResult, lang: str):
+    """필터 UI + 상세 테이블. 필터 위젯 변경은 페이지 전체가 아닌 이 fragment만 rerun."""
+    filtered_items = _render_filters(result, lang)
+    _render_detail_table(filtered_items, lang)
+
+
 def _render_filters(result: ChecklistResult, lang: str) -> List[ChecklistItem]:
     """필터 UI + 필터 적용."""
     cat_labels = CATEGORY_LABELS.get(lang, CATEGORY_LABELS["en"])
@@ -203,8 +207,7 @@ def _render_filters(result: ChecklistResult, lang: str) -> List[ChecklistItem]:
         )
     with col2:
         # 실제 존재하는 카테고리만 표시
-        existing_cats = [cat for cat in CATEGORIES
-                         if any(i.category == cat for i in result.items)]
+        existing_cats = result.present_categories
         selected_categories = st.multiselect(
             "Filter by Category",
             options=existing_cats,
@@ -220,6 +223,24 @@ def _render_filters(result: ChecklistResult, lang: str) -> List[ChecklistItem]:
     return filtered
 
 
+def _build_items_frame(items: List[ChecklistItem], lang: str,
+                       question_col: str = "Q#") -> pd.DataFrame:
+    """체크리스트 항목 → DataFrame (컬럼 단위 구성, 상세 테이블/Excel 공용)."""
+    cat_labels = CATEGORY_LABELS.get(lang, CATEGORY_LABELS["en"])
+    pri_labels = PRIORITY_LABELS.get(lang, PRIORITY_LABELS["en"])
+
+    return pd.DataFrame({
+        "#": [i.item_id for i in items],
+        "Category": [cat_labels.get(i.category, i.category) for i in items],
+        "Priority": [pri_labels.get(i.priority, i.priority) for i in items],
+        question_col: [i.question_number for i in items],
+        "Title": [i.title for i in items],
+        "Detail": [i.detail for i in items],
+        "Expected Behavior": [i.expected_behavior for i in items],
+        "Source": [i.source for i in items],
+    })
+
+
 def _render_detail_table(items: List[ChecklistItem], lang: str):
     """체크리스트 상세 테이블."""
     st.subheader(f"Checklist Items ({len(items)})")
@@ -228,23 +249,7 @@ def _render_detail_table(items: List[ChecklistItem], lang: str):
         st.info("No items match the current filters.")
         return
 
-    cat_labels = CATEGORY_LABELS.get(lang, CATEGORY_LABELS["en"])
-    pri_labels = PRIORITY_LABELS.get(lang, PRIORITY_LABELS["en"])
-
-    rows = []
-    for item in items:
-        rows.append({
-            "#": item.item_id,
-            "Category": cat_labels.get(item.category, item.category),
-            "Priority": pri_labels.get(item.priority, item.priority),
-            "Q#": item.question_number,
-            "Title": item.title,
-            "Detail": item.detail,
-            "Expected Behavior": item.expected_behavior,
-            "Source": item.source,
-        })
-
-    df = pd.DataFrame(rows)
+    df = _build_items_frame(items, lang)
     st.dataframe(
         df,
         use_container_width=True,
@@ -264,30 +269,9 @@ def _render_detail_table(items: List[ChecklistItem], lang: str):
 
 def _render_download(result: ChecklistResult):
     """Excel 다운로드."""
-    cat_labels = CATEGORY_LABELS.get(result.language, CATEGORY_LABELS["en"])
-    pri_labels = PRIORITY_LABELS.get(result.language, PRIORITY_LABELS["en"])
-
-    rows = []
-    for item in result.items:
-        rows.append({
-            "#": item.item_id,
-            "Category": cat_labels.get(item.category, item.category),
-            "Priority": pri_labels.get(item.priority, item.priority),
-            "Question": item.question_number,
-            "Title": item.title,
-            "Detail": item.detail,
-            "Expected Behavior": item.expected_behavior,
-            "Source": item.source,
-        })
-
-    df = pd.DataFrame(rows)
-    buffer = io.BytesIO()
-    df.to_excel(buffer, index=False, sheet_name="Checklist")
-    buffer.seek(0)
-
-    st.download_button(
-        label="Download Checklist (Excel)",
-        data=buffer,
-        file_name="link_test_checklist.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    df = _build_items_frame(result.items, result.language, question_col="Question")
+
+    render_excel_export(
+        df, "Checklist", "link_test_checklist.xlsx",
+        label="Download Checklist (Excel)", source=result, key="checklist_xlsx",
     )
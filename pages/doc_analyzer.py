@@ -1,16 +1,18 @@
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Tuple
 
 import streamlit as st
-from services.pdf_parser import read_pdf
 from services.llm_client import MODEL_DOC_ANALYZER
 from services.postprocessor import apply_postprocessing
-from services.docx_parser import parse_docx
+from services.parse_cache import load_docx_sections, load_pdf_chunks
 from services.docx_renderer import render_sections_to_annotated_text
-from services.chunker import chunk_sections, chunk_text
+from services.chunker import chunk_sections
 from services.llm_extractor import extract_survey_questions
+from services.llm_cache import get_or_compute
 from models.survey import SurveyDocument, SurveyQuestion
-from services.table_guide_service import analyze_survey_intelligence
+from services.table_guide_service import analyze_survey_intelligence, intelligence_fingerprint
 from services.survey_context import enrich_document
 from ui.tree_view import render_tree_view
 from ui.spreadsheet import render_spreadsheet_view
@@ -43,6 +45,88 @@ def page_document_processing(uploaded_file, client):
             st.error("Unsupported file type. Please upload a .pdf or .docx file.")
 
 
+# 청크 진행 로그/라벨 UI 갱신 최소 간격 (초) — websocket 왕복 횟수 절감
+_UI_FLUSH_INTERVAL = 0.25
+
+# 추출 중 부분 결과 미리보기 표 높이 (px)
+_PREVIEW_HEIGHT = 240
+
+
+def _fmt_mmss(seconds: float) -> str:
+    """경과/남은 시간(초) → "m:ss" 표기"""
+    m, sec = divmod(int(seconds), 60)
+    return f"{m}:{sec:02d}"
+
+
+def _preview_rows(questions: list) -> list:
+    """청크 추출 결과(dict)를 미리보기 표 행으로 변환"""
+    return [
+        {
+            "Q#": q.get("question_number", ""),
+            "Type": q.get("question_type") or "",
+            "Question": (q.get("question_text") or "")[:80],
+        }
+        for q in questions
+    ]
+
+
+def _extract_with_cache(client, chunks: list, model: str, on_progress,
+                        refresh: bool) -> Tuple[list, bool, list]:
+    """디스크 캐시를 거치는 문항 추출 → (문항, 캐시 적중 여부, 실패 청크 인덱스).
+
+    일부 청크가 실패한 결과는 캐시하지 않아 다음 추출에서 다시 시도된다.
+    """
+    failed_chunks: list = []
+
+    def _extract():
+        qs = extract_survey_questions(
+            client=client,
+            chunks=chunks,
+            model=model,
+            progress_callback=on_progress,
+            failed_chunks=failed_chunks,
+        )
+        return qs, not failed_chunks
+
+    questions, cache_hit = get_or_compute(chunks, model, _extract, refresh=refresh)
+    return questions, cache_hit, failed_chunks
+
+
+# Phase 5 enrichment 백그라운드 실행용 (세션 간 공유, LLM I/O 대기 위주)
+_ENRICH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="enrich")
+
+
+def _start_enrichment(questions, client_brand: str,
+                      study_objective: str) -> Tuple[Future, str, bool]:
+    """Survey Intelligence 분석을 백그라운드 스레드에서 시작.
+
+    analyze_survey_intelligence는 문항번호/텍스트/유형/보기/필터만 읽고,
+    apply_postprocessing은 table_number/summary_type만 쓰므로 동시 실행해도 안전하다.
+    직전 분석과 입력(Study Brief + 문항 요약)이 같으면 LLM 호출 없이 이전 결과를 반환.
+
+    Returns:
+        (결과 Future, 입력 fingerprint, 재사용 여부)
+    """
+    fingerprint = intelligence_fingerprint(
+        questions, language="en",
+        client_brand=client_brand,
+        study_objective=study_objective,
+    )
+    memo = st.session_state.get('_enrich_memo')
+    if memo and memo[0] == fingerprint:
+        future = Future()
+        future.set_result(memo[1])
+        return future, fingerprint, True
+
+    future = _ENRICH_EXECUTOR.submit(
+        analyze_survey_intelligence,
+        questions, language="en",
+        client_brand=client_brand,
+        study_objective=study_objective,
+    )
+    return future, fingerprint, False
+
+
 def _process_pdf(uploaded_file, client):
     """PDF AI 추출 파이프라인 (DOCX와 동일한 LLM 경로)"""
 
@@ -70,6 +154,12 @@ def _process_pdf(uploaded_file, client):
 
     # 추출 버튼
     extract_button = st.button('Extract Questions with AI', key='extract_pdf_button', use_container_width=True)
+    force_extract = st.checkbox(
+        "Force re-extract",
+        value=False,
+        help="Ignore the cached extraction for this document and call the LLM again.",
+        key="pdf_force_extract",
+    )
 
     # 이전 결과가 있으면 표시
     if 'survey_document' in st.session_state and not extract_button:
@@ -86,32 +176,30 @@ def _process_pdf(uploaded_file, client):
     with st.status("Phase 1/5: Parsing PDF...", expanded=True) as status:
         # Phase 1: PDF 파싱
         status.write("Extracting text from PDF pages...")
-        texts = read_pdf(uploaded_file)
+        # 페이지 스트리밍 파싱 + 청킹 (같은 파일 재실행 시 캐시)
+        chunks, total_pages, total_chars = load_pdf_chunks(uploaded_file)
 
-        if not texts:
+        if not chunks:
             status.update(label="Failed to extract text from PDF.", state="error")
             st.warning("Could not extract text from PDF.")
             return
 
-        total_pages = len(texts)
-        total_chars = sum(len(t) for t in texts)
         status.write(f"Parsed: {total_pages} pages, {total_chars:,} characters")
-
-        # 텍스트 청킹
-        chunks = chunk_text(texts)
         status.write(f"Split into {len(chunks)} chunk(s) for AI processing")
 
         # Phase 3 준비: LLM 추출
         progress_bar = status.progress(0.0)
         stats_line = status.empty()
+        preview = status.empty()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         chunks_done = [0]
+        pending_lines = []  # 아직 화면에 쓰지 않은 청크 완료 로그
+        last_flush = [0.0]  # 마지막 UI 갱신 시각 (monotonic)
+        preview_rows = []  # 병합 전 부분 결과 미리보기
         total_questions_found = [0]
 
         def on_progress(event, data):
-            elapsed = time.time() - start_time
-
             if event == "regex_done":
                 status.update(label="Phase 2/5: Scanning for question patterns...")
                 status.write(f"Quick scan found ~{data['total_hints']} potential questions")
@@ -123,6 +211,9 @@ def _process_pdf(uploaded_file, client):
                 )
 
             elif event == "chunk_start":
+                # 병렬 시작 알림은 한꺼번에 오므로 첫 알림만 반영 (동일 라벨 반복 전송 방지)
+                if data['chunk_index'] > 0:
+                    return
                 total = data['total_chunks']
                 status.update(
                     label=f"Phase 3/5: Extracting questions with AI... "
@@ -139,42 +230,61 @@ def _process_pdf(uploaded_file, client):
                 total = data['total_chunks']
                 progress_bar.progress(done / total)
 
-                e_m, e_s = divmod(int(elapsed), 60)
-                status.write(
+                now = time.monotonic()
+                elapsed = now - start_time
+                elapsed_str = _fmt_mmss(elapsed)
+                pending_lines.append(
                     f"Chunk {data['chunk_index'] + 1}/{total}: "
-                    f"{extracted} questions ({e_m}:{e_s:02d})"
+                    f"{extracted} questions ({elapsed_str})"
                 )
 
+                preview_rows.extend(_preview_rows(data.get('questions', [])))
+
+                # 텍스트 갱신은 _UI_FLUSH_INTERVAL마다 한 번으로 묶음 (마지막 청크는 즉시)
+                if done < total and now - last_flush[0] < _UI_FLUSH_INTERVAL:
+                    return
+                last_flush[0] = now
+
+                status.write("  \n".join(pending_lines))
+                pending_lines.clear()
+                if done < total and preview_rows:
+                    preview.dataframe(preview_rows, hide_index=True, height=_PREVIEW_HEIGHT)
                 status.update(
                     label=f"Phase 3/5: Extracting questions with AI... "
                           f"(Chunk {done}/{total} done)"
                 )
 
                 remaining = (elapsed / done * (total - done)) if done > 0 else 0
-                remain_m, remain_s = divmod(int(remaining), 60)
-                stats_line.write(
+                stats_line.markdown(
                     f"**{total_questions_found[0]}** questions found so far "
-                    f"| Elapsed: {e_m}:{e_s:02d} "
-                    f"| Remaining: ~{remain_m}:{remain_s:02d}"
+                    f"| Elapsed: {elapsed_str} "
+                    f"| Remaining: ~{_fmt_mmss(remaining)}"
                 )
 
             elif event == "merge_done":
                 progress_bar.progress(1.0)
-                stats_line.write(
+                preview.empty()  # 최종 결과는 아래 스프레드시트로 표시
+                stats_line.markdown(
                     f"**{data['total_questions']}** questions extracted in total"
                 )
 
-        questions = extract_survey_questions(
-            client=client,
-            chunks=chunks,
-            model=model,
-            progress_callback=on_progress,
+        # 동일 문서·모델이면 디스크 캐시에서 즉시 복원 (LLM 호출 생략)
+        questions, cache_hit, failed_chunks = _extract_with_cache(
+            client, chunks, model, on_progress, refresh=force_extract,
         )
+        st.session_state['cache_hit'] = cache_hit
+        if cache_hit:
+            progress_bar.progress(1.0)
+            status.write(f"Restored {len(questions)} questions from extraction cache")
+        elif failed_chunks:
+            status.write(
+                f"{len(failed_chunks)} chunk(s) failed — result not cached; "
+                "extract again to retry"
+            )
 
-        elapsed_total = time.time() - start_time
-        em, es = divmod(int(elapsed_total), 60)
+        elapsed_total = _fmt_mmss(time.monotonic() - start_time)
         status.update(
-            label=f"Phase 4/5: Finalizing — {len(questions)} questions in {em}:{es:02d}",
+            label=f"Phase 4/5: Finalizing — {len(questions)} questions in {elapsed_total}",
             state="running", expanded=True,
         )
 
@@ -192,17 +302,21 @@ def _process_pdf(uploaded_file, client):
         study_objective=study_objective,
     )
 
+    # Phase 5 LLM 호출을 먼저 시작하고, 그 동안 후처리 진행
+    enrich_future, enrich_key, enrich_reused = _start_enrichment(
+        questions, client_brand, study_objective)
+
     # 후처리: SummaryType, TableNumber 계산
     apply_postprocessing(survey_doc)
 
     # ── Phase 5: Survey Enrichment ──
     with st.status("Phase 5/5: Enriching survey intelligence...", expanded=True) as enrich_status:
         try:
-            intelligence = analyze_survey_intelligence(
-                questions, language="en",
-                client_brand=client_brand,
-                study_objective=study_objective,
-            )
+            intelligence = enrich_future.result()
+            if enrich_reused:
+                enrich_status.write("Study Brief and questions unchanged — reused previous analysis")
+            elif intelligence.get("study_type"):  # 실패 시 fallback 결과는 재사용하지 않음
+                st.session_state['_enrich_memo'] = (enrich_key, intelligence)
             enrich_document(survey_doc, intelligence)
             obj_count = len(intelligence.get("research_objectives", []))
             seg_count = len(intelligence.get("key_segments", []))
@@ -214,9 +328,8 @@ def _process_pdf(uploaded_file, client):
         except Exception as e:
             enrich_status.update(label=f"Phase 5/5: Enrichment skipped ({e})", state="error")
 
-    # 세션 상태 저장
+    # 세션 상태 저장 (edited_df는 아래 _display_docx_results의 스프레드시트가 설정)
     st.session_state['survey_document'] = survey_doc
-    st.session_state['edited_df'] = survey_doc.to_dataframe()
 
     st.success(f"Successfully extracted **{len(questions)}** questions from the PDF!", icon="✅")
 
@@ -274,6 +387,12 @@ def _process_docx(uploaded_file, client):
 
     # 추출 버튼
     extract_button = st.button('Extract Questions with AI', key='extract_docx_button', use_container_width=True)
+    force_extract = st.checkbox(
+        "Force re-extract",
+        value=False,
+        help="Ignore the cached extraction for this document and call the LLM again.",
+        key="docx_force_extract",
+    )
 
     # 이전 결과가 있으면 표시
     if 'survey_document' in st.session_state and not extract_button:
@@ -291,7 +410,7 @@ def _process_docx(uploaded_file, client):
         # Phase 1: DOCX 파싱
         status.write("Parsing DOCX structure (styles, lists, tables)...")
         try:
-            sections = parse_docx(uploaded_file)
+            sections = load_docx_sections(uploaded_file)
         except Exception as e:
             status.update(label="Failed to parse DOCX file.", state="error")
             st.error(f"Error parsing DOCX: {e}")
@@ -315,14 +434,16 @@ def _process_docx(uploaded_file, client):
         # 동적 업데이트용 컨테이너
         progress_bar = status.progress(0.0)
         stats_line = status.empty()
+        preview = status.empty()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         chunks_done = [0]  # mutable for closure
+        pending_lines = []  # 아직 화면에 쓰지 않은 청크 완료 로그
+        last_flush = [0.0]  # 마지막 UI 갱신 시각 (monotonic)
+        preview_rows = []  # 병합 전 부분 결과 미리보기
         total_questions_found = [0]  # 누적 문항 수
 
         def on_progress(event, data):
-            elapsed = time.time() - start_time
-
             if event == "regex_done":
                 status.update(label="Phase 2/5: Scanning for question patterns...")
                 status.write(f"✅ Quick scan found ~{data['total_hints']} potential questions")
@@ -334,6 +455,9 @@ def _process_docx(uploaded_file, client):
                 )
 
             elif event == "chunk_start":
+                # 병렬 시작 알림은 한꺼번에 오므로 첫 알림만 반영 (동일 라벨 반복 전송 방지)
+                if data['chunk_index'] > 0:
+                    return
                 total = data['total_chunks']
                 status.update(
                     label=f"Phase 3/5: Extracting questions with AI... "
@@ -351,13 +475,25 @@ def _process_docx(uploaded_file, client):
                 progress_bar.progress(done / total)
 
                 # 청크별 완료 로그
-                e_m, e_s = divmod(int(elapsed), 60)
-                status.write(
+                now = time.monotonic()
+                elapsed = now - start_time
+                elapsed_str = _fmt_mmss(elapsed)
+                pending_lines.append(
                     f"✅ Chunk {data['chunk_index'] + 1}/{total}: "
-                    f"{extracted} questions ({e_m}:{e_s:02d})"
+                    f"{extracted} questions ({elapsed_str})"
                 )
 
-                # Phase label 업데이트
+                preview_rows.extend(_preview_rows(data.get('questions', [])))
+
+                # 텍스트 갱신은 _UI_FLUSH_INTERVAL마다 한 번으로 묶음 (마지막 청크는 즉시)
+                if done < total and now - last_flush[0] < _UI_FLUSH_INTERVAL:
+                    return
+                last_flush[0] = now
+
+                status.write("  \n".join(pending_lines))
+                pending_lines.clear()
+                if done < total and preview_rows:
+                    preview.dataframe(preview_rows, hide_index=True, height=_PREVIEW_HEIGHT)
                 status.update(
                     label=f"Phase 3/5: Extracting questions with AI... "
                           f"(Chunk {done}/{total} done)"
@@ -365,30 +501,36 @@ def _process_docx(uploaded_file, client):
 
                 # ETA + 누적 통계 한 줄 요약
                 remaining = (elapsed / done * (total - done)) if done > 0 else 0
-                remain_m, remain_s = divmod(int(remaining), 60)
-                stats_line.write(
+                stats_line.markdown(
                     f"📊 **{total_questions_found[0]}** questions found so far "
-                    f"| ⏱ Elapsed: {e_m}:{e_s:02d} "
-                    f"| Remaining: ~{remain_m}:{remain_s:02d}"
+                    f"| ⏱ Elapsed: {elapsed_str} "
+                    f"| Remaining: ~{_fmt_mmss(remaining)}"
                 )
 
             elif event == "merge_done":
                 progress_bar.progress(1.0)
-                stats_line.write(
+                preview.empty()  # 최종 결과는 아래 스프레드시트로 표시
+                stats_line.markdown(
                     f"📊 **{data['total_questions']}** questions extracted in total"
                 )
 
-        questions = extract_survey_questions(
-            client=client,
-            chunks=chunks,
-            model=model,
-            progress_callback=on_progress,
+        # 동일 문서·모델이면 디스크 캐시에서 즉시 복원 (LLM 호출 생략)
+        questions, cache_hit, failed_chunks = _extract_with_cache(
+            client, chunks, model, on_progress, refresh=force_extract,
         )
+        st.session_state['cache_hit'] = cache_hit
+        if cache_hit:
+            progress_bar.progress(1.0)
+            status.write(f"Restored {len(questions)} questions from extraction cache")
+        elif failed_chunks:
+            status.write(
+                f"{len(failed_chunks)} chunk(s) failed — result not cached; "
+                "extract again to retry"
+            )
 
-        elapsed_total = time.time() - start_time
-        em, es = divmod(int(elapsed_total), 60)
+        elapsed_total = _fmt_mmss(time.monotonic() - start_time)
         status.update(
-            label=f"Phase 4/5: Finalizing — {len(questions)} questions in {em}:{es:02d}",
+            label=f"Phase 4/5: Finalizing — {len(questions)} questions in {elapsed_total}",
             state="running", expanded=True,
         )
 
@@ -406,17 +548,21 @@ def _process_docx(uploaded_file, client):
         study_objective=study_objective,
     )
 
+    # Phase 5 LLM 호출을 먼저 시작하고, 그 동안 후처리 진행
+    enrich_future, enrich_key, enrich_reused = _start_enrichment(
+        questions, client_brand, study_objective)
+
     # 후처리: SummaryType, TableNumber 계산
     apply_postprocessing(survey_doc)
 
     # ── Phase 5: Survey Enrichment ──
     with st.status("Phase 5/5: Enriching survey intelligence...", expanded=True) as enrich_status:
         try:
-            intelligence = analyze_survey_intelligence(
-                questions, language="en",
-                client_brand=client_brand,
-                study_objective=study_objective,
-            )
+            intelligence = enrich_future.result()
+            if enrich_reused:
+                enrich_status.write("Study Brief and questions unchanged — reused previous analysis")
+            elif intelligence.get("study_type"):  # 실패 시 fallback 결과는 재사용하지 않음
+                st.session_state['_enrich_memo'] = (enrich_key, intelligence)
             enrich_document(survey_doc, intelligence)
             obj_count = len(intelligence.get("research_objectives", []))
             seg_count = len(intelligence.get("key_segments", []))
@@ -428,9 +574,8 @@ def _process_docx(uploaded_file, client):
         except Exception as e:
             enrich_status.update(label=f"Phase 5/5: Enrichment skipped ({e})", state="error")
 
-    # 세션 상태 저장
+    # 세션 상태 저장 (edited_df는 아래 _display_docx_results의 스프레드시트가 설정)
     st.session_state['survey_document'] = survey_doc
-    st.session_state['edited_df'] = survey_doc.to_dataframe()
 
     st.success(f"Successfully extracted **{len(questions)}** questions from the document!", icon="✅")
 
@@ -461,13 +606,9 @@ def _process_docx(uploaded_file, client):
     _display_docx_results(survey_doc)
 
 
-def _render_intelligence_summary(doc: SurveyDocument):
-    """Intelligence 결과 요약 카드 + Re-analyze 버튼."""
-    intel = doc.survey_intelligence
-    if not intel or not intel.get("study_type"):
-        return
-
-    client = intel.get("client_name", "") or doc.client_brand
+def _intelligence_summary_markdown(intel: dict, client_brand: str) -> str:
+    """Intelligence 요약 카드 본문(markdown) 생성"""
+    client = intel.get("client_name", "") or client_brand
     study = intel.get("study_type", "")
     header = f"{client} — {study}" if client else study
     objectives = intel.get("research_objectives", [])
@@ -482,7 +623,24 @@ def _render_intelligence_summary(doc: SurveyDocument):
         intel_lines.append(f"Objectives: {obj_str}")
     if seg_str:
         intel_lines.append(f"Key Segments: {seg_str}")
-    st.info("\n\n".join(intel_lines), icon="\U0001f4cb")
+    return "\n\n".join(intel_lines)
+
+
+def _render_intelligence_summary(doc: SurveyDocument):
+    """Intelligence 결과 요약 카드 + Re-analyze 버튼."""
+    intel = doc.survey_intelligence
+    if not intel or not intel.get("study_type"):
+        return
+
+    # 세션 로드 후 매 rerun마다 재구성하지 않도록 메모 — enrich_document는
+    # survey_intelligence를 통째로 교체하므로 객체 동일성(is)으로 판별 가능
+    memo = st.session_state.get('_intel_summary')
+    if memo and memo[0] is intel and memo[1] == doc.client_brand:
+        summary_md = memo[2]
+    else:
+        summary_md = _intelligence_summary_markdown(intel, doc.client_brand)
+        st.session_state['_intel_summary'] = (intel, doc.client_brand, summary_md)
+    st.info(summary_md, icon="\U0001f4cb")
 
     # Re-analyze 버튼
     if st.button("Re-analyze Intelligence", key="re_analyze_intel_btn"):
@@ -490,6 +648,7 @@ def _render_intelligence_summary(doc: SurveyDocument):
         study_objective = st.session_state.get("study_objective", doc.study_objective)
         doc.client_brand = client_brand
         doc.study_objective = study_objective
+        st.session_state.pop('_enrich_memo', None)  # 명시적 재분석 → 재사용 무효화
         with st.spinner("Re-analyzing survey intelligence..."):
             try:
                 intelligence = analyze_survey_intelligence(
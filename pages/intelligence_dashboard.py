@@ -6,13 +6,22 @@ LLM 호출 없음 — 순수 계산 기반.
 
 import re
 from collections import Counter
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, Dict, List, Tuple
 
 import pandas as pd
 import streamlit as st
 
 from models.survey import SurveyDocument, SurveyQuestion
-from services.skip_logic_service import build_skip_logic_graph, generate_dot
+from services.skip_logic_service import (
+    build_skip_logic_graph,
+    generate_dot,
+    skip_graph_fingerprint,
+    SkipLogicGraph,
+)
 
 # ---------------------------------------------------------------------------
 # LOI 추정 상수 (초 단위)
@@ -26,6 +35,9 @@ _TYPE_SECONDS: Dict[str, int] = {
     "Scale": 15,
 }
 
+# 정규화(strip+upper) 유형이 기본 키와 정확히 같으면 부분 문자열 검사 없이 바로 반환
+_EXACT_TYPE_SECONDS: Dict[str, int] = {k.upper(): v for k, v in _TYPE_SECONDS.items()}
+
 _DEFAULT_SECONDS = 12          # 유형 미상 문항 기본 응답 시간
 _GRID_DEFAULT_ROWS = 5         # Grid/Matrix 기본 행 수
 _GRID_SECONDS_PER_CELL = 8     # Grid 셀당 응답 시간
@@ -34,58 +46,87 @@ _TOPN_SECONDS = 25             # TopN 유형 응답 시간
 _GRID_ROW_RE = re.compile(r'(\d+)\s*(?:pt|point|항목|row)', re.IGNORECASE)
 _GRID_COL_RE = re.compile(r'x\s*(\d+)', re.IGNORECASE)
 
+# ---------------------------------------------------------------------------
+# 섹션 흐름도 (Graphviz)
+# ---------------------------------------------------------------------------
+
+_ROLE_COLORS: Dict[str, str] = {
+    "screening": "#FFE0B2",
+    "demographics": "#B3E5FC",
+    "awareness": "#C8E6C9",
+    "usage_experience": "#F0F4C3",
+    "evaluation": "#E1BEE7",
+    "intent_loyalty": "#FFCDD2",
+    "other": "#E0E0E0",
+}
+_ROLE_DEFAULT_COLOR = "#E0E0E0"
+
+_DOT_PREAMBLE = "\n".join([
+    'digraph SectionFlow {',
+    '  rankdir=LR;',
+    '  node [shape=box, style="filled,rounded", fontsize=11, fontname="Arial"];',
+    '  edge [color="#666666", penwidth=1.5];',
+])
+
 # ---------------------------------------------------------------------------
 # 핵심 함수
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _type_seconds(raw_type: str) -> int:
+    """문항 유형 문자열 → 예상 응답 시간(초).
+
+    설문 내 서로 다른 유형 문자열은 수십 개 이하이므로 결과를 캐시하여
+    정규식/부분 문자열 검사는 유형 문자열당 한 번만 수행한다.
+    """
+    qtype = raw_type.strip().upper()
+    if not qtype:
+        return _DEFAULT_SECONDS
+    exact = _EXACT_TYPE_SECONDS.get(qtype)
+    if exact is not None:
+        return exact
+
+    # Grid/Matrix: "Npt x M" 형태 처리
+    if "X" in qtype or "GRID" in qtype or "MATRIX" in qtype or "NPT" in qtype:
+        rows = _GRID_DEFAULT_ROWS
+        row_match = _GRID_ROW_RE.search(raw_type)
+        if row_match:
+            rows = int(row_match.group(1))
+        col_match = _GRID_COL_RE.search(raw_type)
+        cols = int(col_match.group(1)) if col_match else 1
+        return rows * _GRID_SECONDS_PER_CELL * cols
+
+    # Scale 계열
+    if "SCALE" in qtype or "PT" in qtype:
+        return _TYPE_SECONDS.get("Scale", 15)
+
+    # TopN
+    if "TOPN" in qtype or "TOP" in qtype:
+        return _TOPN_SECONDS
+
+    # 일반 유형 매칭
+    for key, secs in _TYPE_SECONDS.items():
+        if key in qtype:
+            return secs
+    return _DEFAULT_SECONDS
+
+
 def _estimate_loi_quick(questions: List[SurveyQuestion]) -> int:
     """유형별 가중치를 적용한 빠른 LOI 추정 (분 단위 반환)."""
-    total_seconds = 0
-    for q in questions:
-        qtype = (q.question_type or "").strip().upper()
-        if not qtype:
-            total_seconds += _DEFAULT_SECONDS
-            continue
-
-        # Grid/Matrix: "Npt x M" 형태 처리
-        if "X" in qtype or "GRID" in qtype or "MATRIX" in qtype or "NPT" in qtype:
-            rows = _GRID_DEFAULT_ROWS
-            row_match = _GRID_ROW_RE.search(q.question_type or "")
-            if row_match:
-                rows = int(row_match.group(1))
-            col_match = _GRID_COL_RE.search(q.question_type or "")
-            cols = int(col_match.group(1)) if col_match else 1
-            total_seconds += rows * _GRID_SECONDS_PER_CELL * cols
-            continue
-
-        # Scale 계열
-        if "SCALE" in qtype or "PT" in qtype:
-            total_seconds += _TYPE_SECONDS.get("Scale", 15)
-            continue
-
-        # TopN
-        if "TOPN" in qtype or "TOP" in qtype:
-            total_seconds += _TOPN_SECONDS
-            continue
-
-        # 일반 유형 매칭
-        matched = False
-        for key, secs in _TYPE_SECONDS.items():
-            if key in qtype:
-                total_seconds += secs
-                matched = True
-                break
-        if not matched:
-            total_seconds += _DEFAULT_SECONDS
-
+    total_seconds = sum(_type_seconds(q.question_type or "") for q in questions)
     return max(1, round(total_seconds / 60))
 
 
 def _skip_complexity(questions: List[SurveyQuestion]) -> str:
     """스킵 로직 복잡도를 Low/Medium/High로 반환."""
-    skip_count = sum(1 for q in questions if q.skip_logic)
-    ratio = skip_count / len(questions) if questions else 0
+    skip_count = sum(map(bool, map(attrgetter("skip_logic"), questions)))
+    return _complexity_label(skip_count, len(questions))
+
+
+def _complexity_label(skip_count: int, total: int) -> str:
+    """스킵 로직 보유 문항 비율 → Low/Medium/High."""
+    ratio = skip_count / total if total else 0
 
     if ratio < 0.1:
         return "Low"
@@ -95,8 +136,12 @@ def _skip_complexity(questions: List[SurveyQuestion]) -> str:
         return "High"
 
 
+@lru_cache(maxsize=256)
 def _normalize_type(raw_type: str) -> str:
-    """문항 유형을 정규화하여 분류 가능한 카테고리로 반환."""
+    """문항 유형을 정규화하여 분류 가능한 카테고리로 반환.
+
+    순수 함수이고 입력 도메인(유형 문자열 종류)이 작아 프로세스 단위로 캐시한다.
+    """
     if not raw_type:
         return "Unknown"
     t = raw_type.strip().upper()
@@ -126,123 +171,169 @@ def _normalize_type(raw_type: str) -> str:
     return raw_type.strip() if raw_type.strip() else "Unknown"
 
 
+def _summary_stats(questions: List[SurveyQuestion]) -> Tuple[Counter, int, int]:
+    """핵심 지표용 통계를 문항 1회 순회로 계산 (question_type은 문항당 한 번만 읽음).
+
+    Returns:
+        (정규화 유형별 문항 수, LOI 추정(분), 스킵 로직 보유 문항 수)
+    """
+    type_counter: Counter = Counter()
+    total_seconds = 0
+    skip_count = 0
+    for q in questions:
+        raw_type = q.question_type or ""
+        type_counter[_normalize_type(raw_type)] += 1
+        total_seconds += _type_seconds(raw_type)
+        if q.skip_logic:
+            skip_count += 1
+    return type_counter, max(1, round(total_seconds / 60)), skip_count
+
+
+@dataclass
+class _DashboardStats:
+    """대시보드 렌더러가 읽는 집계 결과 (문항 지문이 같으면 rerun 간 재사용)."""
+    type_set: set
+    loi: int
+    skip_count: int
+    type_counter: Counter
+    role_counter: Counter
+    vt_counter: Counter
+    sections: Tuple[Tuple[str, int], ...]
+    high_value: int
+
+
+def _stats_fingerprint(questions: List[SurveyQuestion]) -> tuple:
+    """_compute_dashboard_stats가 읽는 필드만으로 구성한 문항 지문."""
+    return tuple(
+        (q.question_type, q.role, q.variable_type, bool(q.skip_logic), q.analytical_value)
+        for q in questions
+    )
+
+
+def _compute_dashboard_stats(questions: List[SurveyQuestion]) -> _DashboardStats:
+    """요약 지표·분포·섹션 구성 집계."""
+    type_counter, loi, skip_count = _summary_stats(questions)
+    return _DashboardStats(
+        type_set=set(type_counter) - {"Unknown"},
+        loi=loi,
+        skip_count=skip_count,
+        type_counter=type_counter,
+        role_counter=Counter(filter(None, map(attrgetter("role"), questions))),
+        vt_counter=Counter(filter(None, map(attrgetter("variable_type"), questions))),
+        sections=_role_sections(questions),
+        high_value=sum(1 for v in map(attrgetter("analytical_value"), questions) if v == "high"),
+    )
+
+
+def _dashboard_stats(questions: List[SurveyQuestion]) -> _DashboardStats:
+    """문항 지문이 이전 rerun과 같으면 집계 결과 재사용 (expander 토글 등)."""
+    fingerprint = _stats_fingerprint(questions)
+    cached = st.session_state.get("_dashboard_stats")
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    stats = _compute_dashboard_stats(questions)
+    st.session_state["_dashboard_stats"] = (fingerprint, stats)
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # 렌더링 함수
 # ---------------------------------------------------------------------------
 
 
-def _render_summary_metrics(doc: SurveyDocument, questions: List[SurveyQuestion]) -> None:
+def _render_summary_metrics(stats: _DashboardStats, total: int) -> None:
     """Row 1: 핵심 지표 4칸."""
-    type_set = set(_normalize_type(q.question_type) for q in questions)
-    type_set.discard("Unknown")
-
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Questions", len(questions))
+        st.metric("Total Questions", total)
     with col2:
-        st.metric("Question Types", len(type_set) if type_set else "-")
+        st.metric("Question Types", len(stats.type_set) if stats.type_set else "-")
     with col3:
-        loi = _estimate_loi_quick(questions)
-        st.metric("Est. LOI", f"{loi} min")
+        st.metric("Est. LOI", f"{stats.loi} min")
     with col4:
-        complexity = _skip_complexity(questions)
-        st.metric("Skip Complexity", complexity)
+        st.metric("Skip Complexity", _complexity_label(stats.skip_count, total))
 
 
-def _render_section_flow(questions: List[SurveyQuestion]) -> None:
-    """Phase 5 role 기반 섹션 흐름도 (Graphviz)."""
-    st.subheader("Survey Structure Flow")
+@lru_cache(maxsize=64)
+def _title_label(value: str) -> str:
+    """snake_case role/variable_type 값 → 표시용 Title Case (소수 어휘라 캐시)."""
+    return value.replace("_", " ").title()
 
-    # role 필드가 있는 문항만 처리
-    roles = [q.role for q in questions if q.role]
-    if not roles:
-        st.caption("No role metadata available. Run Questionnaire Analyzer with enrichment first.")
-        return
 
-    # 연속 동일 role을 그룹으로 묶기
-    sections: List[Tuple[str, int]] = []
-    current_role = None
-    current_count = 0
-    for role in roles:
-        if role == current_role:
-            current_count += 1
-        else:
-            if current_role is not None:
-                sections.append((current_role, current_count))
-            current_role = role
-            current_count = 1
-    if current_role is not None:
-        sections.append((current_role, current_count))
+def _section_flow_dot(sections: Tuple[Tuple[str, int], ...]) -> str:
+    """(role, 문항 수) 섹션 목록 → Graphviz DOT 문자열."""
+    nodes = "\n".join(
+        f'  section_{i} [label="{_title_label(role)}\\n({count} Qs)", '
+        f'fillcolor="{_ROLE_COLORS.get(role, _ROLE_DEFAULT_COLOR)}"];'
+        for i, (role, count) in enumerate(sections)
+    )
+    edges = [f"  section_{i} -> section_{i + 1};" for i in range(len(sections) - 1)]
+    return "\n".join([_DOT_PREAMBLE, "", nodes, "", *edges, "}"])
+
+
+def _role_sections(questions: List[SurveyQuestion]) -> tuple:
+    """연속 동일 role을 (role, 문항 수) 섹션으로 묶기 (role 없는 문항 제외)."""
+    return tuple(
+        (role, sum(1 for _ in group))
+        for role, group in groupby(q.role for q in questions if q.role)
+    )
+
+
+def _render_section_flow(sections: Tuple[Tuple[str, int], ...]) -> None:
+    """Phase 5 role 기반 섹션 흐름도 (Graphviz)."""
+    st.subheader("Survey Structure Flow")
 
     if not sections:
-        st.caption("No sections detected.")
+        st.caption("No role metadata available. Run Questionnaire Analyzer with enrichment first.")
         return
 
-    # Graphviz DOT 생성
-    _ROLE_COLORS = {
-        "screening": "#FFE0B2",
-        "demographics": "#B3E5FC",
-        "awareness": "#C8E6C9",
-        "usage_experience": "#F0F4C3",
-        "evaluation": "#E1BEE7",
-        "intent_loyalty": "#FFCDD2",
-        "other": "#E0E0E0",
-    }
-
-    lines = ['digraph SectionFlow {']
-    lines.append('  rankdir=LR;')
-    lines.append('  node [shape=box, style="filled,rounded", fontsize=11, fontname="Arial"];')
-    lines.append('  edge [color="#666666", penwidth=1.5];')
-    lines.append('')
-
-    for i, (role, count) in enumerate(sections):
-        color = _ROLE_COLORS.get(role, "#E0E0E0")
-        label = f"{role.replace('_', ' ').title()}\\n({count} Qs)"
-        node_id = f"section_{i}"
-        lines.append(f'  {node_id} [label="{label}", fillcolor="{color}"];')
-
-    lines.append('')
-
-    for i in range(len(sections) - 1):
-        lines.append(f'  section_{i} -> section_{i + 1};')
-
-    lines.append('}')
-    dot_str = '\n'.join(lines)
+    # 섹션 구성이 같으면 이전 rerun에서 만든 DOT 재사용
+    cached = st.session_state.get("_section_flow_dot")
+    if cached and cached[0] == sections:
+        dot_str = cached[1]
+    else:
+        dot_str = _section_flow_dot(sections)
+        st.session_state["_section_flow_dot"] = (sections, dot_str)
 
     st.graphviz_chart(dot_str, use_container_width=True)
 
 
-def _render_type_distribution(questions: List[SurveyQuestion]) -> None:
+def _render_count_bars(counter: Counter, label: str,
+                       format_label: Callable[[str], str] = str) -> None:
+    """Counter 항목을 빈도 내림차순 라벨 | 막대+개수 테이블 하나로 표시."""
+    sorted_items = counter.most_common()
+    df = pd.DataFrame({
+        label: [format_label(value) for value, _ in sorted_items],
+        "Count": [count for _, count in sorted_items],
+    })
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Count": st.column_config.ProgressColumn(
+                "Count", min_value=0, max_value=sorted_items[0][1], format="%d",
+            ),
+        },
+    )
+
+
+def _render_type_distribution(type_counter: Counter) -> None:
     """문항 유형 분포 수평 바 차트 + 테이블."""
     st.subheader("Question Type Distribution")
 
-    type_counter = Counter(_normalize_type(q.question_type) for q in questions)
     if not type_counter:
         st.caption("No question type data available.")
         return
 
-    # 내림차순 정렬
-    sorted_types = type_counter.most_common()
-    max_count = sorted_types[0][1] if sorted_types else 1
-
-    for qtype, count in sorted_types:
-        col_label, col_bar, col_count = st.columns([2, 6, 1])
-        with col_label:
-            st.text(qtype)
-        with col_bar:
-            st.progress(count / max_count if max_count > 0 else 0)
-        with col_count:
-            st.text(str(count))
+    _render_count_bars(type_counter, "Type")
 
 
-def _render_role_distribution(questions: List[SurveyQuestion]) -> None:
+def _render_role_distribution(role_counter: Counter, vt_counter: Counter) -> None:
     """Phase 5 role & variable_type 분포."""
     st.subheader("Role & Variable Type Distribution")
 
-    roles = [q.role for q in questions if q.role]
-    var_types = [q.variable_type for q in questions if q.variable_type]
-
-    if not roles and not var_types:
+    if not role_counter and not vt_counter:
         st.caption("No enrichment metadata available. Run Questionnaire Analyzer with enrichment first.")
         return
 
@@ -250,46 +341,42 @@ def _render_role_distribution(questions: List[SurveyQuestion]) -> None:
 
     with col_left:
         st.markdown("**Role Distribution**")
-        if roles:
-            role_counter = Counter(roles)
-            sorted_roles = role_counter.most_common()
-            max_count = sorted_roles[0][1] if sorted_roles else 1
-            for role, count in sorted_roles:
-                label = role.replace("_", " ").title()
-                col_l, col_b, col_c = st.columns([3, 5, 1])
-                with col_l:
-                    st.text(label)
-                with col_b:
-                    st.progress(count / max_count if max_count > 0 else 0)
-                with col_c:
-                    st.text(str(count))
+        if role_counter:
+            _render_count_bars(role_counter, "Role", _title_label)
         else:
             st.caption("No role data.")
 
     with col_right:
         st.markdown("**Variable Type Distribution**")
-        if var_types:
-            vt_counter = Counter(var_types)
-            sorted_vts = vt_counter.most_common()
-            max_count = sorted_vts[0][1] if sorted_vts else 1
-            for vtype, count in sorted_vts:
-                label = vtype.replace("_", " ").title()
-                col_l, col_b, col_c = st.columns([3, 5, 1])
-                with col_l:
-                    st.text(label)
-                with col_b:
-                    st.progress(count / max_count if max_count > 0 else 0)
-                with col_c:
-                    st.text(str(count))
+        if vt_counter:
+            _render_count_bars(vt_counter, "Variable Type", _title_label)
         else:
             st.caption("No variable type data.")
 
 
+def _skip_overview(questions: List[SurveyQuestion]) -> Tuple[SkipLogicGraph, str]:
+    """(SkipLogicGraph, skip_only DOT) — 문항 지문이 같으면 이전 rerun 결과 재사용.
+
+    스킵 규칙이 없으면 DOT은 빈 문자열.
+    """
+    fingerprint = skip_graph_fingerprint(questions)
+    cached = st.session_state.get("_skip_overview")
+    if cached and cached[0] == fingerprint:
+        return cached[1], cached[2]
+
+    graph = build_skip_logic_graph(questions)
+    dot = ""
+    if graph.questions_with_skip > 0:
+        dot = generate_dot(graph, view_mode="skip_only", orientation="LR")
+    st.session_state["_skip_overview"] = (fingerprint, graph, dot)
+    return graph, dot
+
+
 def _render_skip_logic_overview(questions: List[SurveyQuestion]) -> None:
     """스킵 로직 통계 + 미니 그래프 프리뷰."""
     st.subheader("Skip Logic Overview")
 
-    graph = build_skip_logic_graph(questions)
+    graph, dot = _skip_overview(questions)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -300,28 +387,32 @@ def _render_skip_logic_overview(questions: List[SurveyQuestion]) -> None:
         st.metric("Unique Targets", graph.unique_targets)
 
     # 미니 그래프 프리뷰 (skip_only)
-    if graph.questions_with_skip > 0:
-        dot = generate_dot(graph, view_mode="skip_only", orientation="LR")
+    if dot:
         with st.expander("Skip Logic Graph Preview", expanded=False):
             st.graphviz_chart(dot, use_container_width=True)
 
     if graph.unparsed_targets:
         with st.expander(f"Unresolved Targets ({len(graph.unparsed_targets)})"):
             df = pd.DataFrame(graph.unparsed_targets, columns=["Source Q#", "Raw Target"])
+            df["Source Q#"] = df["Source Q#"].astype("category")  # 한 문항에 여러 규칙 반복
             st.dataframe(df, use_container_width=True, hide_index=True)
 
 
-def _render_analytical_readiness(doc: SurveyDocument, questions: List[SurveyQuestion]) -> None:
+def _render_analytical_readiness(doc: SurveyDocument, high_value: int, total: int) -> None:
     """배너 & 분석 준비도 정보."""
     st.subheader("Analytical Readiness")
 
+    # 배너 통계는 1회 순회로 집계
     banner_count = len(doc.banners)
-    banner_points = sum(len(b.points) for b in doc.banners)
-    composite_count = sum(1 for b in doc.banners if b.banner_type == "composite")
+    banner_points = 0
+    composite_count = 0
+    for b in doc.banners:
+        banner_points += len(b.points)
+        if b.banner_type == "composite":
+            composite_count += 1
     composite_ratio = (composite_count / banner_count * 100) if banner_count > 0 else 0
 
-    high_value = sum(1 for q in questions if q.analytical_value == "high")
-    high_ratio = (high_value / len(questions) * 100) if questions else 0
+    high_ratio = (high_value / total * 100) if total else 0
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -360,14 +451,17 @@ def _render_quality_quick_scan() -> None:
         issues = results.get('issues', [])
         if issues:
             st.warning(f"**{len(issues)}** quality issue(s) detected. See Quality Checker for details.")
-            # 최대 5개만 표시
-            for issue in issues[:5]:
-                if isinstance(issue, dict):
-                    st.caption(f"- {issue.get('description', str(issue))}")
-                else:
-                    st.caption(f"- {issue}")
-            if len(issues) > 5:
-                st.caption(f"... and {len(issues) - 5} more")
+            # 최대 5개만 표시 (한 번의 caption으로 렌더링)
+            sample = issues[:5]
+            lines = [
+                f"- {issue.get('description', str(issue)) if isinstance(issue, dict) else issue}"
+                for issue in sample
+            ]
+            text = "\n".join(lines)
+            extra = len(issues) - len(sample)
+            if extra:
+                text += f"\n\n... and {extra} more"  # 빈 줄: 마지막 목록 항목에 붙지 않도록
+            st.caption(text)
         else:
             st.success("No quality issues detected.")
     elif isinstance(results, str):
@@ -399,23 +493,26 @@ def page_intelligence_dashboard() -> None:
 
     st.info(f"**{doc.filename}** — {len(questions)} questions extracted")
 
+    # 집계는 문항이 바뀔 때만 다시 계산
+    stats = _dashboard_stats(questions)
+
     # Row 1: 핵심 지표
-    _render_summary_metrics(doc, questions)
+    _render_summary_metrics(stats, len(questions))
 
     st.divider()
 
     # Section Flow
-    _render_section_flow(questions)
+    _render_section_flow(stats.sections)
 
     st.divider()
 
     # Type Distribution
-    _render_type_distribution(questions)
+    _render_type_distribution(stats.type_counter)
 
     st.divider()
 
     # Role & Variable Type
-    _render_role_distribution(questions)
+    _render_role_distribution(stats.role_counter, stats.vt_counter)
 
     st.divider()
 
@@ -425,7 +522,7 @@ def page_intelligence_dashboard() -> None:
     st.divider()
 
     # Analytical Readiness
-    _render_analytical_readiness(doc, questions)
+    _render_analytical_readiness(doc, stats.high_value, len(questions))
 
     # Quality Quick Scan (optional)
     _render_quality_quick_scan()
@@ -4,6 +4,9 @@ Questionnaire Analyzer에서 추출된 SurveyDocument의 문항들을
 LLM으로 분석하여 소요 시간 대시보드 + 상세 테이블로 표시한다.
 """
 
+from operator import attrgetter
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 
@@ -129,30 +132,37 @@ def _render_dashboard(result: SurveyLengthResult):
         st.metric("High Complexity", complexity_counts.get("high", 0))
 
 
+def _task_labels(lang: str) -> dict:
+    """언어별 인지 태스크 표시 라벨 (미지원 언어는 영어)."""
+    return COGNITIVE_TASK_LABELS.get(lang, COGNITIVE_TASK_LABELS["en"])
+
+
+def _breakdown_frame(key_column: str, time_by: dict, count_by: dict, format_key=None) -> pd.DataFrame:
+    """총 소요 시간 내림차순 분포 테이블 (행 dict 없이 컬럼 단위로 구성).
+
+    Questions / Total (sec)는 가장 작은 unsigned 타입으로 축소한다.
+    Avg (sec)는 float32로 줄이면 표시 값이 12.300000190734863처럼 깨지므로 그대로 둔다.
+    """
+    keys = sorted(time_by, key=time_by.get, reverse=True)
+    counts = [count_by[k] for k in keys]
+    totals = [time_by[k] for k in keys]
+    return pd.DataFrame({
+        key_column: [format_key(k) for k in keys] if format_key else keys,
+        "Questions": pd.to_numeric(counts, downcast="unsigned"),
+        "Total (sec)": pd.to_numeric(totals, downcast="unsigned"),
+        "Avg (sec)": [round(t / c, 1) if c > 0 else 0 for t, c in zip(totals, counts)],
+    })
+
+
 def _render_type_breakdown(result: SurveyLengthResult):
     """유형별 분포: 바 차트 + 통계 테이블."""
     st.subheader("Time by Question Type")
 
     time_by_type = result.time_by_type()
-    count_by_type = result.count_by_type()
-
     if not time_by_type:
         return
 
-    # 테이블 데이터 구성
-    rows = []
-    for qtype in sorted(time_by_type.keys(), key=lambda t: time_by_type[t], reverse=True):
-        total_sec = time_by_type[qtype]
-        count = count_by_type[qtype]
-        avg_sec = total_sec / count if count > 0 else 0
-        rows.append({
-            "Type": qtype,
-            "Questions": count,
-            "Total (sec)": total_sec,
-            "Avg (sec)": round(avg_sec, 1),
-        })
-
-    df = pd.DataFrame(rows)
+    df = _breakdown_frame("Type", time_by_type, result.count_by_type())
 
     col_chart, col_table = st.columns(2)
 
@@ -170,25 +180,14 @@ def _render_cognitive_breakdown(result: SurveyLengthResult, lang: str):
     st.subheader("Time by Cognitive Task")
 
     time_by_task = result.time_by_cognitive_task()
-    count_by_task = result.count_by_cognitive_task()
-    task_labels = COGNITIVE_TASK_LABELS.get(lang, COGNITIVE_TASK_LABELS["en"])
-
     if not time_by_task:
         return
 
-    rows = []
-    for task in sorted(time_by_task.keys(), key=lambda t: time_by_task[t], reverse=True):
-        total_sec = time_by_task[task]
-        count = count_by_task[task]
-        avg_sec = total_sec / count if count > 0 else 0
-        rows.append({
-            "Cognitive Task": task_labels.get(task, task),
-            "Questions": count,
-            "Total (sec)": total_sec,
-            "Avg (sec)": round(avg_sec, 1),
-        })
-
-    df = pd.DataFrame(rows)
+    task_labels = _task_labels(lang)
+    df = _breakdown_frame(
+        "Cognitive Task", time_by_task, result.count_by_cognitive_task(),
+        format_key=lambda task: task_labels.get(task, task),
+    )
 
     col_chart, col_table = st.columns(2)
 
@@ -207,26 +206,33 @@ def _render_detail_table(result: SurveyLengthResult, lang: str = "ko"):
     if not result.question_estimates:
         st.info("No question estimates available.")
         return
-    max_time = max(e.estimated_seconds for e in result.question_estimates)
-    task_labels = COGNITIVE_TASK_LABELS.get(lang, COGNITIVE_TASK_LABELS["en"])
-
-    rows = []
-    for e in result.question_estimates:
-        q_text = e.question_text
-        if len(q_text) > 100:
-            q_text = q_text[:100] + "..."
-        rows.append({
-            "Q#": e.question_number,
-            "Question": q_text,
-            "Type": e.question_type,
-            "Options": e.option_count,
-            "Cognitive": task_labels.get(e.cognitive_task, e.cognitive_task),
-            "Time (sec)": e.estimated_seconds,
-            "Complexity": e.complexity,
-            "Reasoning": e.reasoning,
-        })
-
-    df = pd.DataFrame(rows)
+    estimates = result.question_estimates
+    # 초 값은 한 번만 읽어 max 계산과 "Time (sec)" 컬럼에 함께 사용
+    seconds = np.fromiter(
+        (e.estimated_seconds for e in estimates), dtype=np.int32, count=len(estimates)
+    )
+    max_time = int(seconds.max())
+    task_labels = _task_labels(lang)
+
+    # 컬럼 단위로 구성 (행 dict 생성·전치 없이 DataFrame 생성)
+    df = pd.DataFrame({
+        "Q#": [e.question_number for e in estimates],
+        "Question": [
+            t if len(t) <= 100 else t[:100] + "..."
+            for t in map(attrgetter("question_text"), estimates)
+        ],
+        "Type": pd.Categorical([e.question_type for e in estimates]),
+        "Options": [e.option_count for e in estimates],
+        # 라벨 변환은 행이 아닌 고유 태스크(카테고리) 단위로 수행
+        "Cognitive": pd.Categorical(
+            pd.Categorical([e.cognitive_task for e in estimates]).map(
+                lambda task: task_labels.get(task, task), na_action="ignore"
+            )
+        ),
+        "Time (sec)": seconds,
+        "Complexity": pd.Categorical([e.complexity for e in estimates]),
+        "Reasoning": [e.reasoning for e in estimates],
+    })
 
     st.dataframe(
         df,
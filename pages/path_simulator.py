@@ -5,7 +5,10 @@ SurveyDocument의 스킵 로직 그래프를 분석하여
 LLM 불필요 — 버튼 클릭 시 즉시 계산.
 """
 
-import io
+import math
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
 import pandas as pd
 import streamlit as st
 
@@ -16,7 +19,23 @@ from services.path_simulator import (
     SimulationResult,
     SimulatedPath,
 )
-from services.skip_logic_service import build_skip_logic_graph
+from models.survey import SurveyQuestion
+from services.skip_logic_service import (
+    build_skip_logic_graph,
+    skip_graph_fingerprint,
+    SkipLogicGraph,
+)
+from ui.download import render_excel_export
+
+
+_PATHS_PAGE_SIZE = 25  # All Paths 탭 페이지당 경로 수
+
+
+@lru_cache(maxsize=4096)
+def _condition_codes(condition: str) -> Tuple[str, ...]:
+    """스킵 조건 텍스트의 응답 코드 (파싱 불가 시 빈 튜플). 조건 문자열별 1회만 파싱."""
+    cond = parse_condition(condition)
+    return tuple(cond.answer_codes) if cond.is_parsed else ()
 
 
 def page_path_simulator():
@@ -40,12 +59,23 @@ def page_path_simulator():
         "Click **Analyze Paths** to simulate all possible survey paths.",
     )
 
+    # 스킵 그래프 입력 필드 지문 — 같으면 시뮬레이션/그래프 재사용
+    fingerprint = skip_graph_fingerprint(questions)
+
     # Analyze button
     if st.button("Analyze Paths", type="primary"):
         st.session_state.pop("traced_path", None)
-        with st.spinner("Analyzing paths..."):
-            result = simulate_paths(questions)
-            st.session_state["path_simulator_result"] = result
+        if (
+            "path_simulator_result" not in st.session_state
+            or st.session_state.get("_path_simulator_fp") != fingerprint
+        ):
+            with st.spinner("Analyzing paths..."):
+                result = simulate_paths(questions)
+                st.session_state["path_simulator_result"] = result
+                st.session_state["_path_simulator_fp"] = fingerprint
+                st.session_state.pop("all_paths_page", None)  # 경로 수가 바뀌면 페이지 초기화
+        else:
+            st.caption("Inputs unchanged — showing the previous simulation.")
 
     # Results
     if "path_simulator_result" not in st.session_state:
@@ -72,7 +102,7 @@ def page_path_simulator():
         _render_test_scenarios(result)
 
     with tab_tracer:
-        _render_interactive_tracer(questions)
+        _render_interactive_tracer(questions, fingerprint)
 
     with tab_paths:
         _render_all_paths(result)
@@ -125,26 +155,30 @@ def _render_test_scenarios(result: SimulationResult):
 
     st.subheader(f"Test Scenarios ({len(scenarios)})")
 
-    rows = []
+    # 컬럼 단위로 구성 (행 dict 생성·전치 없이 DataFrame 생성)
+    paths = []
+    branches = []
     for ts in scenarios:
-        answers_str = ", ".join(f"{k}={v}" for k, v in ts.answer_selections.items())
         path_str = " -> ".join(ts.expected_path[:10])
         if len(ts.expected_path) > 10:
             path_str += f" ... ({len(ts.expected_path)} total)"
+        paths.append(path_str)
         branches_str = ", ".join(ts.verified_branches[:5])
         if len(ts.verified_branches) > 5:
             branches_str += f" ... ({len(ts.verified_branches)} total)"
-
-        rows.append({
-            "#": ts.scenario_id,
-            "Priority": ts.priority,
-            "Description": ts.description,
-            "Answers": answers_str,
-            "Expected Path": path_str,
-            "Branches Verified": branches_str,
-        })
-
-    df = pd.DataFrame(rows)
+        branches.append(branches_str)
+
+    df = pd.DataFrame({
+        "#": [ts.scenario_id for ts in scenarios],
+        "Priority": [ts.priority for ts in scenarios],
+        "Description": [ts.description for ts in scenarios],
+        "Answers": [
+            ", ".join(f"{k}={v}" for k, v in ts.answer_selections.items())
+            for ts in scenarios
+        ],
+        "Expected Path": paths,
+        "Branches Verified": branches,
+    })
     st.dataframe(
         df,
         use_container_width=True,
@@ -160,68 +194,94 @@ def _render_test_scenarios(result: SimulationResult):
     )
 
     # Excel download
-    buffer = io.BytesIO()
-    df.to_excel(buffer, index=False, sheet_name="Test Scenarios")
-    buffer.seek(0)
-    st.download_button(
-        label="Download Scenarios (Excel)",
-        data=buffer,
-        file_name="test_scenarios.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    render_excel_export(
+        df, "Test Scenarios", "test_scenarios.xlsx",
+        label="Download Scenarios (Excel)", source=result, key="scenarios_xlsx",
+    )
+
+
+def _tracer_options(q: SurveyQuestion) -> Tuple[str, ...]:
+    """추적기 selectbox 선택지 — 보기가 없으면 스킵 조건의 응답 코드.
+
+    첫 항목은 항상 "(No selection)".
+    """
+    if q.answer_options:
+        return ("(No selection)", *(f"{o.code}. {o.label}" for o in q.answer_options))
+    codes = set()
+    for sl in q.skip_logic:
+        codes.update(_condition_codes(sl.condition))
+    return ("(No selection)", *sorted(codes))
+
+
+# 추적기 selectbox 행: (문항번호, 라벨, 선택지, 선택지→코드)
+_TracerRow = Tuple[str, str, Tuple[str, ...], Dict[str, str]]
+
+
+def _tracer_inputs(questions: List[SurveyQuestion],
+                   fingerprint: tuple) -> Tuple[SkipLogicGraph, List[_TracerRow]]:
+    """추적용 (SkipLogicGraph, [(문항번호, 라벨, 선택지, 선택지→코드)]) — 입력이 같으면 이전 rerun 결과 재사용.
+
+    selectbox 조작마다 그래프 구축·스킵 조건 순회를 반복하지 않도록
+    스킵 그래프 지문 + 스킵 문항 보기 목록을 키로 세션에 보관한다.
+    """
+    questions_with_skip = [q for q in questions if q.skip_logic]
+    key = (
+        fingerprint,
+        tuple(tuple((o.code, o.label) for o in q.answer_options) for q in questions_with_skip),
     )
+    cached = st.session_state.get("_tracer_inputs")
+    if cached and cached[0] == key:
+        return cached[1]
 
+    rows = []
+    for q in questions_with_skip:
+        q_label = f"{q.question_number}: {q.question_text[:60]}"
+        if len(q.question_text) > 60:
+            q_label += "..."
+        options = _tracer_options(q)
+        # 선택지 → 응답 코드 ("1. 매우 그렇다" → "1"), "(No selection)" 제외
+        option_codes = {opt: opt.partition(".")[0].strip() for opt in options[1:]}
+        rows.append((q.question_number, q_label, options, option_codes))
+
+    inputs = (build_skip_logic_graph(questions), rows)
+    st.session_state["_tracer_inputs"] = (key, inputs)
+    return inputs
 
-def _render_interactive_tracer(questions):
-    """인터랙티브 경로 추적기."""
+
+@st.fragment
+def _render_interactive_tracer(questions, fingerprint: tuple):
+    """인터랙티브 경로 추적기. 추적 제출은 페이지 전체가 아닌 이 fragment만 rerun."""
     st.subheader("Interactive Tracer")
     st.caption("Select answers for questions with skip logic, then click 'Trace Path'.")
 
-    graph = build_skip_logic_graph(questions)
-
     # 스킵 로직이 있는 문항만 selectbox 표시
-    questions_with_skip = [q for q in questions if q.skip_logic]
+    graph, tracer_rows = _tracer_inputs(questions, fingerprint)
 
-    if not questions_with_skip:
+    if not tracer_rows:
         st.info("No questions with skip logic found. The path is purely sequential.")
         if st.button("Show Sequential Path", key="trace_sequential"):
             path = trace_path(questions, graph, {})
             _render_traced_path(path)
         return
 
-    answer_selections: dict = {}
+    # 선택 변경마다 rerun하지 않도록 form으로 묶고, 제출 시에만 추적
+    with st.form("tracer_form"):
+        answer_selections: dict = {}
 
-    for q in questions_with_skip:
-        options = ["(No selection)"]
-        if q.answer_options:
-            options += [f"{o.code}. {o.label}" for o in q.answer_options]
-        else:
-            # 스킵 조건에서 코드 추출
-            codes = set()
-            for sl in q.skip_logic:
-                cond = parse_condition(sl.condition)
-                if cond.is_parsed:
-                    codes.update(cond.answer_codes)
-            if codes:
-                options += sorted(codes)
+        for qn, q_label, options, option_codes in tracer_rows:
+            selected = st.selectbox(
+                q_label,
+                options=options,
+                key=f"tracer_{qn}",
+            )
 
-        q_label = f"{q.question_number}: {q.question_text[:60]}"
-        if len(q.question_text) > 60:
-            q_label += "..."
-
-        selected = st.selectbox(
-            q_label,
-            options=options,
-            key=f"tracer_{q.question_number}",
-        )
+            code = option_codes.get(selected)
+            if code is not None:
+                answer_selections[qn] = code
 
-        if selected and selected != "(No selection)":
-            # 코드만 추출 ("1. 매우 그렇다" → "1")
-            code = selected.split(".")[0].strip()
-            answer_selections[q.question_number] = code
-
-    if st.button("Trace Path", type="primary", key="trace_btn"):
-        path = trace_path(questions, graph, answer_selections)
-        st.session_state["traced_path"] = path
+        if st.form_submit_button("Trace Path", type="primary"):
+            path = trace_path(questions, graph, answer_selections)
+            st.session_state["traced_path"] = path
 
     if "traced_path" in st.session_state:
         _render_traced_path(st.session_state["traced_path"])
@@ -238,20 +298,22 @@ def _render_traced_path(path: SimulatedPath):
         qn_display += f" ... ({path.length} total)"
     st.code(qn_display, language=None)
 
-    # 상세 스텝
+    # 상세 스텝 (스텝별 문단을 하나의 markdown 요소로 전송)
+    paragraphs = []
     for step in path.steps:
         skip_info = f" **SKIP -> {step.skip_triggered}**" if step.skip_triggered else ""
         answer_info = f" [Answer: {step.selected_answer}]" if step.selected_answer else ""
         terminal_info = " (TERMINAL)" if step.is_terminal and not step.skip_triggered else ""
-
-        st.markdown(
+        paragraphs.append(
             f"`{step.question_number}` ({step.question_type}) "
             f"{step.question_text[:80]}{answer_info}{skip_info}{terminal_info}"
         )
+    st.markdown("\n\n".join(paragraphs))
 
 
+@st.fragment
 def _render_all_paths(result: SimulationResult):
-    """모든 경로 expander 표시."""
+    """모든 경로 expander 표시. 페이지 이동은 페이지 전체가 아닌 이 fragment만 rerun."""
     paths = result.all_paths
 
     if not paths:
@@ -260,9 +322,18 @@ def _render_all_paths(result: SimulationResult):
 
     st.subheader(f"All Paths ({len(paths)})")
 
-    if len(paths) > 50:
-        st.caption(f"Showing first 50 of {len(paths)} paths.")
-        paths_to_show = paths[:50]
+    # 한 페이지 분량만 expander로 렌더링
+    page_count = math.ceil(len(paths) / _PATHS_PAGE_SIZE)
+    if page_count > 1:
+        page = st.number_input(
+            "Page", min_value=1, max_value=page_count, value=1, step=1,
+            key="all_paths_page",
+        )
+        start = (page - 1) * _PATHS_PAGE_SIZE
+        paths_to_show = paths[start:start + _PATHS_PAGE_SIZE]
+        st.caption(
+            f"Showing paths {start + 1}–{start + len(paths_to_show)} of {len(paths)}."
+        )
     else:
         paths_to_show = paths
 
@@ -273,11 +344,15 @@ def _render_all_paths(result: SimulationResult):
 
         label = f"Path #{path.path_id} ({path.length} steps): {qn_summary}"
 
+        # 경로당 markdown 요소 1개 (스텝 목록을 한 번에 전송)
+        items = []
+        for step in path.steps:
+            skip_info = f" **-> {step.skip_triggered}**" if step.skip_triggered else ""
+            terminal = " (END)" if step.is_terminal else ""
+            items.append(
+                f"- `{step.question_number}` ({step.question_type}) "
+                f"{step.question_text[:80]}{skip_info}{terminal}"
+            )
+
         with st.expander(label):
-            for step in path.steps:
-                skip_info = f" **-> {step.skip_triggered}**" if step.skip_triggered else ""
-                terminal = " (END)" if step.is_terminal else ""
-                st.markdown(
-                    f"- `{step.question_number}` ({step.question_type}) "
-                    f"{step.question_text[:80]}{skip_info}{terminal}"
-                )
+            st.markdown("\n".join(items))
@@ -3,8 +3,9 @@
 문항 간 데이터 의존성(파이핑, 필터 체인) 시각화 및 이슈 탐지.
 """
 
-import io
-from typing import List
+from collections import Counter
+from operator import attrgetter
+from typing import List, Tuple
 
 import pandas as pd
 import streamlit as st
@@ -17,9 +18,14 @@ from services.piping_service import (
     FilterChain,
     analyze_piping,
     generate_piping_dot,
+    piping_fingerprint,
     _PIPE_TYPE_LABELS,
     _PIPING_EDGE_STYLES,
 )
+from ui.download import render_excel_export
+
+# 그래프 유형 필터: 표시 라벨 → 참조 유형 역매핑
+_LABEL_TO_TYPE = {v: k for k, v in _PIPE_TYPE_LABELS.items()}
 
 
 def page_piping_intelligence() -> None:
@@ -54,9 +60,27 @@ def page_piping_intelligence() -> None:
             help="Use LLM to detect implicit piping references. Slower but more thorough.",
             key="piping_include_implicit",
         )
+    with ctrl_col2:
+        force_refresh = st.checkbox(
+            "Force refresh",
+            value=False,
+            help="Re-run the analysis even if the questions have not changed.",
+            key="piping_force_refresh",
+        )
     with ctrl_col3:
         analyze_clicked = st.button("Analyze", type="primary")
 
+    # 분석 입력 지문 — 같으면 이전 결과 재사용 (status/LLM 호출 생략)
+    analysis_key = (piping_fingerprint(questions), include_implicit, DEFAULT_MODEL)
+    if (
+        analyze_clicked
+        and not force_refresh
+        and "piping_result" in st.session_state
+        and st.session_state.get("_piping_analysis_key") == analysis_key
+    ):
+        analyze_clicked = False
+        st.caption("Inputs unchanged — showing the previous analysis.")
+
     # Run analysis
     if analyze_clicked:
         with st.status("Analyzing piping dependencies...", expanded=True) as status:
@@ -97,6 +121,15 @@ def page_piping_intelligence() -> None:
 
             progress_bar.progress(1.0)
             st.session_state["piping_result"] = result
+            # LLM 배치가 실패한 결과는 재사용하지 않음 (다음 Analyze에서 재시도)
+            if result.failed_batches:
+                st.session_state.pop("_piping_analysis_key", None)
+                log_area.text(
+                    f"{len(result.failed_batches)} implicit piping batch(es) failed — "
+                    "click Analyze to retry"
+                )
+            else:
+                st.session_state["_piping_analysis_key"] = analysis_key
 
             total_refs = len(result.piping_refs)
             total_issues = len(result.issues)
@@ -144,12 +177,30 @@ def page_piping_intelligence() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _ref_summary(result: PipingAnalysisResult) -> Tuple[int, int, int, List[str]]:
+    """(파이핑 참조 수, 필터 의존 수, error 이슈 수, 등장 순서대로의 참조 유형 목록).
+
+    참조·이슈를 각각 Counter 1회로 집계하고 같은 분석 결과면 rerun 간 재사용한다.
+    """
+    cached = st.session_state.get("_piping_ref_summary")
+    if cached and cached[0] is result:
+        return cached[1]
+
+    ref_counts = Counter(map(attrgetter("pipe_type"), result.piping_refs))
+    sev_counts = Counter(map(attrgetter("severity"), result.issues))
+    summary = (
+        ref_counts["text_piping"] + ref_counts["code_piping"] + ref_counts["implicit_piping"],
+        ref_counts["filter_dependency"],
+        sev_counts["error"],
+        list(ref_counts),  # Counter는 최초 등장 순서 유지
+    )
+    st.session_state["_piping_ref_summary"] = (result, summary)
+    return summary
+
+
 def _render_dashboard(result: PipingAnalysisResult) -> None:
     """요약 메트릭 4칸."""
-    piping_count = sum(1 for r in result.piping_refs
-                       if r.pipe_type in ("text_piping", "code_piping", "implicit_piping"))
-    filter_count = sum(1 for r in result.piping_refs
-                       if r.pipe_type == "filter_dependency")
+    piping_count, filter_count, error_count, _ = _ref_summary(result)
     issue_count = len(result.issues)
     bottleneck_count = len(result.bottleneck_questions)
 
@@ -159,21 +210,36 @@ def _render_dashboard(result: PipingAnalysisResult) -> None:
     with col2:
         st.metric("Filter Deps", filter_count)
     with col3:
-        error_count = sum(1 for i in result.issues if i.severity == "error")
         st.metric("Issues", issue_count, delta=f"{error_count} errors" if error_count else None,
                   delta_color="inverse" if error_count else "off")
     with col4:
         st.metric("Bottlenecks", bottleneck_count)
 
 
+def _piping_dot(result: PipingAnalysisResult, questions, show_types: List[str]) -> str:
+    """의존성 그래프 DOT — 같은 분석 결과·유형 선택·문항 유형이면 이전 rerun 결과 재사용."""
+    # 노드 라벨/색상은 문항 번호 → 유형 매핑에만 의존
+    key = (
+        tuple(sorted(show_types)),
+        tuple((q.question_number, q.question_type) for q in questions),
+    )
+    cached = st.session_state.get("_piping_dot")
+    if cached and cached[0] is result and cached[1] == key:
+        return cached[2]
+    dot = generate_piping_dot(result.piping_refs, questions, show_types=show_types)
+    st.session_state["_piping_dot"] = (result, key, dot)
+    return dot
+
+
+@st.fragment
 def _render_dependency_graph(result: PipingAnalysisResult, questions) -> None:
-    """의존성 그래프 (Graphviz + 유형별 필터)."""
+    """의존성 그래프 (Graphviz + 유형별 필터). 필터 변경은 이 fragment만 rerun."""
     if not result.piping_refs:
         st.info("No piping references detected.")
         return
 
     # 유형별 필터
-    available_types = list(set(r.pipe_type for r in result.piping_refs))
+    _, _, _, available_types = _ref_summary(result)
     type_labels = [_PIPE_TYPE_LABELS.get(t, t) for t in available_types]
 
     selected_labels = st.multiselect(
@@ -183,15 +249,13 @@ def _render_dependency_graph(result: PipingAnalysisResult, questions) -> None:
         key="piping_graph_filter",
     )
 
-    # 라벨 → 타입 역매핑
-    label_to_type = {v: k for k, v in _PIPE_TYPE_LABELS.items()}
-    show_types = [label_to_type.get(lbl, lbl) for lbl in selected_labels]
+    show_types = [_LABEL_TO_TYPE.get(lbl, lbl) for lbl in selected_labels]
 
     if not show_types:
         st.caption("Select at least one type to display the graph.")
         return
 
-    dot = generate_piping_dot(result.piping_refs, questions, show_types=show_types)
+    dot = _piping_dot(result, questions, show_types)
     st.graphviz_chart(dot, use_container_width=True)
 
     # 범례
@@ -235,6 +299,29 @@ def _render_filter_chains(result: PipingAnalysisResult) -> None:
         st.dataframe(df, use_container_width=True, hide_index=True)
 
 
+_ISSUE_SEVERITY_COLORS = {
+    "error": "#FF4B4B",
+    "warning": "#FFA500",
+    "info": "#4B8BFF",
+}
+_BADGE_TEMPLATE = (
+    '<span style="background-color:{color}; color:white; padding:2px 8px; '
+    'border-radius:4px; font-size:12px;">{label}</span>'
+)
+_SEVERITY_BADGES = {
+    sev: _BADGE_TEMPLATE.format(color=color, label=sev.upper())
+    for sev, color in _ISSUE_SEVERITY_COLORS.items()
+}
+
+
+def _severity_badge(severity: str) -> str:
+    """심각도 뱃지 HTML (알려진 심각도는 모듈 로드 시 생성한 문자열 재사용)."""
+    badge = _SEVERITY_BADGES.get(severity)
+    if badge is None:
+        badge = _BADGE_TEMPLATE.format(color="#999", label=severity.upper())
+    return badge
+
+
 def _render_issues(result: PipingAnalysisResult) -> None:
     """이슈 테이블 (severity 뱃지)."""
     if not result.issues:
@@ -243,43 +330,40 @@ def _render_issues(result: PipingAnalysisResult) -> None:
 
     st.subheader(f"Issues ({len(result.issues)})")
 
-    _SEVERITY_COLORS = {
-        "error": "#FF4B4B",
-        "warning": "#FFA500",
-        "info": "#4B8BFF",
-    }
-
+    # 이슈 전체를 하나의 markdown 요소로 전송
+    blocks = []
     for issue in result.issues:
-        color = _SEVERITY_COLORS.get(issue.severity, "#999")
-        badge = f'<span style="background-color:{color}; color:white; padding:2px 8px; border-radius:4px; font-size:12px;">{issue.severity.upper()}</span>'
-
-        st.markdown(
-            f"{badge} **{issue.issue_type.replace('_', ' ').title()}** — {issue.description}",
-            unsafe_allow_html=True,
+        block = (
+            f"{_severity_badge(issue.severity)} "
+            f"**{issue.issue_type.replace('_', ' ').title()}** — {issue.description}"
         )
         if issue.involved_questions:
-            st.caption(f"Involved: {', '.join(issue.involved_questions)}")
+            block += (
+                f'<br><small style="opacity:0.6">Involved: '
+                f"{', '.join(issue.involved_questions)}</small>"
+            )
+        blocks.append(block)
+    st.markdown("\n\n".join(blocks), unsafe_allow_html=True)
 
 
+@st.fragment
 def _render_all_references(result: PipingAnalysisResult) -> None:
-    """전체 참조 테이블 + Excel 다운로드."""
+    """전체 참조 테이블 + Excel 다운로드. 다운로드 클릭은 이 fragment만 rerun."""
     if not result.piping_refs:
         st.info("No piping references detected.")
         return
 
     st.subheader(f"All References ({len(result.piping_refs)})")
 
-    rows = []
-    for ref in result.piping_refs:
-        rows.append({
-            "Source": ref.source_qn,
-            "Target": ref.target_qn,
-            "Type": _PIPE_TYPE_LABELS.get(ref.pipe_type, ref.pipe_type),
-            "Context": ref.context[:100],
-            "Severity": ref.severity,
-        })
-
-    df = pd.DataFrame(rows)
+    # 참조 1회 순회로 행 튜플 구성 (dict 해싱 없이 from_records)
+    df = pd.DataFrame.from_records(
+        [
+            (ref.source_qn, ref.target_qn, _PIPE_TYPE_LABELS.get(ref.pipe_type, ref.pipe_type),
+             ref.context[:100], ref.severity)
+            for ref in result.piping_refs
+        ],
+        columns=["Source", "Target", "Type", "Context", "Severity"],
+    )
     st.dataframe(
         df,
         use_container_width=True,
@@ -294,13 +378,7 @@ def _render_all_references(result: PipingAnalysisResult) -> None:
     )
 
     # Excel 다운로드
-    buffer = io.BytesIO()
-    df.to_excel(buffer, index=False, sheet_name="Piping References")
-    buffer.seek(0)
-
-    st.download_button(
-        label="Download References (Excel)",
-        data=buffer,
-        file_name="piping_references.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    render_excel_export(
+        df, "Piping References", "piping_references.xlsx",
+        label="Download References (Excel)", source=result, key="piping_refs_xlsx",
     )
@@ -5,11 +5,17 @@ Quality Analysis 탭과 Grammar Correction 탭을 통합 제공한다.
 - Grammar Correction: 문항 문법 교정 (비교 뷰 + 편집 테이블)
 """
 
+import math
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+
 import streamlit as st
 
 from services.llm_client import MODEL_QUALITY_CHECKER
 from services.quality_checker import (
     check_survey_quality,
+    QualityIssue,
     QuestionQualityResult,
     CATEGORY_LABELS,
     SEVERITY_LABELS,
@@ -18,7 +24,7 @@ from services.quality_checker import (
 )
 from services.grammar_checker import check_grammar, apply_grammar_results
 from ui.download import render_download_buttons
-from typing import List
+from typing import List, Tuple
 
 
 def page_quality_checker():
@@ -124,6 +130,13 @@ def _render_quality_analysis_tab():
 
     st.divider()
 
+    # 필터 + 대시보드 + 이슈 카드 (fragment: 필터 변경 시 이 영역만 rerun)
+    _render_quality_results(results, lang)
+
+
+@st.fragment
+def _render_quality_results(results: List[QuestionQualityResult], lang: str):
+    """심각도 필터 + 대시보드 + 이슈 카드. 필터 변경은 페이지 전체가 아닌 이 fragment만 rerun."""
     # ── 심각도 필터 ──
     severity_options = SEVERITIES.copy()
     severity_display = {s: SEVERITY_LABELS[lang][s] for s in severity_options}
@@ -142,44 +155,47 @@ def _render_quality_analysis_tab():
     _render_issue_cards(filtered_results, lang)
 
 
+_get_severity = attrgetter("severity")
+_get_category = attrgetter("category")
+
+
 def _filter_results(
     results: List[QuestionQualityResult],
     severities: List[str],
-) -> List[QuestionQualityResult]:
-    """심각도 필터를 적용하여 결과를 반환."""
-    filtered = []
-    for r in results:
-        filtered_issues = [i for i in r.issues if i.severity in severities]
-        filtered.append(QuestionQualityResult(
-            question_number=r.question_number,
-            question_text=r.question_text,
-            issues=filtered_issues,
-        ))
-    return filtered
-
-
-def _render_quality_dashboard(results: List[QuestionQualityResult], lang: str):
+) -> List[Tuple[QuestionQualityResult, List[QualityIssue]]]:
+    """심각도 필터를 적용한 (원본 결과, 필터된 이슈) 쌍을 반환 (결과 객체 복제 없음)."""
+    sev_set = frozenset(severities)
+    return [(r, [i for i in r.issues if i.severity in sev_set]) for r in results]
+
+
+def _render_quality_dashboard(
+    results: List[Tuple[QuestionQualityResult, List[QualityIssue]]], lang: str,
+):
     """요약 대시보드 렌더링."""
     total_questions = len(results)
-    all_issues = [iss for r in results for iss in r.issues]
 
-    critical_count = sum(1 for i in all_issues if i.severity == "CRITICAL")
-    warning_count = sum(1 for i in all_issues if i.severity == "WARNING")
-    info_count = sum(1 for i in all_issues if i.severity == "INFO")
-    questions_with_issues = sum(1 for r in results if r.issues)
+    # 심각도·카테고리 분포를 이슈 1회 순회로 집계
+    sev_counts: Counter = Counter()
+    cat_counts: Counter = Counter()
+    questions_with_issues = 0
+    for _, issues in results:
+        if issues:
+            questions_with_issues += 1
+            sev_counts.update(map(_get_severity, issues))
+            cat_counts.update(map(_get_category, issues))
 
     # 메트릭 카드
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Questions", total_questions)
     with col2:
-        st.metric("Critical", critical_count)
+        st.metric("Critical", sev_counts["CRITICAL"])
     with col3:
-        st.metric("Warning", warning_count)
+        st.metric("Warning", sev_counts["WARNING"])
     with col4:
-        st.metric("Info", info_count)
+        st.metric("Info", sev_counts["INFO"])
 
-    if not all_issues:
+    if not questions_with_issues:
         st.success("No quality issues detected!", icon="✅")
         return
 
@@ -190,16 +206,10 @@ def _render_quality_dashboard(results: List[QuestionQualityResult], lang: str):
     # 카테고리별 분포
     st.subheader("Category Breakdown")
     cat_labels = CATEGORY_LABELS[lang]
-    cat_counts = {cat: 0 for cat in CATEGORIES}
-    for iss in all_issues:
-        if iss.category in cat_counts:
-            cat_counts[iss.category] += 1
-
-    max_count = max(cat_counts.values()) if cat_counts else 1
-    for cat in CATEGORIES:
-        count = cat_counts[cat]
-        if count == 0:
-            continue
+    # 알려진 카테고리만 표시 순서대로 1회 추출 (0건 제외)
+    cat_rows = [(cat, cat_counts[cat]) for cat in CATEGORIES if cat_counts[cat]]
+    max_count = max((count for _, count in cat_rows), default=1)
+    for cat, count in cat_rows:
         label = cat_labels.get(cat, cat)
         col_label, col_bar, col_count = st.columns([2, 6, 1])
         with col_label:
@@ -210,50 +220,48 @@ def _render_quality_dashboard(results: List[QuestionQualityResult], lang: str):
             st.text(str(count))
 
 
-def _render_issue_cards(results: List[QuestionQualityResult], lang: str):
-    """문항별 이슈 카드 렌더링."""
-    st.subheader("Question Details")
+# 문항 카드 아이콘: 최고 심각도 순위 → 아이콘 (0 = 이슈 없음)
+_SEVERITY_RANK = {"INFO": 1, "WARNING": 2, "CRITICAL": 3}
+_RANK_ICONS = ("✅", "ℹ️", "⚠️", "🔴")
+_SEVERITY_BADGES = {sev: _RANK_ICONS[rank] for sev, rank in _SEVERITY_RANK.items()}
 
-    cat_labels = CATEGORY_LABELS[lang]
-    sev_labels = SEVERITY_LABELS[lang]
 
-    severity_badge = {
-        "CRITICAL": "🔴",
-        "WARNING": "⚠️",
-        "INFO": "ℹ️",
-    }
+@lru_cache(maxsize=256)
+def _issue_heading(severity: str, category: str, lang: str) -> str:
+    """이슈 제목 markdown ("**🔴 심각 — 이중질문**"). (심각도, 카테고리, 언어) 조합별 1회만 조립."""
+    badge = _SEVERITY_BADGES.get(severity, "")
+    sev_text = SEVERITY_LABELS[lang].get(severity, severity)
+    cat_text = CATEGORY_LABELS[lang].get(category, category)
+    return f"**{badge} {sev_text} — {cat_text}**"
 
-    for result in results:
-        has_critical = any(i.severity == "CRITICAL" for i in result.issues)
-        has_warning = any(i.severity == "WARNING" for i in result.issues)
-        has_issues = len(result.issues) > 0
 
-        if has_critical:
-            icon = "🔴"
-        elif has_warning:
-            icon = "⚠️"
-        elif has_issues:
-            icon = "ℹ️"
-        else:
-            icon = "✅"
+def _render_issue_cards(
+    results: List[Tuple[QuestionQualityResult, List[QualityIssue]]], lang: str,
+):
+    """문항별 이슈 카드 렌더링."""
+    st.subheader("Question Details")
+
+    for result, issues in results:
+        # 가장 높은 심각도 1회 순회로 결정 (알 수 없는 심각도는 INFO 취급)
+        top_rank = max(
+            (_SEVERITY_RANK.get(i.severity, 1) for i in issues), default=0,
+        )
+        icon = _RANK_ICONS[top_rank]
+        has_issues = top_rank > 0
 
         q_text_preview = result.question_text[:80]
         if len(result.question_text) > 80:
             q_text_preview += "..."
 
-        issue_count = f" ({len(result.issues)} issues)" if result.issues else ""
+        issue_count = f" ({len(issues)} issues)" if issues else ""
         label = f"{icon} {result.question_number}. {q_text_preview}{issue_count}"
 
         with st.expander(label, expanded=has_issues):
-            if not result.issues:
+            if not issues:
                 st.success("No quality issues found.", icon="✅")
             else:
-                for issue in result.issues:
-                    badge = severity_badge.get(issue.severity, "")
-                    sev_text = sev_labels.get(issue.severity, issue.severity)
-                    cat_text = cat_labels.get(issue.category, issue.category)
-
-                    st.markdown(f"**{badge} {sev_text} — {cat_text}**")
+                for issue in issues:
+                    st.markdown(_issue_heading(issue.severity, issue.category, lang))
                     st.markdown(f"> {issue.description}")
                     st.info(f"💡 {issue.suggestion}")
 
@@ -291,6 +299,12 @@ def _render_grammar_correction_tab():
         st.write("")
         st.write("")
         check_clicked = st.button("Grammar Check", type="primary", key="grammar_check_btn")
+        force_refresh = st.checkbox(
+            "Force refresh",
+            value=False,
+            help="Ignore cached LLM responses and re-check every batch.",
+            key="grammar_force_refresh",
+        )
 
     # ── 문법 검사 실행 ──
     if check_clicked:
@@ -316,7 +330,7 @@ def _render_grammar_correction_tab():
                         f"({data['changed_count']} corrected)"
                     )
 
-            results = check_grammar(df, language, _progress_callback)
+            results = check_grammar(df, language, _progress_callback, refresh=force_refresh)
             st.session_state["grammar_results"] = results
 
             # 결과를 edited_df에 적용
@@ -441,8 +455,12 @@ def _render_grammar_comparison(results: list, filter_mode: str):
                 st.success("No grammar issues found.", icon="✅")
 
 
+# 이 행 수를 넘는 문법 편집 테이블은 페이지 단위로 나눠 에디터에 전달
+_EDITOR_PAGE_ROWS = 500
+
+
 def _render_grammar_editable_table():
-    """편집 가능 테이블 + Apply Edits 버튼."""
+    """편집 가능 테이블 + Apply Edits 버튼 (대형 설문은 페이지 단위 편집)."""
     if "edited_df" not in st.session_state:
         return
 
@@ -456,18 +474,42 @@ def _render_grammar_editable_table():
     # 존재하는 컬럼만 필터
     display_cols = [c for c in display_cols if c in df.columns]
 
+    # 대형 설문: 한 페이지 분량만 브라우저로 전송 (행 추가/삭제는 전체 표시 시에만)
+    page_count = math.ceil(len(df) / _EDITOR_PAGE_ROWS)
+    paged = page_count > 1
+    if paged:
+        page = st.number_input(
+            "Page", min_value=1, max_value=page_count, value=1, step=1,
+            key="grammar_editor_page",
+        )
+        start = (page - 1) * _EDITOR_PAGE_ROWS
+        view = df[display_cols].iloc[start:start + _EDITOR_PAGE_ROWS]
+        st.caption(
+            f"Showing rows {start + 1}–{start + len(view)} of {len(df)}. "
+            "Apply edits before switching pages."
+        )
+    else:
+        page = 1
+        view = df[display_cols]
+
     edited = st.data_editor(
-        df[display_cols],
+        view,
         height=600,
         hide_index=True,
-        num_rows="dynamic",
-        key="grammar_editor",
+        num_rows="fixed" if paged else "dynamic",
+        key=f"grammar_editor_{page}" if paged else "grammar_editor",
         use_container_width=True,
     )
 
     if st.button("Apply Edits", type="primary", key="apply_grammar_edits"):
+        # 실제로 바뀐 컬럼만 교체 (변경 없는 컬럼은 재할당 생략, 행 추가/삭제 시 인덱스 정렬 유지)
+        target = st.session_state["edited_df"]
         for col in display_cols:
-            st.session_state["edited_df"][col] = edited[col]
+            if paged:
+                if not view[col].equals(edited[col]):
+                    target.loc[edited.index, col] = edited[col]
+            elif not target[col].equals(edited[col]):
+                target[col] = edited[col]
 
         # survey_document에도 GrammarChecker 반영
         if "survey_document" in st.session_state and st.session_state["survey_document"]:
@@ -5,12 +5,16 @@ Questionnaire Analyzer에서 추출된 SurveyDocument의 문항 스킵 로직을
 LLM 불필요 — 페이지 로드 시 즉시 렌더링.
 """
 
+from typing import List
+
 import streamlit as st
 
+from models.survey import SurveyQuestion
 from services.skip_logic_service import (
     build_skip_logic_graph,
     generate_dot,
     build_detail_table,
+    skip_graph_fingerprint,
     SkipLogicGraph,
 )
 
@@ -32,8 +36,9 @@ def page_skip_logic_visualizer():
         st.warning("No questions found in the document.", icon="⚠️")
         return
 
-    # 그래프 빌드 (즉시, LLM 없음)
-    graph = build_skip_logic_graph(questions)
+    # 그래프 빌드 (즉시, LLM 없음) — 문항 지문이 같으면 이전 rerun 그래프 재사용
+    fingerprint = skip_graph_fingerprint(questions)
+    graph = _skip_graph(questions, fingerprint)
 
     # 스킵 로직이 전혀 없는 경우
     if graph.questions_with_skip == 0:
@@ -69,7 +74,7 @@ def page_skip_logic_visualizer():
         )
 
     # ── 그래프 시각화 ──
-    dot_string = generate_dot(graph, view_mode=view_mode, orientation=orientation)
+    dot_string = _skip_dot(graph, fingerprint, view_mode, orientation)
     st.graphviz_chart(dot_string, use_container_width=True)
 
     # ── 파싱 불가 타겟 경고 ──
@@ -81,6 +86,29 @@ def page_skip_logic_visualizer():
     _render_detail_table(questions, graph)
 
 
+def _skip_graph(questions: List[SurveyQuestion], fingerprint: tuple) -> SkipLogicGraph:
+    """SkipLogicGraph — 문항 지문이 같으면 세션에 보관한 그래프 재사용."""
+    cached = st.session_state.get("_skip_logic_graph")
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    graph = build_skip_logic_graph(questions)
+    st.session_state["_skip_logic_graph"] = (fingerprint, graph)
+    return graph
+
+
+def _skip_dot(graph: SkipLogicGraph, fingerprint: tuple, view_mode: str, orientation: str) -> str:
+    """DOT 문자열 — 같은 문항 지문이면 (view_mode, orientation) 조합별로 재사용."""
+    cached = st.session_state.get("_skip_logic_dot")
+    if not cached or cached[0] != fingerprint:
+        cached = (fingerprint, {})
+        st.session_state["_skip_logic_dot"] = cached
+    dots = cached[1]
+    key = (view_mode, orientation)
+    if key not in dots:
+        dots[key] = generate_dot(graph, view_mode=view_mode, orientation=orientation)
+    return dots[key]
+
+
 def _render_dashboard(graph: SkipLogicGraph, total_questions: int):
     """요약 메트릭 4칸."""
     col1, col2, col3, col4 = st.columns(4)
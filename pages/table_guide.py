@@ -8,13 +8,17 @@ Phase 4: Review & Export
 
 import logging
 import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from models.survey import Banner, BannerPoint
-from services.llm_client import call_llm_json, MODEL_TITLE_GENERATOR
+from services.llm_cache import call_llm_json_cached
+from services.llm_client import MODEL_TITLE_GENERATOR
 from services.survey_context import build_survey_context
 from services.table_guide_service import (
     _banner_id_from_index,
@@ -28,10 +32,22 @@ from services.table_guide_service import (
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 20
+MAX_CONCURRENT_BATCHES = 3  # 동시 Title LLM 배치 호출 수 (1이면 순차 실행)
+
+# 문항 유형 판별 ("Top3", "Rank 5" / "5pt x 7")
+_TOPN_RE = re.compile(r'(top|rank)\s*\d+', re.IGNORECASE)
+_MATRIX_RE = re.compile(r'\d+\s*pt\s*x\s*\d+', re.IGNORECASE)
+
+# 영문 서수 접미사 (4 이상은 "th")
+_ORDINALS = {1: "1st", 2: "2nd", 3: "3rd"}
 
 
 def _get_survey_context(df=None) -> str:
-    """session_state의 SurveyDocument에서 survey context 생성."""
+    """session_state의 SurveyDocument에서 survey context 생성.
+
+    문항 수에 비례하는 문자열 조립이므로 LLM 호출 직전에만 부른다
+    (Generate All은 1회 생성해 모든 워커가 공유).
+    """
     doc = st.session_state.get("survey_document")
     if doc:
         return build_survey_context(doc, df=df)
@@ -116,42 +132,48 @@ You generate Table Titles used in SPSS cross-tabulation tables.
 # Phase 1: Title Generation Helpers (기존 로직 유지)
 # ======================================================================
 
-def _group_rows_by_question(df: pd.DataFrame) -> list:
-    """DataFrame 행을 QuestionNumber 기준으로 그룹화."""
-    groups = []
-    seen = {}
+def _stripped_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """컬럼을 앞뒤 공백 제거한 문자열 Series로 (컬럼이 없거나 결측이면 빈 문자열)."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str).str.strip()
 
-    for _, row in df.iterrows():
-        qn = str(row.get("QuestionNumber", "")).strip()
-        if not qn:
-            continue
 
-        if qn not in seen:
-            text = str(row.get("QuestionText", "")).strip()
-            qtype = str(row.get("QuestionType", "")).strip()
-            options = str(row.get("AnswerOptions", "")).strip() if "AnswerOptions" in df.columns else ""
-            filt = str(row.get("Filter", "")).strip() if "Filter" in df.columns else ""
-
-            seen[qn] = len(groups)
-            groups.append({
-                "qn": qn,
-                "text": text,
-                "qtype": qtype,
-                "options": options,
-                "filter": filt,
-                "summary_types": [],
-                "table_numbers": [],
-            })
+def _group_rows_by_question(df: pd.DataFrame) -> list:
+    """DataFrame 행을 QuestionNumber 기준으로 그룹화 (첫 등장 순서 유지).
 
-        idx = seen[qn]
-        st_val = str(row.get("SummaryType", "")).strip()
-        tn_val = str(row.get("TableNumber", "")).strip()
-        groups[idx]["summary_types"].append(st_val)
-        groups[idx]["table_numbers"].append(tn_val)
+    문항 정보(text/qtype/options/filter)는 그룹 첫 행 기준,
+    summary_types/table_numbers는 그룹 내 행 순서대로 모은다.
+    """
+    rows = pd.DataFrame({
+        "qn": _stripped_column(df, "QuestionNumber"),
+        "text": _stripped_column(df, "QuestionText"),
+        "qtype": _stripped_column(df, "QuestionType"),
+        "options": _stripped_column(df, "AnswerOptions"),
+        "filter": _stripped_column(df, "Filter"),
+        "summary_types": _stripped_column(df, "SummaryType"),
+        "table_numbers": _stripped_column(df, "TableNumber"),
+    })
+    rows = rows[rows["qn"] != ""]
+    if rows.empty:
+        return []
 
-    for g in groups:
-        g["row_count"] = len(g["table_numbers"])
+    firsts = rows.drop_duplicates("qn")
+    positions = rows.groupby("qn", sort=False).indices  # {qn: 행 위치 배열 (행 순서)}
+    summary_arr = rows["summary_types"].to_numpy()
+    table_arr = rows["table_numbers"].to_numpy()
 
+    groups = []
+    for qn, text, qtype, options, filt in zip(
+        firsts["qn"], firsts["text"], firsts["qtype"], firsts["options"], firsts["filter"],
+    ):
+        idx = positions[qn]
+        groups.append({
+            "qn": qn, "text": text, "qtype": qtype, "options": options, "filter": filt,
+            "summary_types": summary_arr[idx].tolist(),
+            "table_numbers": table_arr[idx].tolist(),
+            "row_count": len(idx),
+        })
     return groups
 
 
@@ -199,76 +221,75 @@ def _parse_batch_result(raw: dict, batch: list) -> dict:
     return parsed
 
 
-def _ordinal_cumulative(n: int, language: str) -> str:
-    if language == "ko":
-        if n == 1:
-            return "1순위"
-        return "+".join(str(i) for i in range(1, n + 1)) + "순위"
-    else:
-        ordinals = {1: "1st", 2: "2nd", 3: "3rd"}
-        parts = []
-        for i in range(1, n + 1):
-            parts.append(ordinals.get(i, f"{i}th"))
-        return "+".join(parts)
+@lru_cache(maxsize=64)
+def _cumulative_rank_labels(n: int, language: str) -> tuple:
+    """1~n행의 누적 순위 라벨 ("1순위", "1+2순위", … / "1st", "1st+2nd", …).
+
+    직전 라벨에 다음 순위를 이어 붙여 한 번에 만든다.
+    """
+    labels = []
+    prefix = ""
+    for i in range(1, n + 1):
+        part = str(i) if language == "ko" else _ORDINALS.get(i, f"{i}th")
+        prefix = f"{prefix}+{part}" if prefix else part
+        labels.append(f"{prefix}순위" if language == "ko" else prefix)
+    return tuple(labels)
 
 
 def _is_topn_type(qtype: str) -> bool:
     if not qtype:
         return False
-    return bool(re.match(r'(?i)(top|rank)\s*\d+', qtype))
+    return bool(_TOPN_RE.match(qtype))
 
 
 def _is_matrix_type(qtype: str) -> bool:
     if not qtype:
         return False
-    return bool(re.match(r'(?i)\d+\s*pt\s*x\s*\d+', qtype))
+    return bool(_MATRIX_RE.match(qtype))
 
 
 def _apply_suffixes(base_title: str, qtype: str, summary_types: list,
                     table_numbers: list, language: str) -> list:
-    row_count = len(table_numbers)
-    results = []
-
-    if row_count == 1:
+    if len(table_numbers) == 1:
         return [{"table_number": table_numbers[0], "suffix": "", "final_title": base_title}]
 
+    # SummaryType이 없으면 TopN은 누적 순위, 그 외는 행 번호
     if _is_topn_type(qtype):
-        for i, (tn, st) in enumerate(zip(table_numbers, summary_types)):
-            if st:
-                suffix = f" - {st}"
-            else:
-                suffix = f" - {_ordinal_cumulative(i + 1, language)}"
-            results.append({"table_number": tn, "suffix": suffix, "final_title": f"{base_title}{suffix}"})
-        return results
+        ranks = _cumulative_rank_labels(len(summary_types), language)
+        suffixes = [
+            f" - {st}" if st else f" - {rank}"
+            for st, rank in zip(summary_types, ranks)
+        ]
+    else:
+        suffixes = [
+            f" - {st}" if st else f" - ({i})"
+            for i, st in enumerate(summary_types, 1)
+        ]
+    return [
+        {"table_number": tn, "suffix": suffix, "final_title": f"{base_title}{suffix}"}
+        for tn, suffix in zip(table_numbers, suffixes)
+    ]
 
-    for i, (tn, st) in enumerate(zip(table_numbers, summary_types)):
-        if st:
-            suffix = f" - {st}"
-        else:
-            suffix = f" - ({i + 1})"
-        results.append({"table_number": tn, "suffix": suffix, "final_title": f"{base_title}{suffix}"})
-    return results
+
+def _title_result(group: dict, info: dict, language: str) -> dict:
+    base_title = info["title"]
+    return {
+        "question_number": group["qn"], "base_title": base_title, "reasoning": info["reasoning"],
+        "qtype": group["qtype"],
+        "rows": _apply_suffixes(base_title, group["qtype"], group["summary_types"],
+                                group["table_numbers"], language),
+        "is_split": group["row_count"] > 1, "row_count": group["row_count"],
+        "error": not base_title,
+    }
 
 
 def _expand_results_to_rows(base_titles: dict, groups: list, language: str) -> list:
-    all_results = []
-    for g in groups:
-        qn = g["qn"]
-        info = base_titles.get(qn, {"title": "", "reasoning": ""})
-        base_title = info["title"]
-        reasoning = info["reasoning"]
-        error = not bool(base_title)
-        rows = _apply_suffixes(base_title, g["qtype"], g["summary_types"], g["table_numbers"], language)
-        all_results.append({
-            "question_number": qn, "base_title": base_title, "reasoning": reasoning,
-            "qtype": g["qtype"], "rows": rows, "is_split": g["row_count"] > 1,
-            "row_count": g["row_count"], "error": error,
-        })
-    return all_results
+    empty = {"title": "", "reasoning": ""}
+    return [_title_result(g, base_titles.get(g["qn"], empty), language) for g in groups]
 
 
 def _run_title_generation(df: pd.DataFrame, language: str, progress_callback,
-                          survey_context: str = "") -> list:
+                          survey_context: str = "", refresh: bool = False) -> list:
     groups = _group_rows_by_question(df)
     if not groups:
         return []
@@ -276,25 +297,50 @@ def _run_title_generation(df: pd.DataFrame, language: str, progress_callback,
     system_prompt = _SYSTEM_PROMPT_KO if language == "ko" else _SYSTEM_PROMPT_EN
     batches = [groups[i:i + BATCH_SIZE] for i in range(0, len(groups), BATCH_SIZE)]
     total_batches = len(batches)
-    all_base_titles = {}
 
-    for batch_idx, batch in enumerate(batches):
+    def _process_batch(batch_idx: int, batch: list) -> dict:
         progress_callback("batch_start", {
             "batch_index": batch_idx, "total_batches": total_batches,
             "question_count": len(batch),
         })
         user_prompt = _build_batch_prompt(batch, survey_context)
         try:
-            raw = call_llm_json(system_prompt, user_prompt, MODEL_TITLE_GENERATOR)
+            raw = call_llm_json_cached(system_prompt, user_prompt, MODEL_TITLE_GENERATOR,
+                                       refresh=refresh)
             parsed = _parse_batch_result(raw, batch)
         except Exception as e:
             logger.error(f"Title batch {batch_idx} failed: {e}")
             parsed = {item["qn"]: {"title": "", "reasoning": f"Error: {e}"} for item in batch}
-        all_base_titles.update(parsed)
         progress_callback("batch_done", {
             "batch_index": batch_idx, "total_batches": total_batches,
             "generated_count": sum(1 for v in parsed.values() if v["title"]),
         })
+        return parsed
+
+    if total_batches == 1 or MAX_CONCURRENT_BATCHES <= 1:
+        batch_titles = [_process_batch(i, b) for i, b in enumerate(batches)]
+    else:
+        # 배치 LLM 호출을 동시 실행 — 병합은 배치 순서대로 (중복 문항번호 시 기존과 동일한 우선순위)
+        batch_titles = [None] * total_batches
+        ctx = get_script_run_ctx(suppress_warning=True)
+
+        def _init_worker():
+            """ThreadPoolExecutor worker initializer: propagate Streamlit context."""
+            if ctx:
+                add_script_run_ctx(threading.current_thread(), ctx)
+
+        workers = min(MAX_CONCURRENT_BATCHES, total_batches)
+        with ThreadPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(_process_batch, i, b): i
+                for i, b in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                batch_titles[futures[future]] = future.result()
+
+    all_base_titles = {}
+    for parsed in batch_titles:
+        all_base_titles.update(parsed)
 
     return _expand_results_to_rows(all_base_titles, groups, language)
 
@@ -313,13 +359,17 @@ def _apply_results_to_df(results: list):
 
     if "TableTitle" not in df.columns:
         df["TableTitle"] = ""
-    for idx, row in df.iterrows():
-        tn = str(row.get("TableNumber", "")).strip()
-        qn = str(row.get("QuestionNumber", "")).strip()
-        if tn and tn in tn_to_title:
-            df.at[idx, "TableTitle"] = tn_to_title[tn]
-        elif qn and qn in qn_to_title:
-            df.at[idx, "TableTitle"] = qn_to_title[qn]
+    # TableNumber 매칭 우선, 없으면 QuestionNumber 매칭 (빈 키는 매칭하지 않음)
+    tn_to_title.pop("", None)
+    qn_to_title.pop("", None)
+    tn_series = _stripped_column(df, "TableNumber")
+    qn_series = _stripped_column(df, "QuestionNumber")
+    tn_hit = tn_series.isin(list(tn_to_title))
+    qn_hit = ~tn_hit & qn_series.isin(list(qn_to_title))
+    if tn_hit.any():
+        df.loc[tn_hit, "TableTitle"] = tn_series[tn_hit].map(tn_to_title)
+    if qn_hit.any():
+        df.loc[qn_hit, "TableTitle"] = qn_series[qn_hit].map(qn_to_title)
     st.session_state["edited_df"] = df
 
     if "survey_document" in st.session_state and st.session_state["survey_document"]:
@@ -353,10 +403,10 @@ def _sync_field_to_df_and_doc(field_map: dict, df_col: str, doc_attr: str):
         df = st.session_state["edited_df"]
         if df_col not in df.columns:
             df[df_col] = ""
-        for idx, row in df.iterrows():
-            qn = str(row.get("QuestionNumber", "")).strip()
-            if qn in field_map:
-                df.at[idx, df_col] = field_map[qn]
+        qn_series = _stripped_column(df, "QuestionNumber")
+        hit = qn_series.isin(list(field_map))
+        if hit.any():
+            df.loc[hit, df_col] = qn_series[hit].map(field_map)
         st.session_state["edited_df"] = df
 
     if "survey_document" in st.session_state and st.session_state["survey_document"]:
@@ -374,25 +424,32 @@ def _compute_completeness():
              "special_instructions": 0}
 
     if doc and doc.questions:
-        seen = set()
-        unique_qs = []
+        # 문항번호별 첫 문항만 1회 순회하며 모든 카운터 누적
+        unique_qs = {}
         for q in doc.questions:
-            if q.question_number not in seen:
-                seen.add(q.question_number)
-                unique_qs.append(q)
-        stats["total"] = len(unique_qs)
-        stats["titles"] = sum(1 for q in unique_qs if q.table_title)
-        stats["nets"] = sum(1 for q in unique_qs if q.net_recode)
-        stats["banners"] = len(doc.banners)
-        stats["banner_assigned"] = sum(1 for q in unique_qs if q.banner_ids)
-        stats["sorts"] = sum(1 for q in unique_qs if q.sort_order)
-        stats["special_instructions"] = sum(1 for q in unique_qs if q.special_instructions)
+            unique_qs.setdefault(q.question_number, q)
+        titles = nets = banner_assigned = sorts = special = 0
+        for q in unique_qs.values():
+            if q.table_title:
+                titles += 1
+            if q.net_recode:
+                nets += 1
+            if q.banner_ids:
+                banner_assigned += 1
+            if q.sort_order:
+                sorts += 1
+            if q.special_instructions:
+                special += 1
+        stats.update(
+            total=len(unique_qs), titles=titles, nets=nets, banners=len(doc.banners),
+            banner_assigned=banner_assigned, sorts=sorts, special_instructions=special,
+        )
     elif df is not None and not df.empty:
         stats["total"] = df["QuestionNumber"].nunique()
         for col, key in [("TableTitle", "titles"), ("NetRecode", "nets")]:
             if col in df.columns:
-                filled = df[df[col].astype(str).str.strip() != ""]
-                stats[key] = filled["QuestionNumber"].nunique()
+                filled = df[col].astype(str).str.strip() != ""
+                stats[key] = df.loc[filled, "QuestionNumber"].nunique()
 
     return stats
 
@@ -512,6 +569,12 @@ def _tab_table_titles(df: pd.DataFrame, language: str):
     )
 
     generate_clicked = st.button("Generate Titles", type="primary", key="generate_titles_btn")
+    force_refresh = st.checkbox(
+        "Force refresh",
+        value=False,
+        help="Ignore cached LLM responses and regenerate every batch.",
+        key="title_force_refresh",
+    )
 
     if generate_clicked:
         with st.status("Generating titles...", expanded=True) as status:
@@ -538,7 +601,7 @@ def _tab_table_titles(df: pd.DataFrame, language: str):
             questions = _get_questions()
             survey_ctx = _get_survey_context(df=df)
             results = _run_title_generation(df, language, _progress_callback,
-                                            survey_context=survey_ctx)
+                                            survey_context=survey_ctx, refresh=force_refresh)
             st.session_state["title_results"] = results
             _apply_results_to_df(results)
             generated_count = sum(1 for r in results if not r["error"])
@@ -649,7 +712,7 @@ def _tab_net_recode(df: pd.DataFrame, language: str):
 
                 if bn_filter == "Scale Only":
                     qtype_upper = (q.question_type or "").upper()
-                    if "SCALE" not in qtype_upper and not re.match(r'\d+\s*PT\s*X\s*\d+', qtype_upper):
+                    if "SCALE" not in qtype_upper and not _is_matrix_type(qtype_upper):
                         continue
                 if bn_filter == "Custom Net" and not q.net_recode:
                     continue
@@ -738,8 +801,6 @@ def _tab_sort_details(df: pd.DataFrame, language: str):
     with btn_col3:
         si_clicked = st.button("Generate Special Inst.", key="gen_si_btn")
 
-    survey_ctx = _get_survey_context(df=df)
-
     if sort_clicked:
         with st.spinner("Generating sort orders..."):
             sort_map = generate_sort_orders(questions)
@@ -750,7 +811,7 @@ def _tab_sort_details(df: pd.DataFrame, language: str):
     if sub_clicked:
         with st.spinner("Generating sub-banners..."):
             sub_map = suggest_sub_banners(questions, language,
-                                           survey_context=survey_ctx)
+                                           survey_context=_get_survey_context(df=df))
             _sync_field_to_df_and_doc(sub_map, "SubBanner", "sub_banner")
             st.session_state["subbanner_generated"] = True
             st.rerun()
@@ -758,7 +819,7 @@ def _tab_sort_details(df: pd.DataFrame, language: str):
     if si_clicked:
         with st.spinner("Generating special instructions..."):
             si_map = generate_special_instructions(questions, language,
-                                                    survey_context=survey_ctx)
+                                                    survey_context=_get_survey_context(df=df))
             _sync_field_to_df_and_doc(si_map, "SpecialInstructions", "special_instructions")
             st.session_state["si_generated"] = True
             st.rerun()
@@ -1419,10 +1480,9 @@ def _tab_review_export(df: pd.DataFrame, language: str):
             )
 
         with dl_col3:
-            session_bytes = doc.to_json_bytes()
             st.download_button(
                 label="Download Session (JSON)",
-                data=session_bytes,
+                data=doc.to_json_bytes(),
                 file_name=f"{project_name}_session.json",
                 mime="application/json",
             )
@@ -251,7 +251,7 @@ Q6_3: 1st+2nd+3rd</pre>
                 <li>Questionnaire Analyzer 페이지에서 <b>'Extract Questions with AI'</b> 버튼을 클릭합니다.</li>
                 <li>AI가 자동으로 문항을 추출합니다. 진행률이 표시되며, 완료 후 결과가 Tree View와 Spreadsheet 탭에 나타납니다.</li>
                 <li>CSV 또는 <b>Excel(.xlsx)</b> 형식으로 다운로드할 수 있습니다.</li>
-                <li><b>Save Session</b>으로 추출 결과를 JSON 파일로 저장하면 다음에 재추출 없이 불러올 수 있습니다.</li>
+                <li><b>Save Session</b>으로 추출 결과를 JSON 파일(100문항 초과 시 .msgpack)로 저장하면 다음에 재추출 없이 불러올 수 있습니다.</li>
             </ol>
         </div>
         """, unsafe_allow_html=True)
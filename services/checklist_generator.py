@@ -7,7 +7,9 @@
 import json
 import logging
 import re
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Callable, Dict, List, Optional
 
 from models.survey import SurveyQuestion
@@ -86,19 +88,26 @@ class ChecklistResult:
     language: str
     total_questions_analyzed: int
 
+    @cached_property
+    def _category_counts(self) -> Dict[str, int]:
+        seen = Counter(item.category for item in self.items)
+        return {cat: seen.get(cat, 0) for cat in CATEGORIES}
+
+    @cached_property
+    def _priority_counts(self) -> Dict[str, int]:
+        seen = Counter(item.priority for item in self.items)
+        return {p: seen.get(p, 0) for p in PRIORITIES}
+
+    @cached_property
+    def present_categories(self) -> List[str]:
+        """항목이 1개 이상 존재하는 카테고리 (CATEGORIES 순서 유지)."""
+        return [cat for cat, count in self._category_counts.items() if count]
+
     def count_by_category(self) -> Dict[str, int]:
-        counts = {cat: 0 for cat in CATEGORIES}
-        for item in self.items:
-            if item.category in counts:
-                counts[item.category] += 1
-        return counts
+        return dict(self._category_counts)
 
     def count_by_priority(self) -> Dict[str, int]:
-        counts = {p: 0 for p in PRIORITIES}
-        for item in self.items:
-            if item.priority in counts:
-                counts[item.priority] += 1
-        return counts
+        return dict(self._priority_counts)
 
     def filter_by_priority(self, priorities: List[str]) -> List[ChecklistItem]:
         return [i for i in self.items if i.priority in priorities]
@@ -4,7 +4,7 @@
 """
 
 import re
-from typing import List
+from typing import Iterable, List
 from services.docx_parser import DocxSection, DocxParagraph, DocxTable
 from services.docx_renderer import render_sections_to_annotated_text, render_section
 from services.llm_extractor import _is_valid_question_number
@@ -17,14 +17,7 @@ MAX_CHUNK_CHARS = 200000
 
 def _estimate_section_size(section: DocxSection) -> int:
     """섹션의 대략적인 문자 수를 추정"""
-    size = len(section.heading or "")
-    for item in section.content:
-        if isinstance(item, DocxParagraph):
-            size += len(item.text) + 10  # 서식 어노테이션 오버헤드
-        elif isinstance(item, DocxTable):
-            for row in item.rows:
-                size += sum(len(cell) for cell in row) + len(row) * 3  # 구분자
-    return size
+    return len(section.heading or "") + sum(map(_estimate_item_size, section.content))
 
 
 # 문항 시작 패턴 (bold paragraph 또는 대괄호 헤더 등)
@@ -39,6 +32,9 @@ _QUESTION_START_RE = re.compile(
 
 _BRACKET_HEADER_RE = re.compile(r'^\[([A-Za-z]+\d+)')
 
+# 문항번호 추출 (구분자 조건 없이 선두 번호만 캡처 — _QUESTION_START_RE 통과 후 검증용)
+_QN_CAPTURE_RE = re.compile(r'(?:\*\*)?([A-Za-z]+[a-z]*\d+[a-z]?(?:-\d+)*|[A-Za-z]+\d+[A-Za-z])')
+
 
 def _is_question_start(item) -> bool:
     """content 아이템이 문항 시작점인지 판별"""
@@ -51,7 +47,7 @@ def _is_question_start(item) -> bool:
     # 문항번호 패턴 + 유효성 검증 (RegionCode, SegCode 등 변수명 제외)
     m = _QUESTION_START_RE.match(text)
     if m:
-        qn = re.match(r'(?:\*\*)?([A-Za-z]+[a-z]*\d+[a-z]?(?:-\d+)*|[A-Za-z]+\d+[A-Za-z])', text)
+        qn = _QN_CAPTURE_RE.match(text)
         if qn and _is_valid_question_number(qn.group(1)):
             return True
     # 대괄호 헤더형 [SC2. ...]
@@ -64,12 +60,10 @@ def _is_question_start(item) -> bool:
 def _estimate_item_size(item) -> int:
     """개별 content 아이템의 대략적인 문자 수"""
     if isinstance(item, DocxParagraph):
-        return len(item.text) + 10
+        return len(item.text) + 10  # 서식 어노테이션 오버헤드
     elif isinstance(item, DocxTable):
-        size = 0
-        for row in item.rows:
-            size += sum(len(cell) for cell in row) + len(row) * 3
-        return size
+        # 셀 문자 수 + 셀당 구분자 3자
+        return sum(sum(map(len, row)) + len(row) * 3 for row in item.rows)
     return 0
 
 
@@ -119,10 +113,7 @@ def _is_text_question_start(line: str) -> bool:
     # 문항번호 패턴 A/B: Q1. / Q2 [S] 등
     m = _QUESTION_START_RE.match(stripped)
     if m:
-        qn = re.match(
-            r'(?:\*\*)?([A-Za-z]+[a-z]*\d+[a-z]?(?:-\d+)*|[A-Za-z]+\d+[A-Za-z])',
-            stripped,
-        )
+        qn = _QN_CAPTURE_RE.match(stripped)
         if qn and _is_valid_question_number(qn.group(1)):
             return True
 
@@ -134,51 +125,54 @@ def _is_text_question_start(line: str) -> bool:
     return False
 
 
-def chunk_text(pages: List[str], max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+def chunk_text(pages: Iterable[str], max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
     """PDF 페이지 텍스트를 LLM 컨텍스트에 맞는 청크로 분할.
 
-    페이지별 텍스트를 결합 후, 줄 단위로 문항 시작 패턴을 탐지하여
-    문항 경계에서 분할합니다.
+    페이지를 순서대로 한 번만 순회하며 줄 단위로 문항 시작 패턴을 탐지하여
+    문항 경계에서 분할합니다. 전체 텍스트를 미리 결합하지 않으므로
+    제너레이터(iter_pdf_pages)를 그대로 넘길 수 있습니다.
 
     Args:
-        pages: read_pdf()에서 반환된 페이지별 텍스트 리스트
+        pages: 페이지별 텍스트 iterable (read_pdf() 리스트 또는 iter_pdf_pages())
         max_chars: 최대 청크 크기 (문자 수)
 
     Returns:
         텍스트 청크 리스트
     """
-    if not pages:
-        return []
-
-    full_text = "\n".join(pages)
-    lines = full_text.split("\n")
-
-    # 전체 텍스트가 max_chars 이하이면 단일 청크 반환
-    if len(full_text) <= max_chars:
-        return [full_text]
-
     chunks: List[str] = []
     current_lines: List[str] = []
     current_size = 0
+    total_size = 0  # 모든 줄의 (길이 + 1) 합 = 결합 텍스트 길이 + 1
+    has_pages = False
+
+    for page in pages:
+        has_pages = True
+        for line in page.split("\n"):
+            line_size = len(line) + 1  # +1 for newline
+            total_size += line_size
+
+            # 문항 시작점이고, 현재 누적이 max_chars를 초과할 경우 분할
+            if (current_size + line_size > max_chars
+                    and current_lines
+                    and _is_text_question_start(line)):
+                chunks.append("\n".join(current_lines))
+                current_lines = []
+                current_size = 0
 
-    for line in lines:
-        line_size = len(line) + 1  # +1 for newline
-
-        # 문항 시작점이고, 현재 누적이 max_chars를 초과할 경우 분할
-        if (_is_text_question_start(line)
-                and current_size + line_size > max_chars
-                and current_lines):
-            chunks.append("\n".join(current_lines))
-            current_lines = []
-            current_size = 0
+            current_lines.append(line)
+            current_size += line_size
 
-        current_lines.append(line)
-        current_size += line_size
+    if not has_pages:
+        return []
 
     # 남은 줄
     if current_lines:
         chunks.append("\n".join(current_lines))
 
+    # 전체 텍스트가 max_chars 이하이면 단일 청크 (경계값에서 분할된 경우 재결합)
+    if total_size - 1 <= max_chars and len(chunks) > 1:
+        return ["\n".join(chunks)]
+
     return chunks
 
 
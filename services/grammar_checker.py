@@ -5,16 +5,21 @@ UI 렌더링은 포함하지 않으며 pages/quality_checker.py에서 호출한
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable, Optional
 
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from services.llm_client import call_llm_json, MODEL_GRAMMAR_CHECKER
+from services.llm_cache import call_llm_json_cached
+from services.llm_client import MODEL_GRAMMAR_CHECKER
 
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 20
+MAX_CONCURRENT_BATCHES = 3  # 동시 LLM 배치 호출 수 (1이면 순차 실행)
 
 # ── 시스템 프롬프트 ────────────────────────────────────────────────
 
@@ -183,9 +188,13 @@ def _parse_batch_result(raw: dict, batch: list) -> list:
 
 # ── 메인 처리 ─────────────────────────────────────────────────────
 
-def check_grammar(df: pd.DataFrame, language: str, progress_callback: Optional[Callable] = None) -> list:
+def check_grammar(df: pd.DataFrame, language: str, progress_callback: Optional[Callable] = None,
+                  refresh: bool = False) -> list:
     """DataFrame에서 문항을 추출하여 배치 문법 검사를 수행.
 
+    같은 배치 프롬프트의 LLM 응답은 디스크 캐시(services/llm_cache)에서 재사용하며,
+    refresh=True면 캐시를 건너뛰고 새로 호출한다.
+
     Returns:
         List[dict] — 문항별 교정 결과
     """
@@ -211,9 +220,8 @@ def check_grammar(df: pd.DataFrame, language: str, progress_callback: Optional[C
     # 배치 분할
     batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
     total_batches = len(batches)
-    all_results = []
 
-    for batch_idx, batch in enumerate(batches):
+    def _process_batch(batch_idx: int, batch: list) -> list:
         if progress_callback:
             progress_callback("batch_start", {
                 "batch_index": batch_idx,
@@ -223,7 +231,8 @@ def check_grammar(df: pd.DataFrame, language: str, progress_callback: Optional[C
 
         user_prompt = _build_batch_prompt(batch)
         try:
-            raw = call_llm_json(system_prompt, user_prompt, MODEL_GRAMMAR_CHECKER)
+            raw = call_llm_json_cached(system_prompt, user_prompt, MODEL_GRAMMAR_CHECKER,
+                                       refresh=refresh)
             results = _parse_batch_result(raw, batch)
         except Exception as e:
             logger.error(f"Grammar batch {batch_idx} failed: {e}")
@@ -238,16 +247,36 @@ def check_grammar(df: pd.DataFrame, language: str, progress_callback: Optional[C
                 "changes_summary": f"Error: {e}",
             } for item in batch]
 
-        all_results.extend(results)
-
         if progress_callback:
             progress_callback("batch_done", {
                 "batch_index": batch_idx,
                 "total_batches": total_batches,
                 "changed_count": sum(1 for r in results if r["has_changes"]),
             })
-
-    return all_results
+        return results
+
+    if total_batches == 1 or MAX_CONCURRENT_BATCHES <= 1:
+        batch_results = [_process_batch(i, b) for i, b in enumerate(batches)]
+    else:
+        # 배치 LLM 호출을 동시 실행 — 결과는 배치 순서대로 모음
+        batch_results = [None] * total_batches
+        ctx = get_script_run_ctx()
+
+        def _init_worker():
+            """ThreadPoolExecutor worker initializer: propagate Streamlit context."""
+            if ctx:
+                add_script_run_ctx(threading.current_thread(), ctx)
+
+        workers = min(MAX_CONCURRENT_BATCHES, total_batches)
+        with ThreadPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(_process_batch, i, b): i
+                for i, b in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                batch_results[futures[future]] = future.result()
+
+    return [r for results in batch_results for r in results]
 
 
 def apply_grammar_results(results: list):
@@ -0,0 +1,240 @@
+"""LLM 결과 디스크 캐시.
+
+- 문항 추출(extract_survey_questions): 동일한 문서(청크 텍스트) + 모델 + 시스템
+  프롬프트 조합이면 LLM 호출 없이 이전 추출 결과를 즉시 반환한다. 결과는 세션
+  JSON과 같은 형식(SurveyQuestion.to_json_dict)으로 저장한다.
+- 배치 JSON 응답(call_llm_json): 문법 교정·Table Title 배치처럼 같은 프롬프트를
+  반복 전송하는 호출의 원본 JSON 응답을 저장한다.
+
+캐시 키는 모두 내용 해시(blake2b)이다.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Callable, List, Optional, Tuple
+
+from models.survey import SurveyQuestion, _dumps_json, _loads_json
+from services.llm_client import call_llm_json
+from services.llm_extractor import SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# 캐시 디렉토리 (환경변수로 변경 가능)
+CACHE_DIR = os.getenv(
+    "SURVEYSTREAM_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "surveystream"),
+)
+
+# 저장 형식/추출 로직이 바뀌면 올려서 기존 캐시를 무효화
+_CACHE_VERSION = "1"
+
+# 디렉토리별 최대 캐시 파일 수 — 초과 시 가장 오래 쓰이지 않은 파일부터 삭제
+MAX_CACHE_ENTRIES = int(os.getenv("SURVEYSTREAM_CACHE_MAX_ENTRIES", "500"))
+
+
+def extraction_cache_key(chunks: List[str], model: str) -> str:
+    """청크 텍스트 + 모델 + 시스템 프롬프트 기반 캐시 키 (blake2b hex)."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in (_CACHE_VERSION, model, SYSTEM_PROMPT):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    for chunk in chunks:
+        h.update(chunk.encode("utf-8"))
+        h.update(b"||")
+    return h.hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """임시 파일 → rename으로 원자적 교체 (상위 디렉토리 자동 생성).
+
+    임시 파일명은 mkstemp로 매번 고유하게 만들어, 같은 키를 동시에 쓰는
+    스레드/세션끼리 서로의 임시 파일을 덮어쓰지 않는다.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):  # replace 전 실패 시 임시 파일 정리
+            os.remove(tmp_path)
+
+
+def _touch(path: str) -> None:
+    """캐시 적중 시 mtime 갱신 (정리 시 최근 사용 파일 보존)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _prune_cache_dir(directory: str, max_entries: Optional[int] = None) -> None:
+    """디렉토리의 *.json 캐시 파일이 max_entries를 넘으면 mtime이 오래된 것부터 삭제."""
+    if max_entries is None:
+        max_entries = MAX_CACHE_ENTRIES
+    try:
+        entries = [e for e in os.scandir(directory)
+                   if e.is_file() and e.name.endswith(".json")]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Cache prune failed ({entry.name}): {e}")
+
+
+def load_cached_questions(key: str) -> Optional[List[SurveyQuestion]]:
+    """캐시된 문항 리스트 반환. 없거나 읽기 실패 시 None."""
+    path = _cache_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            data = _loads_json(f.read())
+        _touch(path)
+        return [SurveyQuestion.from_json_dict(q) for q in data.get("questions", [])]
+    except (OSError, ValueError) as e:
+        logger.warning(f"Extraction cache read failed ({key}): {e}")
+        return None
+
+
+def store_cached_questions(key: str, questions: List[SurveyQuestion]) -> None:
+    """문항 리스트를 캐시에 저장 (임시 파일 → rename으로 원자적 교체)."""
+    try:
+        _write_atomic(
+            _cache_path(key),
+            _dumps_json({"questions": [q.to_json_dict() for q in questions]}),
+        )
+    except OSError as e:
+        logger.warning(f"Extraction cache write failed ({key}): {e}")
+        return
+    _prune_cache_dir(CACHE_DIR)
+
+
+def get_or_compute(
+    chunks: List[str],
+    model: str,
+    fn: Callable[[], Tuple[List[SurveyQuestion], bool]],
+    refresh: bool = False,
+) -> Tuple[List[SurveyQuestion], bool]:
+    """캐시 조회 후 없으면 fn()으로 추출하고 저장.
+
+    Args:
+        chunks: LLM에 전달될 청크 텍스트 리스트 (캐시 키 구성)
+        model: 추출 모델명 (캐시 키 구성)
+        fn: 캐시 미스 시 실행할 추출 함수 → (문항 리스트, 모든 청크 성공 여부).
+            일부 청크가 실패한 결과는 저장하지 않는다 (일시 오류가 영구 캐시되지 않도록).
+        refresh: True면 캐시를 건너뛰고 새로 추출한 결과로 덮어씀
+
+    Returns:
+        (문항 리스트, 캐시 적중 여부)
+    """
+    key = extraction_cache_key(chunks, model)
+    if not refresh:
+        cached = load_cached_questions(key)
+        if cached:
+            logger.info(f"Extraction cache hit: {key} ({len(cached)} questions)")
+            return cached, True
+
+    questions, complete = fn()
+    if questions and complete:  # 빈 결과·부분 실패는 저장하지 않음
+        store_cached_questions(key, questions)
+    return questions, False
+
+
+# ---------------------------------------------------------------------------
+# 배치 JSON 응답 캐시
+# ---------------------------------------------------------------------------
+
+
+def response_cache_key(system_prompt: str, user_prompt: str, model: str) -> str:
+    """시스템 프롬프트 + 사용자 프롬프트 + 모델 기반 캐시 키 (blake2b hex)."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in (_CACHE_VERSION, model, system_prompt, user_prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _response_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, "responses", f"{key}.json")
+
+
+def get_or_compute_response(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    fn: Callable[[], dict],
+    refresh: bool = False,
+    validate: Optional[Callable[[dict], bool]] = None,
+) -> Tuple[dict, bool]:
+    """JSON 응답 캐시 조회 후 없으면 fn()으로 호출하고 저장.
+
+    Args:
+        system_prompt, user_prompt, model: 캐시 키 구성
+        fn: 캐시 미스 시 실행할 LLM 호출 (예외는 그대로 전파, 저장하지 않음)
+        refresh: True면 캐시를 건너뛰고 새로 호출한 결과로 덮어씀
+        validate: 응답 사용 가능 여부 검사. False인 응답은 저장하지 않고,
+            저장된 응답이 False면 캐시 미스로 취급 (None이면 검사 없음)
+
+    Returns:
+        (응답 dict, 캐시 적중 여부)
+    """
+    key = response_cache_key(system_prompt, user_prompt, model)
+    path = _response_path(key)
+    if not refresh and os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                raw = _loads_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Response cache read failed ({key}): {e}")
+        else:
+            if validate is None or validate(raw):
+                _touch(path)
+                return raw, True
+
+    raw = fn()
+    if validate is not None and not validate(raw):
+        # 사용할 수 없는 응답은 저장하지 않음 (다음 호출에서 재시도)
+        logger.warning(f"Response not cached, failed validation ({key})")
+        return raw, False
+    try:
+        _write_atomic(path, _dumps_json(raw))
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Response cache write failed ({key}): {e}")
+    else:
+        _prune_cache_dir(os.path.dirname(path))
+    return raw, False
+
+
+def has_results(raw) -> bool:
+    """배치 응답이 비어 있지 않은 "results" 리스트를 가진 dict인지."""
+    return isinstance(raw, dict) and isinstance(raw.get("results"), list) and bool(raw["results"])
+
+
+def call_llm_json_cached(system_prompt: str, user_prompt: str, model: str,
+                         refresh: bool = False,
+                         validate: Optional[Callable[[dict], bool]] = has_results) -> dict:
+    """디스크 캐시를 거치는 call_llm_json — 같은 프롬프트·모델이면 저장된 응답 반환.
+
+    validate(기본: has_results)를 통과한 응답만 저장한다.
+    """
+    raw, _ = get_or_compute_response(
+        system_prompt, user_prompt, model,
+        lambda: call_llm_json(system_prompt, user_prompt, model),
+        refresh=refresh,
+        validate=validate,
+    )
+    return raw
@@ -31,7 +31,11 @@ def _is_gemini(model: str) -> bool:
 
 
 def _get_openai_client() -> OpenAI:
-    """OpenAI 호환 클라이언트 싱글턴."""
+    """OpenAI 호환 클라이언트 싱글턴.
+
+    문항 추출(init_client 경유)과 call_llm/call_llm_json이 같은 인스턴스를
+    사용하므로 LiteLLM 프록시로의 keep-alive 커넥션 풀이 공유된다.
+    """
     global _openai_client
     if _openai_client is not None:
         return _openai_client
@@ -91,18 +95,15 @@ def init_gemini():
         st.stop()
 
 
+@st.cache_resource(show_spinner=False)
 def init_client():
-    """OpenAI 호환 클라이언트 초기화 (PDF 경로 등 레거시 용)"""
-    if not LITELLM_API_KEY:
-        st.error("LiteLLM API key (LITELLM_API_KEY) not found in .env file.")
-        st.stop()
+    """OpenAI 호환 클라이언트 초기화 (PDF 경로 등 레거시 용)
 
+    프로세스당 1회만 생성하고 이후 rerun에서는 캐시된 클라이언트를 재사용.
+    call_llm 계열과 동일한 싱글턴을 반환하여 커넥션 풀을 공유한다.
+    """
     try:
-        client = OpenAI(
-            api_key=LITELLM_API_KEY,
-            base_url=LITELLM_BASE_URL
-        )
-        return client
+        return _get_openai_client()
     except Exception as e:
         st.error(f"Failed to initialize OpenAI client: {e}")
         st.stop()
@@ -5,9 +5,14 @@ LLM이 단독 추출 엔진이며, 정규식은 문항 식별에 사용하지 
 - 정규식은 재청킹 밀도 추정용으로만 사용
 """
 
+import copy
+import hashlib
 import json
+import os
 import re
 import logging
+import threading
+import time
 from typing import List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from openai import OpenAI
@@ -19,6 +24,14 @@ def _is_gemini(model: str) -> bool:
 
 logger = logging.getLogger(__name__)
 
+# 청크 병렬 LLM 호출 최대 동시 수 (상위 tier 계정은 환경변수로 상향 가능)
+MAX_CONCURRENT_CHUNKS = max(1, int(os.getenv("SURVEYSTREAM_MAX_CONCURRENCY", "4")))
+
+# 429(rate limit) 대응: 청크당 재시도 횟수, 첫 대기(초, 지수 증가), 동시 수 +1 기준 연속 성공 수
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 2.0
+_AIMD_INCREASE_EVERY = 10
+
 
 # ──────────────────────────────────────────────────────────────────────
 # 정규식 사전 추출 (재청킹 밀도 추정용)
@@ -203,7 +216,7 @@ def regex_pre_extract(annotated_text: str) -> List[dict]:
     lines = annotated_text.split('\n')
 
     current_qn = None
-    current_text = ""
+    current_parts: List[str] = []  # 문항 텍스트 조각 (마지막에 " ".join)
     current_type = None
 
     for line in lines:
@@ -211,13 +224,14 @@ def regex_pre_extract(annotated_text: str) -> List[dict]:
         if matched:
             # 이전 문항 저장
             if current_qn:
-                cleaned, qtype = _extract_type_from_text(current_text)
+                cleaned, qtype = _extract_type_from_text(" ".join(current_parts))
                 results.append({
                     "question_number": current_qn,
                     "question_text": cleaned.strip(),
                     "question_type": current_type or qtype,
                 })
-            current_qn, current_text, current_type = matched
+            current_qn, first_text, current_type = matched
+            current_parts = [first_text]
         elif current_qn:
             # 문항 텍스트 이어붙이기 (목록 항목이나 빈 줄이 아닌 경우)
             stripped = line.strip()
@@ -226,11 +240,11 @@ def regex_pre_extract(annotated_text: str) -> List[dict]:
                 if stripped.startswith('#.') or stripped.startswith('- ') or stripped.startswith('  '):
                     pass
                 else:
-                    current_text += " " + stripped
+                    current_parts.append(stripped)
 
     # 마지막 문항
     if current_qn:
-        cleaned, qtype = _extract_type_from_text(current_text)
+        cleaned, qtype = _extract_type_from_text(" ".join(current_parts))
         results.append({
             "question_number": current_qn,
             "question_text": cleaned.strip(),
@@ -896,6 +910,73 @@ def _call_gemini(model: str, system_prompt: str,
     return raw_text, finish_reason
 
 
+def _is_rate_limited(e: Exception) -> bool:
+    """429/쿼터 초과 오류 여부 (OpenAI RateLimitError, Vertex ResourceExhausted)"""
+    if getattr(e, "status_code", None) == 429 or getattr(e, "code", None) == 429:
+        return True
+    return type(e).__name__ in ("RateLimitError", "ResourceExhausted", "TooManyRequests")
+
+
+class _AdaptiveLimiter:
+    """청크 LLM 호출 동시 수 제한 (AIMD).
+
+    429 발생 시 허용 동시 수를 절반으로 줄이고, 연속 성공
+    _AIMD_INCREASE_EVERY회마다 1씩 늘려 max_limit까지 회복한다.
+    """
+
+    def __init__(self, max_limit: int):
+        self._limit = max_limit
+        self._max_limit = max_limit
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._active -= 1
+            if throttled:
+                new_limit = max(1, self._limit // 2)
+                if new_limit != self._limit:
+                    logger.info(f"Rate limited: concurrency {self._limit} -> {new_limit}")
+                self._limit = new_limit
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= _AIMD_INCREASE_EVERY and self._limit < self._max_limit:
+                    self._limit += 1
+                    self._successes = 0
+                    logger.info(f"Concurrency raised to {self._limit}")
+            self._cond.notify_all()
+
+
+def _extract_throttled(limiter: _AdaptiveLimiter, extract) -> List[dict]:
+    """limiter 슬롯을 잡고 청크 추출 실행. 429면 지수 백오프 후 재시도.
+
+    재시도 횟수를 모두 소진하면 마지막 예외를 그대로 다시 발생시킨다.
+    """
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire()
+        try:
+            result = extract()
+        except Exception as e:
+            throttled = _is_rate_limited(e)
+            limiter.release(throttled=throttled)
+            if not throttled or attempt == _RATE_LIMIT_RETRIES:
+                raise
+            delay = _RATE_LIMIT_BACKOFF * (2 ** attempt)
+            logger.warning(f"Rate limited ({e}); retrying in {delay:.0f}s")
+            time.sleep(delay)
+            continue
+        limiter.release()
+        return result
+
+
 def extract_questions_from_chunk(
     client: Any,
     chunk_text: str,
@@ -943,6 +1024,8 @@ def extract_questions_from_chunk(
         return validated
 
     except Exception as e:
+        if _is_rate_limited(e):
+            raise  # 호출 측(_extract_throttled)에서 동시 수 축소 후 재시도
         logger.error(f"Chunk {chunk_index}: LLM call failed: {e}")
         return []
 
@@ -1048,11 +1131,26 @@ def _rechunk_by_question_count(chunks: List[str], pre_per_chunk: List[List[dict]
     return new_chunks, new_pre
 
 
+def _group_duplicate_chunks(chunks: List[str]) -> dict:
+    """텍스트가 동일한 청크를 묶음.
+
+    Returns:
+        {대표 청크 인덱스: [대표 포함 동일 텍스트 청크 인덱스 리스트]} (삽입 순서 = 청크 순서)
+    """
+    groups: dict = {}
+    first_of: dict = {}
+    for i, chunk in enumerate(chunks):
+        key = hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).digest()
+        groups.setdefault(first_of.setdefault(key, i), []).append(i)
+    return groups
+
+
 def extract_survey_questions(
     client: OpenAI,
     chunks: List[str],
     model: str = "gemini-2.5-pro",
     progress_callback=None,
+    failed_chunks: Optional[List[int]] = None,
 ) -> List[SurveyQuestion]:
     """LLM 전면 추출 파이프라인.
 
@@ -1067,6 +1165,10 @@ def extract_survey_questions(
         model: 사용할 모델명
         progress_callback: (event, data) 콜백.
             Events: "regex_done", "rechunk", "chunk_start", "chunk_done", "merge_done"
+            "chunk_done"의 data["questions"]는 해당 청크의 검증된 문항 dict 리스트
+            (병합 전, 부분 결과 미리보기용)
+        failed_chunks: 전달 시 추출에 실패한 청크 인덱스를 추가 (실패 청크는 빈
+            결과로 병합되므로, 호출측이 부분 결과를 캐시하지 않도록 판단하는 용도)
 
     Returns:
         SurveyQuestion 리스트
@@ -1116,13 +1218,20 @@ def extract_survey_questions(
             "chunk_index": 0, "total_chunks": 1,
             "regex_hints": len(pre_extracted_per_chunk[0]),
         })
-        result = extract_questions_from_chunk(
-            client, chunks[0], 0, 1, model, pre_extracted_per_chunk[0],
-            chunk_context=chunk_contexts[0],
-        )
+        try:
+            result = _extract_throttled(_AdaptiveLimiter(1), lambda: extract_questions_from_chunk(
+                client, chunks[0], 0, 1, model, pre_extracted_per_chunk[0],
+                chunk_context=chunk_contexts[0],
+            ))
+        except Exception as e:
+            result = []
+            logger.error(f"Chunk 0 extraction failed: {e}")
+            if failed_chunks is not None:
+                failed_chunks.append(0)
         _notify("chunk_done", {
             "chunk_index": 0, "total_chunks": 1,
             "questions_extracted": len(result),
+            "questions": result,
         })
         chunk_results = [result]
     else:
@@ -1135,15 +1244,23 @@ def extract_survey_questions(
                 "regex_hints": len(pre_extracted_per_chunk[i]),
             })
 
+        # 동일 텍스트 청크(반복 안내문/인구통계 블록 등)는 LLM을 한 번만 호출
+        duplicates = _group_duplicate_chunks(chunks)
+        if len(duplicates) < total_chunks:
+            logger.info(f"Skipping {total_chunks - len(duplicates)} duplicate chunk(s)")
+
+        # 풀 크기는 상한, 실제 동시 호출 수는 limiter가 429에 맞춰 조절
+        limiter = _AdaptiveLimiter(MAX_CONCURRENT_CHUNKS)
+
         def _extract(idx):
-            return idx, extract_questions_from_chunk(
+            return idx, _extract_throttled(limiter, lambda: extract_questions_from_chunk(
                 client, chunks[idx], idx, total_chunks, model,
                 pre_extracted_per_chunk[idx],
                 chunk_context=chunk_contexts[idx],
-            )
+            ))
 
-        with ThreadPoolExecutor(max_workers=min(total_chunks, 4)) as executor:
-            futures = {executor.submit(_extract, i): i for i in range(total_chunks)}
+        with ThreadPoolExecutor(max_workers=min(len(duplicates), MAX_CONCURRENT_CHUNKS)) as executor:
+            futures = {executor.submit(_extract, i): i for i in duplicates}
             for future in as_completed(futures):
                 try:
                     idx, result = future.result()
@@ -1151,11 +1268,17 @@ def extract_survey_questions(
                     idx = futures[future]
                     result = []
                     logger.error(f"Chunk {idx} extraction failed: {e}")
-                chunk_results[idx] = result
-                _notify("chunk_done", {
-                    "chunk_index": idx, "total_chunks": total_chunks,
-                    "questions_extracted": len(result),
-                })
+                    if failed_chunks is not None:
+                        failed_chunks.extend(duplicates[idx])
+                for j in duplicates[idx]:
+                    # 병합 단계가 dict를 in-place로 수정하므로 복제본은 깊은 복사
+                    chunk_result = result if j == idx else copy.deepcopy(result)
+                    chunk_results[j] = chunk_result
+                    _notify("chunk_done", {
+                        "chunk_index": j, "total_chunks": total_chunks,
+                        "questions_extracted": len(chunk_result),
+                        "questions": chunk_result,
+                    })
 
     # 3단계: 병합
     merged = merge_chunk_results(chunk_results)
@@ -0,0 +1,62 @@
+"""업로드 파일 파싱 결과 캐시.
+
+같은 파일로 'Extract Questions with AI'를 다시 누를 때(Study Brief 수정,
+LLM 실패 후 재시도 등) PDF/DOCX 파싱을 건너뛰도록 파일 내용의 SHA-256을
+키로 st.cache_data에 보관합니다.
+"""
+
+import hashlib
+from typing import List, Tuple
+
+import streamlit as st
+
+from services.chunker import chunk_text
+from services.docx_parser import DocxSection, parse_docx
+from services.pdf_parser import iter_pdf_pages
+
+_PARSE_CACHE_ENTRIES = 4
+_PARSE_CACHE_TTL = 1800  # 초
+
+
+def _file_digest(file) -> str:
+    """업로드 파일 내용의 SHA-256 (버퍼 복사 없이 해시)"""
+    with file.getbuffer() as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=_PARSE_CACHE_ENTRIES, ttl=_PARSE_CACHE_TTL)
+def _pdf_chunks(digest: str, _file) -> Tuple[List[str], int, int]:
+    _file.seek(0)
+    page_stats = [0, 0]  # [pages, chars]
+
+    def _counted(pages):
+        for text in pages:
+            page_stats[0] += 1
+            page_stats[1] += len(text)
+            yield text
+
+    chunks = chunk_text(_counted(iter_pdf_pages(_file)))
+    _file.seek(0)
+    return chunks, page_stats[0], page_stats[1]
+
+
+@st.cache_data(show_spinner=False, max_entries=_PARSE_CACHE_ENTRIES, ttl=_PARSE_CACHE_TTL)
+def _docx_sections(digest: str, _file) -> List[DocxSection]:
+    _file.seek(0)
+    sections = parse_docx(_file)
+    _file.seek(0)
+    return sections
+
+
+def load_pdf_chunks(file) -> Tuple[List[str], int, int]:
+    """PDF를 페이지 스트리밍으로 파싱·청킹 (내용 해시 기준 캐시).
+
+    Returns:
+        (텍스트 청크 리스트, 페이지 수, 문자 수)
+    """
+    return _pdf_chunks(_file_digest(file), file)
+
+
+def load_docx_sections(file) -> List[DocxSection]:
+    """DOCX를 섹션 단위로 파싱 (내용 해시 기준 캐시)"""
+    return _docx_sections(_file_digest(file), file)
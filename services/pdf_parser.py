@@ -1,14 +1,19 @@
+from typing import Iterator
+
 import fitz  # PyMuPDF
 from docx import Document
 
 
-def read_pdf(file):
-    """PDF 파일에서 텍스트를 추출"""
+def iter_pdf_pages(file) -> Iterator[str]:
+    """PDF 페이지 텍스트를 한 페이지씩 생성 (전체 리스트를 만들지 않음)"""
     with fitz.open(stream=file.read(), filetype="pdf") as doc:
-        texts = []
         for page in doc:
-            texts.append(page.get_text("text"))
-        return texts
+            yield page.get_text("text")
+
+
+def read_pdf(file):
+    """PDF 파일에서 텍스트를 추출"""
+    return list(iter_pdf_pages(file))
 
 
 def read_docx_without_strikethrough(file):
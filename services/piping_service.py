@@ -54,6 +54,7 @@ class PipingAnalysisResult:
     issues: List[PipingIssue] = field(default_factory=list)
     filter_chains: List[FilterChain] = field(default_factory=list)
     bottleneck_questions: List[Tuple[str, int]] = field(default_factory=list)
+    failed_batches: List[int] = field(default_factory=list)  # 실패한 암묵적 파이핑 LLM 배치
 
 
 # ---------------------------------------------------------------------------
@@ -255,8 +256,12 @@ def detect_implicit_piping(
     questions: List[SurveyQuestion],
     model: str = DEFAULT_MODEL,
     progress_callback: Optional[Callable] = None,
+    failed_batches: Optional[List[int]] = None,
 ) -> List[PipingRef]:
-    """LLM을 사용하여 암묵적 파이핑 참조를 탐지."""
+    """LLM을 사용하여 암묵적 파이핑 참조를 탐지.
+
+    failed_batches를 전달하면 LLM 호출에 실패한 배치 번호를 추가한다.
+    """
     if not questions:
         return []
 
@@ -310,6 +315,8 @@ def detect_implicit_piping(
                     ))
         except Exception as e:
             logger.warning(f"Implicit piping batch {batch_num} failed: {e}")
+            if failed_batches is not None:
+                failed_batches.append(batch_num)
 
         if progress_callback:
             progress_callback("batch_done", {
@@ -568,6 +575,19 @@ def generate_piping_dot(
 # ---------------------------------------------------------------------------
 
 
+def piping_fingerprint(questions: List[SurveyQuestion]) -> tuple:
+    """analyze_piping이 읽는 필드만으로 구성한 문항 지문.
+
+    UI에서 입력이 같으면 분석 결과를 rerun 간 재사용할 때 비교 키로 쓴다.
+    """
+    return tuple(
+        (q.question_number, q.question_type, q.question_text, q.filter_condition,
+         q.instructions, q.special_instructions,
+         tuple((o.code, o.label) for o in q.answer_options))
+        for q in questions
+    )
+
+
 def analyze_piping(
     questions: List[SurveyQuestion],
     model: str = DEFAULT_MODEL,
@@ -588,11 +608,13 @@ def analyze_piping(
 
     # 암묵적 파이핑 (선택)
     implicit_refs: List[PipingRef] = []
+    failed_batches: List[int] = []
     if include_implicit:
         if progress_callback:
             progress_callback("phase", {"name": "implicit_piping", "status": "start"})
         implicit_refs = detect_implicit_piping(questions, model=model,
-                                                progress_callback=progress_callback)
+                                                progress_callback=progress_callback,
+                                                failed_batches=failed_batches)
         if progress_callback:
             progress_callback("phase", {"name": "implicit_piping", "status": "done",
                                          "count": len(implicit_refs)})
@@ -619,4 +641,5 @@ def analyze_piping(
         issues=issues,
         filter_chains=chains,
         bottleneck_questions=bottlenecks,
+        failed_batches=failed_batches,
     )
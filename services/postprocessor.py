@@ -1,12 +1,17 @@
 import re
+from collections import Counter
 from typing import List, Tuple, Optional
 
 from services.llm_extractor import _is_valid_question_number
 
 
+# 대괄호/소괄호 안의 문항 유형 후보: [SA], (MA) 등
+_TYPE_BRACKET_RE = re.compile(r'(\[\s*(.*?)\s*\]|\(\s*(.*?)\s*\))')
+
+
 def extract_question_type(text, question_type_keywords1, question_type_keywords2):
     """문항 텍스트에서 괄호 안의 문항 유형을 추출"""
-    pattern = re.compile(r'(\[\s*(.*?)\s*\]|\(\s*(.*?)\s*\))')
+    pattern = _TYPE_BRACKET_RE
     cleaned_text = text
     question_type = None
     for match in pattern.finditer(text):
@@ -123,6 +128,12 @@ _STANDARD_MAP = {
 }
 
 
+# QuestionType 패턴 (SummaryType 매핑용)
+_GRID_SCALE_RE = re.compile(r'^(\d+)pt\s*x\s*\d+$', re.IGNORECASE)  # "Npt x M"
+_SCALE_RE = re.compile(r'^(\d+)pt$', re.IGNORECASE)                 # "Npt"
+_TOP_RANK_RE = re.compile(r'^(Top|Rank)\s*\d+$', re.IGNORECASE)     # "TopN" / "RankN"
+
+
 def scale_summary_type(n: int) -> str:
     """척도 점수(N)에 따른 SummaryType 결정."""
     return _SCALE_MAP.get(n, '%/Top2/Bot2/Mean')
@@ -137,10 +148,7 @@ def apply_postprocessing(survey_doc) -> None:
         questions 리스트를 in-place로 수정한다.
     """
     # ── TableNumber 할당 ──
-    qn_count: dict = {}
-    for q in survey_doc.questions:
-        qn = q.question_number
-        qn_count[qn] = qn_count.get(qn, 0) + 1
+    qn_count = Counter(q.question_number for q in survey_doc.questions)
 
     qn_current: dict = {}
     for q in survey_doc.questions:
@@ -160,19 +168,19 @@ def apply_postprocessing(survey_doc) -> None:
         qtype = q.question_type
 
         # "Npt x M" (grid scale)
-        m = re.match(r'^(\d+)pt\s*x\s*\d+$', qtype, re.IGNORECASE)
+        m = _GRID_SCALE_RE.match(qtype)
         if m:
             q.summary_type = scale_summary_type(int(m.group(1)))
             continue
 
         # "Npt" (simple scale)
-        m = re.match(r'^(\d+)pt$', qtype, re.IGNORECASE)
+        m = _SCALE_RE.match(qtype)
         if m:
             q.summary_type = scale_summary_type(int(m.group(1)))
             continue
 
         # "TopN" / "RankN"
-        if re.match(r'^(Top|Rank)\s*\d+$', qtype, re.IGNORECASE):
+        if _TOP_RANK_RE.match(qtype):
             q.summary_type = '%'
             continue
 
@@ -197,6 +197,18 @@ def build_skip_logic_graph(questions: List[SurveyQuestion]) -> SkipLogicGraph:
     )
 
 
+def skip_graph_fingerprint(questions: List[SurveyQuestion]) -> tuple:
+    """build_skip_logic_graph가 읽는 필드만으로 구성한 문항 지문.
+
+    UI에서 그래프/경로 시뮬레이션 결과를 rerun 간 재사용할 때 비교 키로 쓴다.
+    """
+    return tuple(
+        (q.question_number, q.question_type, q.question_text, q.filter_condition,
+         tuple((sl.condition, sl.target) for sl in q.skip_logic))
+        for q in questions
+    )
+
+
 # ---------------------------------------------------------------------------
 # DOT 생성
 # ---------------------------------------------------------------------------
@@ -233,53 +245,52 @@ def generate_dot(
         view_mode: ``"skip_only"`` (스킵 관련 문항만) 또는 ``"full_flow"`` (전체).
         orientation: ``"TB"`` (위→아래) 또는 ``"LR"`` (왼→오른).
     """
-    lines: List[str] = []
-    lines.append(f'digraph SkipLogic {{')
-    lines.append(f'  rankdir={orientation};')
-    lines.append('  node [shape=box, style="filled,rounded", fontsize=10, fontname="Arial"];')
-    lines.append('  edge [fontsize=8, fontname="Arial"];')
-    lines.append('')
-
     # 뷰 모드에 따라 표시할 노드/엣지 필터링
     if view_mode == "skip_only":
         # 스킵/필터 엣지에 관련된 노드만
-        relevant_nodes: set = set()
-        relevant_edges: List[GraphEdge] = []
-        for e in graph.edges:
-            if e.edge_type in ("skip", "filter"):
-                relevant_nodes.add(e.source)
-                relevant_nodes.add(e.target)
-                relevant_edges.append(e)
+        relevant_edges = [e for e in graph.edges if e.edge_type in ("skip", "filter")]
+        relevant_nodes = {e.source for e in relevant_edges}
+        relevant_nodes.update(e.target for e in relevant_edges)
     else:
         relevant_nodes = set(graph.nodes)
         relevant_edges = graph.edges
 
-    # 노드 생성
-    for node in graph.nodes:
-        if node not in relevant_nodes:
-            continue
-        qtype = graph.node_types.get(node, "Unknown")
-        color = _NODE_COLORS.get(qtype, _NODE_COLORS["Unknown"])
-        label = f"{node}\\n{qtype}"
-        lines.append(f'  "{node}" [label="{label}", fillcolor="{color}"];')
-
-    lines.append('')
-
-    # 엣지 생성
-    for e in relevant_edges:
-        style_info = _EDGE_STYLES.get(e.edge_type, _EDGE_STYLES["sequential"])
-        attrs = [
-            f'color="{style_info["color"]}"',
-            f'style="{style_info["style"]}"',
-            f'penwidth={style_info["penwidth"]}',
-        ]
-        if e.label:
-            escaped_label = e.label.replace('"', '\\"')
-            attrs.append(f'label="{escaped_label}"')
-        lines.append(f'  "{e.source}" -> "{e.target}" [{", ".join(attrs)}];')
-
-    lines.append('}')
-    return '\n'.join(lines)
+    # 노드/엣지 라인을 한 번에 구성 후 단일 join
+    node_lines = [
+        _dot_node_line(node, graph.node_types.get(node, "Unknown"))
+        for node in graph.nodes
+        if node in relevant_nodes
+    ]
+    edge_lines = [_dot_edge_line(e) for e in relevant_edges]
+    return '\n'.join([
+        'digraph SkipLogic {',
+        f'  rankdir={orientation};',
+        '  node [shape=box, style="filled,rounded", fontsize=10, fontname="Arial"];',
+        '  edge [fontsize=8, fontname="Arial"];',
+        '',
+        *node_lines,
+        '',
+        *edge_lines,
+        '}',
+    ])
+
+
+def _dot_node_line(node: str, qtype: str) -> str:
+    color = _NODE_COLORS.get(qtype, _NODE_COLORS["Unknown"])
+    return f'  "{node}" [label="{node}\\n{qtype}", fillcolor="{color}"];'
+
+
+def _dot_edge_line(e: GraphEdge) -> str:
+    style_info = _EDGE_STYLES.get(e.edge_type, _EDGE_STYLES["sequential"])
+    attrs = (
+        f'color="{style_info["color"]}", '
+        f'style="{style_info["style"]}", '
+        f'penwidth={style_info["penwidth"]}'
+    )
+    if e.label:
+        escaped_label = e.label.replace('"', '\\"')
+        attrs += f', label="{escaped_label}"'
+    return f'  "{e.source}" -> "{e.target}" [{attrs}];'
 
 
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ Phase 3: Banner Management + Sort + SubBanner
 Phase 4: Special Instructions + Full Compile + Export
 """
 
+import hashlib
 import io
 import json as _json
 import logging
@@ -480,26 +481,9 @@ If the user has specified a Client Brand or Study Objective, use these as author
 }"""
 
 
-def analyze_survey_intelligence(questions: List[SurveyQuestion],
-                                language: str = "ko",
-                                client_brand: str = "",
-                                study_objective: str = "") -> dict:
-    """설문지 전체를 분석하여 구조화된 Survey Intelligence를 반환.
-
-    단일 LLM 호출로 클라이언트, 조사유형, 목적, 프레임워크, 세그먼트를 추출.
-
-    Args:
-        questions: 전체 문항 리스트
-        language: 설문지 언어
-        client_brand: 사용자가 입력한 클라이언트 브랜드명 (e.g. "Hyundai")
-        study_objective: 사용자가 입력한 조사 목적
-
-    Returns:
-        dict: intelligence 결과 (client_name, study_type, research_objectives, ...)
-    """
-    if not questions:
-        return {}
-
+def _build_intelligence_prompt(questions: List[SurveyQuestion], language: str,
+                               client_brand: str, study_objective: str) -> str:
+    """Survey Intelligence 분석용 user prompt (문항 요약) 생성."""
     # 중복 문항번호 제거
     seen = set()
     unique_qs = []
@@ -531,7 +515,46 @@ def analyze_survey_intelligence(questions: List[SurveyQuestion],
             line += filt
         lines.append(line)
 
-    user_prompt = "\n".join(lines)
+    return "\n".join(lines)
+
+
+def intelligence_fingerprint(questions: List[SurveyQuestion],
+                             language: str = "ko",
+                             client_brand: str = "",
+                             study_objective: str = "") -> str:
+    """analyze_survey_intelligence 입력(모델 + 프롬프트)의 해시.
+
+    값이 같으면 LLM 결과를 재사용해도 되는 것으로 간주한다.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (MODEL_INTELLIGENCE, _INTELLIGENCE_SYSTEM_PROMPT,
+                 _build_intelligence_prompt(questions, language, client_brand, study_objective)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def analyze_survey_intelligence(questions: List[SurveyQuestion],
+                                language: str = "ko",
+                                client_brand: str = "",
+                                study_objective: str = "") -> dict:
+    """설문지 전체를 분석하여 구조화된 Survey Intelligence를 반환.
+
+    단일 LLM 호출로 클라이언트, 조사유형, 목적, 프레임워크, 세그먼트를 추출.
+
+    Args:
+        questions: 전체 문항 리스트
+        language: 설문지 언어
+        client_brand: 사용자가 입력한 클라이언트 브랜드명 (e.g. "Hyundai")
+        study_objective: 사용자가 입력한 조사 목적
+
+    Returns:
+        dict: intelligence 결과 (client_name, study_type, research_objectives, ...)
+    """
+    if not questions:
+        return {}
+
+    user_prompt = _build_intelligence_prompt(questions, language, client_brand, study_objective)
 
     try:
         result = call_llm_json(_INTELLIGENCE_SYSTEM_PROMPT, user_prompt,
@@ -107,6 +107,15 @@ def test_chunk_text_large_document():
     print(f"  [PASS] Large document split into {len(result)} chunks")
 
 
+def test_chunk_text_generator_input():
+    """페이지 제너레이터 입력도 리스트 입력과 동일한 결과"""
+    pages = [f"Q{i}. Question {i}?\n1. Yes\n2. No" for i in range(1, 21)]
+    for max_chars in (50, 120, len("\n".join(pages)), 200000):
+        assert chunk_text(iter(pages), max_chars=max_chars) == chunk_text(pages, max_chars=max_chars)
+    assert chunk_text(iter([])) == []
+    print("  [PASS] Generator input matches list input")
+
+
 if __name__ == "__main__":
     print("Running chunk_text() smoke tests...")
     test_is_text_question_start()
@@ -116,4 +125,5 @@ if __name__ == "__main__":
     test_chunk_text_no_split_within_question()
     test_chunk_text_multiple_pages()
     test_chunk_text_large_document()
+    test_chunk_text_generator_input()
     print("\nAll chunk_text tests passed!")
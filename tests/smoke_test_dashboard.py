@@ -3,11 +3,16 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from collections import Counter
+
 from models.survey import SurveyQuestion, SurveyDocument, SkipLogic, AnswerOption
 from pages.intelligence_dashboard import (
     _estimate_loi_quick,
     _skip_complexity,
     _normalize_type,
+    _role_sections,
+    _summary_stats,
+    _compute_dashboard_stats,
 )
 
 # ── 테스트 데이터 ──
@@ -56,4 +61,34 @@ assert _normalize_type("") == "Unknown"
 assert _normalize_type(None) == "Unknown"
 assert _normalize_type("TopN") == "TopN"
 
+# ── 단일 순회 요약 통계 = 개별 함수 결과 ──
+type_counter, stats_loi, skip_count = _summary_stats(questions)
+assert stats_loi == _estimate_loi_quick(questions)
+assert skip_count == 1
+assert type_counter == Counter(_normalize_type(q.question_type) for q in questions)
+
+# ── 연속 role 섹션 그룹핑 (role 없는 문항은 건너뜀) ──
+role_qs = [
+    SurveyQuestion(question_number=f"R{i}", question_text="", question_type="SA", role=role)
+    for i, role in enumerate(["screening", "screening", "", "screening", "core", "screening"])
+]
+assert _role_sections(role_qs) == (("screening", 3), ("core", 1), ("screening", 1))
+assert _role_sections(questions) == ()
+
+# ── 대시보드 집계 묶음 ──
+stats = _compute_dashboard_stats(role_qs)
+assert stats.sections == _role_sections(role_qs)
+assert stats.role_counter == {"screening": 4, "core": 1}  # 빈 role 제외
+assert not stats.vt_counter
+assert stats.type_counter == {"SA": 6}
+
+# analytical_value가 None인 문항이 있어도 집계 가능
+value_qs = [
+    SurveyQuestion(question_number=f"V{i}", question_text="", question_type="SA")
+    for i in range(3)
+]
+value_qs[0].analytical_value = "high"
+value_qs[1].analytical_value = None
+assert _compute_dashboard_stats(value_qs).high_value == 1
+
 print("All dashboard smoke tests passed!")
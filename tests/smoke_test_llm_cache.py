@@ -0,0 +1,144 @@
+"""문항 추출 디스크 캐시(services/llm_cache) 테스트."""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.survey import AnswerOption, SurveyQuestion
+from services import llm_cache
+
+_ORIGINAL_CACHE_DIR = llm_cache.CACHE_DIR
+
+
+def test_get_or_compute_roundtrip():
+    """첫 호출은 추출 실행·저장, 두 번째 호출은 캐시 적중 (추출 미실행)"""
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return [SurveyQuestion(
+            question_number="Q1", question_text="성별", question_type="SA",
+            answer_options=[AnswerOption("1", "남성")],
+        )], True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_cache.CACHE_DIR = tmp
+        first, hit1 = llm_cache.get_or_compute(["chunk A"], "model-x", extract)
+        second, hit2 = llm_cache.get_or_compute(["chunk A"], "model-x", extract)
+        _, hit3 = llm_cache.get_or_compute(["chunk A"], "model-y", extract)
+        _, hit4 = llm_cache.get_or_compute(["chunk A"], "model-x", extract, refresh=True)
+
+    llm_cache.CACHE_DIR = _ORIGINAL_CACHE_DIR
+    assert (hit1, hit2, hit3, hit4) == (False, True, False, False)
+    assert len(calls) == 3
+    assert second == first
+    print("  [PASS] Extraction cache round-trip")
+
+
+def test_empty_result_not_cached():
+    """빈 추출 결과는 저장하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_cache.CACHE_DIR = tmp
+        llm_cache.get_or_compute(["chunk B"], "model-x", lambda: ([], True))
+        assert os.listdir(tmp) == []
+    llm_cache.CACHE_DIR = _ORIGINAL_CACHE_DIR
+    print("  [PASS] Empty result not cached")
+
+
+def test_partial_result_not_cached():
+    """일부 청크 실패(complete=False) 결과는 저장하지 않아 다음 호출에서 재추출"""
+    partial = [SurveyQuestion(question_number="Q1", question_text="성별", question_type="SA")]
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_cache.CACHE_DIR = tmp
+        llm_cache.get_or_compute(["chunk C"], "model-x", lambda: (partial, False))
+        assert os.listdir(tmp) == []
+        _, hit = llm_cache.get_or_compute(["chunk C"], "model-x", lambda: (partial, True))
+        assert not hit and len(os.listdir(tmp)) == 1
+    llm_cache.CACHE_DIR = _ORIGINAL_CACHE_DIR
+    print("  [PASS] Partial result not cached")
+
+
+def test_prune_cache_dir():
+    """최대 개수 초과 시 mtime이 오래된 캐시 파일부터 삭제"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(5):
+            path = os.path.join(tmp, f"{i}.json")
+            with open(path, "w") as f:
+                f.write("{}")
+            os.utime(path, (i, i))
+        llm_cache._prune_cache_dir(tmp, max_entries=3)
+        assert sorted(os.listdir(tmp)) == ["2.json", "3.json", "4.json"]
+    print("  [PASS] Cache directory pruned")
+
+
+def test_response_cache_refresh():
+    """JSON 응답 캐시: 같은 프롬프트는 적중, 프롬프트가 다르거나 refresh면 재호출"""
+    calls = []
+
+    def call():
+        calls.append(1)
+        return {"results": [{"question_number": "Q1", "title": f"제목 {len(calls)}"}]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_cache.CACHE_DIR = tmp
+        first, hit1 = llm_cache.get_or_compute_response("sys", "user", "model-x", call)
+        second, hit2 = llm_cache.get_or_compute_response("sys", "user", "model-x", call)
+        _, hit3 = llm_cache.get_or_compute_response("sys", "user 2", "model-x", call)
+        refreshed, hit4 = llm_cache.get_or_compute_response("sys", "user", "model-x", call, refresh=True)
+        after, hit5 = llm_cache.get_or_compute_response("sys", "user", "model-x", call)
+
+    llm_cache.CACHE_DIR = _ORIGINAL_CACHE_DIR
+    assert (hit1, hit2, hit3, hit4, hit5) == (False, True, False, False, True)
+    assert second == first
+    assert after == refreshed != first  # refresh 결과로 덮어씀
+    print("  [PASS] Response cache refresh")
+
+
+def test_invalid_response_not_cached():
+    """validate에 실패한 응답(리스트, 빈 results)은 저장하지 않고 다음 호출에서 재시도"""
+    replies = [[{"question_number": "Q1"}], {"results": []}, {"results": [{"question_number": "Q1"}]}]
+    calls = []
+
+    def call():
+        calls.append(1)
+        return replies[len(calls) - 1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_cache.CACHE_DIR = tmp
+        hits = [
+            llm_cache.get_or_compute_response("sys", "user", "model-x", call,
+                                              validate=llm_cache.has_results)[1]
+            for _ in range(4)
+        ]
+    llm_cache.CACHE_DIR = _ORIGINAL_CACHE_DIR
+    assert hits == [False, False, False, True]
+    assert len(calls) == 3
+    print("  [PASS] Invalid response not cached")
+
+
+def test_write_atomic_concurrent():
+    """같은 경로 동시 쓰기: 한쪽 내용만 온전히 남고 임시 파일은 남지 않음"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    payloads = [bytes([i]) * 200_000 for i in range(8)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "key.json")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: llm_cache._write_atomic(path, data), payloads))
+        with open(path, "rb") as f:
+            assert f.read() in payloads
+        assert os.listdir(tmp) == ["key.json"]
+    print("  [PASS] Concurrent atomic writes")
+
+
+if __name__ == "__main__":
+    print("=== Extraction cache tests ===")
+    test_get_or_compute_roundtrip()
+    test_empty_result_not_cached()
+    test_partial_result_not_cached()
+    test_prune_cache_dir()
+    test_response_cache_refresh()
+    test_invalid_response_not_cached()
+    test_write_atomic_concurrent()
+    print("\nAll tests passed!")
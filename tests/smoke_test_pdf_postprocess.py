@@ -46,4 +46,14 @@ restored = SurveyDocument.from_json_dict(json.loads(doc.to_json_bytes()))
 assert restored.questions[2].summary_type == doc.questions[2].summary_type
 assert restored.questions[3].table_number == doc.questions[3].table_number
 
+# 후처리는 table_number/summary_type만 수정 — Phase 5 enrichment와 동시 실행하는 전제
+fresh = [SurveyQuestion(question_number=qn, question_text=t, question_type=qt)
+         for qn, t, qt in mock]
+before = [q.to_json_dict() for q in fresh]
+apply_postprocessing(SurveyDocument(filename="test.pdf", questions=fresh))
+for b, q in zip(before, fresh):
+    after = q.to_json_dict()
+    changed = {k for k in after if after[k] != b[k]}
+    assert changed <= {"table_number", "summary_type"}, f"unexpected fields changed: {changed}"
+
 print("All postprocessing smoke tests passed!")
@@ -0,0 +1,133 @@
+"""SurveyDocument 세션 직렬화(Save/Load Session) 왕복 테스트."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.survey import (
+    MSGPACK_AVAILABLE, AnswerOption, Banner, BannerPoint, SkipLogic, SurveyDocument,
+    SurveyQuestion,
+)
+
+
+def _make_doc() -> SurveyDocument:
+    return SurveyDocument(
+        filename="sample.docx",
+        questions=[
+            SurveyQuestion(
+                question_number="SQ1", question_text="성별은 무엇입니까?", question_type="SA",
+                answer_options=[AnswerOption("1", "남성"), AnswerOption("2", "여성")],
+                skip_logic=[SkipLogic(condition="SQ1=2", target="END")],
+                filter_condition="All", table_number="1", summary_type="Top2",
+            ),
+            SurveyQuestion(question_number="Q1", question_text="Brands used", question_type="MA"),
+        ],
+        banners=[
+            Banner(banner_id="A", name="Gender", points=[
+                BannerPoint(point_id="BP_1", label="Male", source_question="SQ1",
+                            condition="SQ1=1", codes=["1"], code_labels=["Male"]),
+            ]),
+        ],
+        client_brand="Brand",
+        research_objectives=["Awareness"],
+        survey_intelligence={"study_type": "U&A", "key_segments": [{"name": "Gender"}]},
+    )
+
+
+def test_json_bytes_roundtrip():
+    """to_json_bytes → from_json_bytes 무손실 복원"""
+    doc = _make_doc()
+    data = doc.to_json_bytes()
+    assert isinstance(data, bytes)
+    assert "성별".encode("utf-8") in data  # 비ASCII 문자 이스케이프 없이 저장
+
+    restored = SurveyDocument.from_json_bytes(data)
+    assert restored == doc
+    print("  [PASS] JSON bytes round-trip")
+
+
+def test_from_memoryview():
+    """업로드 버퍼(memoryview)에서 직접 복원"""
+    import io
+    doc = _make_doc()
+    buf = io.BytesIO(doc.to_json_bytes())
+    with buf.getbuffer() as view:
+        restored = SurveyDocument.from_json_bytes(view)
+    assert restored == doc
+    print("  [PASS] memoryview decode")
+
+
+def test_msgpack_roundtrip():
+    """to_msgpack_bytes → from_msgpack_bytes 무손실 복원 (ormsgpack 설치 시)"""
+    if not MSGPACK_AVAILABLE:
+        print("  [SKIP] ormsgpack not installed")
+        return
+    doc = _make_doc()
+    data = doc.to_msgpack_bytes()
+    assert len(data) < len(doc.to_json_bytes())
+    assert SurveyDocument.from_msgpack_bytes(data) == doc
+    print("  [PASS] MessagePack round-trip")
+
+
+def test_lenient_decode():
+    """구버전/부분 손상 세션도 복원 — 누락 필드는 기본값, 잘못된 항목은 건너뜀"""
+    data = {
+        "filename": "legacy.pdf",
+        "questions": [{
+            "question_number": "Q1",
+            "question_text": "Text",
+            "answer_options": [{"code": 1, "label": "Yes"}, {"code": "2"}, "bad"],
+            "skip_logic": [{"condition": "Q1=1"}, {"target": "Q9"}],
+        }],
+    }
+    doc = SurveyDocument.from_json_dict(data)
+    q = doc.questions[0]
+    assert q.answer_options == [AnswerOption("1", "Yes")]
+    assert q.skip_logic == [SkipLogic("Q1=1", "")]
+    assert q.summary_type == "" and q.section == ""
+    assert doc.banners == [] and doc.survey_intelligence == {}
+    print("  [PASS] Lenient decode of legacy session")
+
+
+def test_empty_document():
+    """문항 없는 문서도 복원 가능"""
+    doc = SurveyDocument(filename="empty.pdf")
+    restored = SurveyDocument.from_json_bytes(doc.to_json_bytes())
+    assert restored.filename == "empty.pdf"
+    assert restored.questions == []
+    print("  [PASS] Empty document round-trip")
+
+
+def test_to_dataframe_matches_to_dict():
+    """to_dataframe 컬럼/값이 SurveyQuestion.to_dict와 일치"""
+    doc = _make_doc()
+    df = doc.to_dataframe()
+    expected = [q.to_dict() for q in doc.questions]
+    assert list(df.columns) == list(expected[0].keys())
+    assert df.to_dict(orient="records") == expected
+    assert df.loc[0, "AnswerOptions"] == "1. 남성 | 2. 여성"
+    assert df.loc[0, "SkipLogic"] == "SQ1=2 -> END"
+    assert df.loc[1, "Filter"] == ""  # None → ""
+
+    subset = doc.to_dataframe(columns=["QuestionText", "QuestionNumber", "Unknown"])
+    assert list(subset.columns) == ["QuestionText", "QuestionNumber"]
+    assert subset.equals(df[["QuestionText", "QuestionNumber"]])
+    assert list(SurveyDocument(filename="e.pdf").to_dataframe(columns=["Filter"]).columns) == ["Filter"]
+
+    empty_df = SurveyDocument(filename="empty.pdf").to_dataframe()
+    assert empty_df.empty
+    assert list(empty_df.columns) == list(df.columns)
+    empty_df["Extra"] = []  # 반환된 빈 프레임을 수정해도 다음 호출에 영향 없음
+    assert "Extra" not in SurveyDocument(filename="empty.pdf").to_dataframe().columns
+    print("  [PASS] to_dataframe columns")
+
+
+if __name__ == "__main__":
+    print("=== Session serialization tests ===")
+    test_json_bytes_roundtrip()
+    test_from_memoryview()
+    test_msgpack_roundtrip()
+    test_lenient_decode()
+    test_empty_document()
+    test_to_dataframe_matches_to_dict()
+    print("\nAll tests passed!")
@@ -0,0 +1,40 @@
+"""Table Guide 행 그룹화(pages/table_guide) 테스트."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from pages.table_guide import _group_rows_by_question, _stripped_column
+
+
+def test_stripped_column_missing_values():
+    """결측(None/NaN)은 "None"/"nan" 문자열이 아닌 빈 문자열로"""
+    df = pd.DataFrame({"QuestionNumber": [" Q1 ", None, np.nan, "Q2"]})
+    assert _stripped_column(df, "QuestionNumber").tolist() == ["Q1", "", "", "Q2"]
+    assert _stripped_column(df, "Missing").tolist() == ["", "", "", ""]
+    print("  [PASS] Missing values stripped to empty string")
+
+
+def test_group_rows_skips_missing_question_numbers():
+    """QuestionNumber가 결측인 행은 그룹에서 제외, 결측 SummaryType은 빈 문자열"""
+    df = pd.DataFrame({
+        "QuestionNumber": ["Q1", None, "Q1", np.nan, "Q2"],
+        "QuestionText": ["성별", "", "성별", "", "연령"],
+        "SummaryType": ["Top2", "x", None, "y", np.nan],
+    })
+    groups = _group_rows_by_question(df)
+    assert [g["qn"] for g in groups] == ["Q1", "Q2"]
+    assert groups[0]["summary_types"] == ["Top2", ""]
+    assert groups[0]["row_count"] == 2
+    assert groups[1]["summary_types"] == [""]
+    print("  [PASS] Rows without question number skipped")
+
+
+if __name__ == "__main__":
+    print("=== Table guide tests ===")
+    test_stripped_column_missing_values()
+    test_group_rows_skips_missing_question_numbers()
+    print("\nAll tests passed!")
@@ -5,6 +5,11 @@ from openpyxl import Workbook
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
+try:
+    import xlsxwriter  # 설치 시 constant_memory 모드로 행 단위 스트리밍 저장
+except ImportError:
+    xlsxwriter = None
+
 
 def df_for_download(processed_df):
     """다운로드용 DataFrame 준비 (컬럼 순서 정리 및 빈 컬럼 추가)"""
@@ -26,6 +31,54 @@ def df_for_download(processed_df):
     return processed_df.reindex(columns=all_columns)
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def df_to_excel_bytes(df: pd.DataFrame, sheet_name: str) -> bytes:
+    """단일 시트 DataFrame → xlsx 바이트 (서식 없음). 동일 DataFrame은 캐시 재사용.
+
+    xlsxwriter가 있으면 constant_memory 모드로 한 행씩 기록(행 단위 flush)하고,
+    없으면 openpyxl 기반 `DataFrame.to_excel`로 대체한다.
+    pandas의 to_excel은 열 순서로 셀을 쓰므로 constant_memory와 함께 쓸 수 없다.
+    """
+    buffer = io.BytesIO()
+    if xlsxwriter is None:
+        df.to_excel(buffer, index=False, sheet_name=sheet_name)
+        return buffer.getvalue()
+
+    values = df.astype(object).where(df.notna(), None)
+    workbook = xlsxwriter.Workbook(buffer, {"constant_memory": True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(c) for c in df.columns])
+    for r, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(r, 0, row)
+    workbook.close()
+    return buffer.getvalue()
+
+
+_XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def render_excel_export(df: pd.DataFrame, sheet_name: str, file_name: str,
+                        label: str, source, key: str) -> None:
+    """"Prepare Excel export" 클릭 시에만 xlsx를 만들어 세션에 보관하고 다운로드 버튼 표시.
+
+    보관한 바이트는 source(분석 결과 객체)와 함께 저장해, 결과가 바뀌면
+    이전 파일 대신 다시 준비 버튼을 보여준다.
+    """
+    state_key = f"_xlsx_{key}"
+    if st.button("Prepare Excel export", key=f"{key}_prepare"):
+        st.session_state[state_key] = (source, df_to_excel_bytes(df, sheet_name))
+
+    prepared = st.session_state.get(state_key)
+    if prepared is not None and prepared[0] is source:
+        st.download_button(
+            label=label,
+            data=prepared[1],
+            file_name=file_name,
+            mime=_XLSX_MIME,
+            key=f"{key}_download",
+        )
+
+
 def prepare_excel_download(survey_doc) -> bytes:
     """SurveyDocument를 서식이 적용된 Excel 파일로 변환.
 
@@ -0,0 +1,78 @@
+"""사이드바 네비게이션 메뉴 정의 및 페이지 핸들러 조회."""
+
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class NavEntry:
+    """사이드바 메뉴 항목 (라벨/아이콘/페이지 모듈/잠금 조건을 한 곳에 정의)"""
+    label: str
+    icon: Optional[str] = None        # None: 구분선("---")
+    module: str = ""                  # pages 하위 모듈명 (지연 import)
+    handler: str = ""                 # 페이지 렌더 함수명
+    requires: tuple = ()              # 이 세션 키 중 하나라도 있어야 잠금 해제 (빈 튜플: 항상 사용 가능)
+
+
+_SEPARATOR = NavEntry("---")
+_NEEDS_DOC = ('survey_document',)
+
+# 그룹 1: 문항 추출
+# 그룹 2: Table Guide (단독)
+# 그룹 3: 내용 검토 (Quality + Grammar 통합 → Length)
+# 그룹 4: 구조 분석 & 검수 (Skip Logic → Path Simulator → Checklist)
+NAV = (
+    NavEntry("Questionnaire Analyzer", 'bi bi-magic', "doc_analyzer", "page_document_processing"),
+    NavEntry("Intelligence Dashboard", 'bi bi-speedometer2', "intelligence_dashboard",
+             "page_intelligence_dashboard", _NEEDS_DOC),
+    _SEPARATOR,
+    NavEntry("Table Guide Builder", 'bi bi-table', "table_guide", "page_table_guide_builder",
+             ('edited_df',)),
+    _SEPARATOR,
+    # Quality Checker: Grammar 포함, 어느 한쪽이라도 있으면 탭 일부 사용 가능
+    NavEntry("Quality Checker", 'bi bi-shield-check', "quality_checker", "page_quality_checker",
+             ('survey_document', 'edited_df')),
+    NavEntry("Length Estimator", 'bi bi-stopwatch', "length_estimator", "page_length_estimator",
+             _NEEDS_DOC),
+    NavEntry("Translation Helper", 'bi bi-translate', "translation_helper", "page_translation_helper",
+             _NEEDS_DOC),
+    _SEPARATOR,
+    NavEntry("Skip Logic", 'bi bi-diagram-3', "skip_logic_visualizer", "page_skip_logic_visualizer",
+             _NEEDS_DOC),
+    NavEntry("Path Simulator", 'bi bi-signpost-split', "path_simulator", "page_path_simulator",
+             _NEEDS_DOC),
+    NavEntry("Checklist", 'bi bi-list-check', "checklist_generator", "page_checklist_generator",
+             _NEEDS_DOC),
+    NavEntry("Piping Intelligence", 'bi bi-arrow-left-right', "piping_intelligence",
+             "page_piping_intelligence", _NEEDS_DOC),
+)
+
+PAGES = [n.label for n in NAV]
+NAV_SESSION_KEYS = ('survey_document', 'edited_df')
+
+# 페이지명 → (pages 하위 모듈, 핸들러 함수). 선택된 페이지 모듈만 지연 import.
+_PAGE_MODULES = {n.label: (n.module, n.handler) for n in NAV if n.module}
+_PAGE_MODULES["User Guide"] = ("user_guide", "page_user_reference")
+
+
+@lru_cache(maxsize=8)
+def nav_icons(available: frozenset) -> tuple:
+    """세션에 존재하는 키 집합에 따른 네비게이션 아이콘 (잠금 페이지는 자물쇠)
+
+    app.py는 rerun마다 새 __main__으로 다시 실행되므로, 메모이제이션은 한 번만
+    import되는 이 모듈에 둔다.
+    """
+    return tuple(
+        n.icon if not n.requires or available.intersection(n.requires) else 'bi bi-lock'
+        for n in NAV
+    )
+
+
+@lru_cache(maxsize=None)
+def page_handler(page: str) -> Callable:
+    """페이지명에 해당하는 렌더 함수를 지연 import 후 반환"""
+    module_name, func_name = _PAGE_MODULES[page]
+    module = importlib.import_module(f"pages.{module_name}")
+    return getattr(module, func_name)
@@ -14,18 +14,17 @@ def render_spreadsheet_view(survey_doc: SurveyDocument) -> pd.DataFrame:
     Returns:
         편집된 DataFrame
     """
-    df = survey_doc.to_dataframe()
-
-    if df.empty:
-        st.info("No data to display.")
-        return df
-
-    # 표시할 컬럼 순서
+    # 표시할 컬럼 순서 (표시 컬럼만 생성)
     display_columns = [
         "QuestionNumber", "TableNumber", "QuestionText", "QuestionType",
         "AnswerOptions", "SkipLogic", "Filter",
         "Instructions", "SummaryType"
     ]
+    df = survey_doc.to_dataframe(columns=display_columns)
+
+    if df.empty:
+        st.info("No data to display.")
+        return df
 
     # 존재하는 컬럼만 표시
     display_columns = [c for c in display_columns if c in df.columns]